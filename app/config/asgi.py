@@ -0,0 +1,12 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+django_application = get_asgi_application()
+
+# Webhook POSTs are answered ahead of Django, on the event loop
+from core.api.asgi import WebhookApplication  # noqa: E402
+
+application = WebhookApplication(django_application)
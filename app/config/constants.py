@@ -13,10 +13,32 @@ from .timing import (
     API_TIMEOUT,
     API_RETRY_DELAY,
     MAX_API_RETRIES,
+    TOKEN_REFRESH_MARGIN,
+    LEDGER_CACHE_TTL,
+    PROCESSING_NOTICE_DELAY,
+    IDEMPOTENCY_TTL,
+    INBOUND_PROCESSING_TTL,
+    INBOUND_DEDUPE_TTL,
     FLOW_TIMEOUT,
     MAX_FLOW_RETRIES,
     RATE_LIMIT_WINDOW,
-    MAX_REQUESTS_PER_WINDOW
+    MAX_REQUESTS_PER_WINDOW,
+    OUTBOUND_SENDER_RATE,
+    OUTBOUND_SENDER_BURST,
+    OUTBOUND_RECIPIENT_BURST,
+    OUTBOUND_MAX_WAIT,
+    GRAPH_CONCURRENCY_INITIAL,
+    GRAPH_CONCURRENCY_MIN,
+    GRAPH_CONCURRENCY_MAX,
+    GRAPH_LATENCY_TARGET,
+    DELIVERY_TRACK_TTL,
+    OVERLOAD_QUEUE_AGE_HIGH,
+    OVERLOAD_QUEUE_AGE_LOW,
+    OVERLOAD_LATENCY_HIGH,
+    OVERLOAD_LATENCY_LOW,
+    OVERLOAD_RECOVERY_PERIOD,
+    OVERLOAD_TURN_DEADLINE,
+    METRICS_FLUSH_INTERVAL
 )
 from .config import get_greeting
 
@@ -51,10 +73,32 @@ __all__ = [
     'API_TIMEOUT',
     'API_RETRY_DELAY',
     'MAX_API_RETRIES',
+    'TOKEN_REFRESH_MARGIN',
+    'LEDGER_CACHE_TTL',
+    'PROCESSING_NOTICE_DELAY',
+    'IDEMPOTENCY_TTL',
+    'INBOUND_PROCESSING_TTL',
+    'INBOUND_DEDUPE_TTL',
     'FLOW_TIMEOUT',
     'MAX_FLOW_RETRIES',
     'RATE_LIMIT_WINDOW',
     'MAX_REQUESTS_PER_WINDOW',
+    'OUTBOUND_SENDER_RATE',
+    'OUTBOUND_SENDER_BURST',
+    'OUTBOUND_RECIPIENT_BURST',
+    'OUTBOUND_MAX_WAIT',
+    'GRAPH_CONCURRENCY_INITIAL',
+    'GRAPH_CONCURRENCY_MIN',
+    'GRAPH_CONCURRENCY_MAX',
+    'GRAPH_LATENCY_TARGET',
+    'DELIVERY_TRACK_TTL',
+    'OVERLOAD_QUEUE_AGE_HIGH',
+    'OVERLOAD_QUEUE_AGE_LOW',
+    'OVERLOAD_LATENCY_HIGH',
+    'OVERLOAD_LATENCY_LOW',
+    'OVERLOAD_RECOVERY_PERIOD',
+    'OVERLOAD_TURN_DEADLINE',
+    'METRICS_FLUSH_INTERVAL',
 
     # Action configurations
     'CREDEX_ACTIONS',
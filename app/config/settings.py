@@ -60,8 +60,33 @@ DATABASES = {
     }
 }
 
+# Bearer token Prometheus sends to /metrics/ - the endpoint refuses every
+# request while unset
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
 # Redis configuration
 REDIS_URL = env("REDIS_URL", default="redis://redis-state:6379/0")
+# Connections per process and client - raise with LANE_THREADS
+REDIS_MAX_CONNECTIONS = env("REDIS_MAX_CONNECTIONS", default=50, cast=int)
+
+# Worker class start_app.sh serves with - "wsgi" (sync Gunicorn) or "asgi"
+SERVER_MODE = env("SERVER_MODE", default="wsgi")
+
+# Threads per process running lane work - ASGI turns, notifications, status
+# batches and background refreshes (see core.api.lanes). Under WSGI member
+# turns run inline on the request thread, so lanes only carry background work
+# and a small pool does; under ASGI every in-flight turn needs a lane thread.
+# Each thread may hold a Redis connection - keep REDIS_MAX_CONNECTIONS above it.
+LANE_THREADS = env("LANE_THREADS", default=64 if SERVER_MODE == "asgi" else 8, cast=int)
+
+# Dispatcher mode - webhooks hand turns to flow worker processes, each member
+# sticking to one worker (see core.api.dispatch)
+FLOW_DISPATCH = env("FLOW_DISPATCH", default=False, cast=bool)
+FLOW_WORKERS = env("FLOW_WORKERS", default=4, cast=int)
+
+# Queue /bot/notify sends on the notification lane and answer 202 instead of
+# sending before answering - failures are then listed by GET /bot/notify
+NOTIFY_ASYNC = env("NOTIFY_ASYNC", default=False, cast=bool)
 
 # Cache configuration using Redis - shared with application state management
 CACHES = {
@@ -73,9 +98,9 @@ CACHES = {
             "SOCKET_CONNECT_TIMEOUT": 30,  # More forgiving timeout
             "SOCKET_TIMEOUT": 30,
             "RETRY_ON_TIMEOUT": True,  # Enable retries for reliability
-            "MAX_CONNECTIONS": 50,
+            "MAX_CONNECTIONS": REDIS_MAX_CONNECTIONS,
             "CONNECTION_POOL_CLASS_KWARGS": {
-                "max_connections": 50,
+                "max_connections": REDIS_MAX_CONNECTIONS,
                 "timeout": 30
             },
             "CONNECTION_POOL_CLASS": "redis.ConnectionPool",  # Standard pool is sufficient
@@ -8,6 +8,23 @@ API_TIMEOUT = 30
 API_RETRY_DELAY = 5
 MAX_API_RETRIES = 3
 
+# Refresh member JWT when it is this close to expiry
+TOKEN_REFRESH_MARGIN = 120  # 2 minutes
+
+# Cached ledger pages expire even without credex actions
+LEDGER_CACHE_TTL = 300  # 5 minutes
+
+# Processing notice only sent when an API call outlasts this
+PROCESSING_NOTICE_DELAY = 1.5  # seconds
+
+# Recorded outcomes of mutating credex-core calls replay for repeats
+IDEMPOTENCY_TTL = 86400  # 24 hours
+
+# Inbound message IDs are remembered to drop webhook redeliveries - briefly
+# while the turn runs, so a lost turn is redelivered, then for the full TTL
+INBOUND_PROCESSING_TTL = 300  # 5 minutes, longer than any queued turn
+INBOUND_DEDUPE_TTL = 86400  # 24 hours
+
 # Flow timeouts and retries
 FLOW_TIMEOUT = 600  # 10 minutes
 MAX_FLOW_RETRIES = 3
@@ -16,13 +33,62 @@ MAX_FLOW_RETRIES = 3
 RATE_LIMIT_WINDOW = 60  # 1 minute
 MAX_REQUESTS_PER_WINDOW = 60
 
+# Outbound send pacing per sender (recipients use the window limits above)
+OUTBOUND_SENDER_RATE = 80  # messages per second, Cloud API default throughput
+OUTBOUND_SENDER_BURST = 80
+OUTBOUND_RECIPIENT_BURST = 5
+OUTBOUND_MAX_WAIT = 10  # seconds a send may be queued
+
+# Adaptive in-flight send limit per sender (AIMD)
+GRAPH_CONCURRENCY_INITIAL = 20
+GRAPH_CONCURRENCY_MIN = 1
+GRAPH_CONCURRENCY_MAX = 200
+GRAPH_LATENCY_TARGET = 2.0  # seconds, slower sends count as overload
+
+# Outbound sends awaiting delivered/read statuses are tracked this long
+DELIVERY_TRACK_TTL = 259200  # 3 days
+
+# Overload shedding - enter above the high marks, leave once every signal has
+# stayed under its low mark for the recovery period
+OVERLOAD_QUEUE_AGE_HIGH = 20  # seconds from receipt to turn start (p95)
+OVERLOAD_QUEUE_AGE_LOW = 5
+OVERLOAD_LATENCY_HIGH = 10  # seconds per turn (p95)
+OVERLOAD_LATENCY_LOW = 4
+OVERLOAD_RECOVERY_PERIOD = 30
+OVERLOAD_TURN_DEADLINE = 60  # turns waiting longer are dropped
+
+# Metrics are aggregated in each process and written to Redis this often
+METRICS_FLUSH_INTERVAL = 5  # seconds
+
 __all__ = [
     'ACTIVITY_TTL',
     'API_TIMEOUT',
     'API_RETRY_DELAY',
     'MAX_API_RETRIES',
+    'TOKEN_REFRESH_MARGIN',
+    'LEDGER_CACHE_TTL',
+    'PROCESSING_NOTICE_DELAY',
+    'IDEMPOTENCY_TTL',
+    'INBOUND_PROCESSING_TTL',
+    'INBOUND_DEDUPE_TTL',
     'FLOW_TIMEOUT',
     'MAX_FLOW_RETRIES',
     'RATE_LIMIT_WINDOW',
-    'MAX_REQUESTS_PER_WINDOW'
+    'MAX_REQUESTS_PER_WINDOW',
+    'OUTBOUND_SENDER_RATE',
+    'OUTBOUND_SENDER_BURST',
+    'OUTBOUND_RECIPIENT_BURST',
+    'OUTBOUND_MAX_WAIT',
+    'GRAPH_CONCURRENCY_INITIAL',
+    'GRAPH_CONCURRENCY_MIN',
+    'GRAPH_CONCURRENCY_MAX',
+    'GRAPH_LATENCY_TARGET',
+    'DELIVERY_TRACK_TTL',
+    'OVERLOAD_QUEUE_AGE_HIGH',
+    'OVERLOAD_QUEUE_AGE_LOW',
+    'OVERLOAD_LATENCY_HIGH',
+    'OVERLOAD_LATENCY_LOW',
+    'OVERLOAD_RECOVERY_PERIOD',
+    'OVERLOAD_TURN_DEADLINE',
+    'METRICS_FLUSH_INTERVAL'
 ]
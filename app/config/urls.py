@@ -1,9 +1,10 @@
 from core.api.views import (CredexCloudApiWebhook, CredexSendMessageWebhook,
-                            WipeCache, HealthCheck)
+                            WipeCache, HealthCheck, Metrics)
 from django.urls import path
 
 urlpatterns = [
     path("health/", HealthCheck.as_view(), name="health_check"),
+    path("metrics/", Metrics.as_view(), name="metrics"),
     # Bot endpoints
     path("bot/webhook", CredexCloudApiWebhook.as_view(), name="webhook"),
     path("bot/notify", CredexSendMessageWebhook.as_view(), name="notify"),
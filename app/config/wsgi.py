@@ -4,4 +4,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_wsgi_application()
+django_application = get_wsgi_application()
+
+# Webhook POSTs are answered ahead of Django's middleware and DRF
+from core.api.wsgi import WebhookApplication  # noqa: E402
+
+application = WebhookApplication(django_application)
@@ -8,14 +8,23 @@ The state updates are protected by schema validation:
 - action: Operation results and details
 - auth: Authentication state when token present
 
+Responses are projected onto the fields components read (see projection.py)
+before they are stored, so unused credex-core fields never reach state.
+Dashboards are merged per account (see core.state.dashboard) and not written
+at all when nothing changed.
+
 Components can still store their own unvalidated data in component_data.data.
 """
 
 import logging
 from typing import Any, Dict, Optional, Tuple
 
+from core.state.dashboard import merge_dashboard
 from core.state.interface import StateManagerInterface
 
+from . import ledger_cache
+from .projection import project_response_data
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +36,7 @@ def update_state_from_response(
 
     Simple storage of API response data:
     - No validation
-    - No transformation
+    - Projected onto declared fields, no other transformation
     - Components handle their own validation/transformation
 
     Args:
@@ -39,30 +48,61 @@ def update_state_from_response(
     """
     try:
         # Get data section
-        data = api_response.get("data", {})
+        raw_data = api_response.get("data", {})
+
+        # Extract auth token before projection drops action details.token
+        token = raw_data.get("action", {}).get("details", {}).get("token")
+
+        # Collect accounts a credex action changed before projection drops
+        # the issuer/receiver IDs
+        changed_accounts = set()
+        if raw_data.get("action", {}).get("type") in ledger_cache.LEDGER_CHANGING_ACTIONS:
+            changed_accounts = ledger_cache.changed_accounts(raw_data["action"])
+            active_account_id = state_manager.get_state_value("active_account_id")
+            if active_account_id:
+                changed_accounts.add(active_account_id)
+
+        # Keep only the fields components use
+        data, _ = project_response_data(raw_data)
 
         # Only update sections that exist in response
         state_update = {}
 
-        # Update dashboard if present, preserving existing data
+        # Merge dashboard if present, preserving existing data
         if "dashboard" in data and data["dashboard"]:  # Only if not empty
             dashboard = data["dashboard"]
             if "member" in dashboard and "remainingAvailableUSD" in dashboard["member"]:
                 value = dashboard["member"]["remainingAvailableUSD"]
                 if isinstance(value, int):
                     dashboard["member"]["remainingAvailableUSD"] = float(value)
-            state_update["dashboard"] = dashboard
+
+            # Only write accounts that changed, skip dashboard when nothing did
+            merged, changed = merge_dashboard(
+                state_manager.get_state_value("dashboard", {}),
+                dashboard
+            )
+            if changed:
+                state_update["dashboard"] = merged
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dashboard unchanged, skipping write")
 
         # Always update action with latest
         if "action" in data:
             state_update["action"] = data["action"]
-            # Extract auth token if present
-            if data["action"].get("details", {}).get("token"):
+            # Store auth token if present
+            if token:
                 state_update["auth"] = {
-                    "token": data["action"]["details"]["token"]
+                    "token": token
                 }
 
+        # Drop cached ledger pages for every account the action changed,
+        # counterparties included
+        for account_id in changed_accounts:
+            ledger_cache.invalidate(account_id)
+
         # Update state
+        if not state_update:
+            return True, None
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Storing API response in state")
         state_manager.update_state(state_update)
@@ -0,0 +1,107 @@
+"""ASGI entry point for the Cloud API webhook
+
+The async counterpart of core.api.wsgi. Webhook POSTs are answered here,
+ahead of Django, with core.api.webhook.ahandle:
+- Status callbacks, redeliveries and throttled members are handled on the
+  event loop, so one worker acknowledges thousands of them concurrently
+- Member messages run through the flow in a thread pool without blocking
+  the loop
+
+Also handles the lifespan protocol, closing the async Redis client on
+shutdown. Everything else is passed to Django's ASGI handler unchanged.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from core.state.persistence.async_client import close_async_redis_client
+from django.urls import get_resolver
+
+from . import webhook
+from .wsgi import RECEIVED_BODY, WEBHOOK_PATH, _dumps, _loads
+
+logger = logging.getLogger(__name__)
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def _header(scope: Scope, name: bytes) -> bytes:
+    """Get request header value (lowercase name)"""
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value
+    return b""
+
+
+class WebhookApplication:
+    """ASGI application answering webhook POSTs before Django"""
+
+    def __init__(self, django_application: Callable):
+        self.django_application = django_application
+        # Load URLconf now so view module setup (logging) applies from the
+        # first request, as it does under WSGI
+        get_resolver().url_patterns
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if (
+            scope["type"] != "http"
+            or scope.get("path") != WEBHOOK_PATH
+            or scope.get("method") != "POST"
+            or not _header(scope, b"content-type").startswith(b"application/json")
+        ):
+            await self.django_application(scope, receive, send)
+            return
+
+        try:
+            body = await self._read_body(receive)
+            # Empty body parses to no data, like DRF
+            data = _loads(body) if body else {}
+        except Exception as e:
+            logger.error(f"Webhook error: JSON parse error - {str(e)}")
+            await self._respond(send, 500, _dumps({"error": f"JSON parse error - {str(e)}"}))
+            return
+
+        is_mock_testing = _header(scope, b"x-mock-testing") == b"true"
+        status_code, response_body = await webhook.ahandle(data, is_mock_testing)
+        encoded = RECEIVED_BODY if response_body is webhook.RECEIVED else _dumps(response_body)
+        await self._respond(send, status_code, encoded)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        """Read full request body"""
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ValueError("Client disconnected")
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send: Send, status_code: int, body: bytes) -> None:
+        """Send response with JSON body"""
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1"))
+        ]
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _lifespan(receive: Receive, send: Send) -> None:
+        """Handle server startup and shutdown"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await close_async_redis_client()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
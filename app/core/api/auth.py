@@ -0,0 +1,207 @@
+"""Token lifecycle management
+
+Tracks the expiry (exp claim) of the credex-core JWT held in state and refreshes
+it before it lapses, outside the member's critical path:
+- Tokens inside the refresh margin are refreshed on the maintenance lane
+- Expired tokens are refreshed inline so the pending request can continue
+- Refreshed tokens are shared across workers through Redis
+
+The login endpoint issues fresh tokens today. Set CREDEX_REFRESH_ENDPOINT once
+credex-core exposes a dedicated refresh endpoint.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+from urllib.parse import urljoin
+
+import jwt
+import requests
+from config.timing import API_TIMEOUT, TOKEN_REFRESH_MARGIN
+from core.api import lanes
+from core.state.interface import StateManagerInterface
+from core.state.persistence.client import get_redis_client
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for refreshed tokens shared between workers
+TOKEN_KEY_PREFIX = "auth_token"
+
+# Lock TTL preventing parallel refreshes of the same channel
+REFRESH_LOCK_TTL = 30  # seconds
+
+REFRESH_ENDPOINT = config("CREDEX_REFRESH_ENDPOINT", default="login")
+
+
+def get_token_expiry(token: str) -> Optional[float]:
+    """Get expiry timestamp from JWT without verifying signature
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Optional[float]: Expiry as unix timestamp, None if token has no exp claim
+    """
+    try:
+        payload = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+
+    expiry = payload.get("exp")
+    return float(expiry) if isinstance(expiry, (int, float)) else None
+
+
+class TokenManager:
+    """Keeps member JWTs fresh ahead of expiry"""
+
+    # Channels with a background refresh in flight in this process
+    _refreshing = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_token(cls, state_manager: StateManagerInterface) -> Optional[str]:
+        """Get usable token for channel, refreshing ahead of expiry
+
+        Args:
+            state_manager: State manager instance
+
+        Returns:
+            Optional[str]: Current token, or None if not logged in
+        """
+        token = state_manager.get_state_value("auth", {}).get("token")
+        if not token:
+            return None
+
+        expiry = get_token_expiry(token)
+        if expiry is None:
+            return token
+
+        remaining = expiry - time.time()
+        if remaining > TOKEN_REFRESH_MARGIN:
+            return token
+
+        channel_id = state_manager.get_channel_id()
+
+        # Pick up token refreshed in the background or by another worker
+        shared_token = cls._load_shared(channel_id)
+        if shared_token and shared_token != token:
+            shared_expiry = get_token_expiry(shared_token)
+            if shared_expiry and shared_expiry > expiry:
+                cls.store_token(state_manager, shared_token)
+                return shared_token
+
+        if remaining > 0:
+            # Still valid - refresh in background and carry on
+            cls.refresh_async(channel_id)
+            return token
+
+        # Already expired - refresh inline so request can proceed
+        logger.info("Token expired, refreshing inline")
+        refreshed = cls.refresh(channel_id)
+        if refreshed:
+            cls.store_token(state_manager, refreshed)
+            return refreshed
+        return token
+
+    @classmethod
+    def store_token(cls, state_manager: StateManagerInterface, token: str) -> None:
+        """Store refreshed token in state, keeping other auth fields"""
+        auth = state_manager.get_state_value("auth") or {}
+        state_manager.update_state({"auth": {**auth, "token": token}})
+
+    @classmethod
+    def refresh(cls, channel_id: str) -> Optional[str]:
+        """Get fresh token from credex-core and share it with other workers
+
+        Args:
+            channel_id: Channel identifier (member phone)
+
+        Returns:
+            Optional[str]: New token, None if refresh failed
+        """
+        # Imported here to avoid circular imports
+        from .base import BASE_URL
+
+        url = urljoin(BASE_URL, REFRESH_ENDPOINT)
+        try:
+            response = requests.post(
+                url,
+                json={"phone": channel_id},
+                headers={
+                    "Content-Type": "application/json",
+                    "x-client-api-key": config("CLIENT_API_KEY"),
+                },
+                timeout=API_TIMEOUT
+            )
+            if response.status_code != 200:
+                logger.warning(f"Token refresh returned {response.status_code}")
+                return None
+
+            token = (
+                response.json().get("data", {})
+                .get("action", {})
+                .get("details", {})
+                .get("token")
+            )
+            if not token:
+                logger.warning("Token refresh response contained no token")
+                return None
+
+            cls._store_shared(channel_id, token)
+            logger.info("Token refreshed")
+            return token
+
+        except Exception as e:
+            logger.error(f"Token refresh failed: {str(e)}")
+            return None
+
+    @classmethod
+    def refresh_async(cls, channel_id: str) -> None:
+        """Refresh token on the maintenance lane, at most once per channel"""
+        with cls._lock:
+            if channel_id in cls._refreshing:
+                return
+            cls._refreshing.add(channel_id)
+
+        try:
+            # Only one worker refreshes a given channel
+            redis_client = get_redis_client()
+            lock_key = f"{TOKEN_KEY_PREFIX}:{channel_id}:refreshing"
+            if not redis_client.set(lock_key, "1", nx=True, ex=REFRESH_LOCK_TTL):
+                with cls._lock:
+                    cls._refreshing.discard(channel_id)
+                return
+        except Exception as e:
+            logger.warning(f"Token refresh lock unavailable: {str(e)}")
+
+        def run():
+            try:
+                cls.refresh(channel_id)
+            finally:
+                with cls._lock:
+                    cls._refreshing.discard(channel_id)
+
+        lanes.submit(lanes.MAINTENANCE, run)
+
+    @classmethod
+    def _load_shared(cls, channel_id: str) -> Optional[str]:
+        """Load token refreshed by any worker"""
+        try:
+            return get_redis_client().get(f"{TOKEN_KEY_PREFIX}:{channel_id}")
+        except Exception as e:
+            logger.warning(f"Failed to load shared token: {str(e)}")
+            return None
+
+    @classmethod
+    def _store_shared(cls, channel_id: str, token: str) -> None:
+        """Share refreshed token until it expires"""
+        expiry = get_token_expiry(token)
+        ttl = int(expiry - time.time()) if expiry else REFRESH_LOCK_TTL
+        if ttl <= 0:
+            return
+        try:
+            get_redis_client().setex(f"{TOKEN_KEY_PREFIX}:{channel_id}", ttl, token)
+        except Exception as e:
+            logger.warning(f"Failed to share refreshed token: {str(e)}")
@@ -2,7 +2,7 @@
 import base64
 import logging
 import time
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -13,7 +13,9 @@ from core.state.validator import StateValidator
 from decouple import config
 from requests.exceptions import RequestException
 
-from . import api_response
+from . import api_response, idempotency
+from .auth import TokenManager
+from .hedging import get_endpoint, send_request
 
 logger = logging.getLogger(__name__)
 
@@ -100,9 +102,8 @@ def get_headers(state_manager: StateManagerInterface, url: str) -> Dict[str, str
             logger.error("Invalid channel structure")
             return headers
 
-        # Get auth token from state (proper location for auth data)
-        auth = state_manager.get_state_value("auth", {})
-        jwt_token = auth.get("token")
+        # Get auth token from state, refreshed ahead of expiry
+        jwt_token = TokenManager.get_token(state_manager)
 
         if jwt_token:
             headers["Authorization"] = f"Bearer {jwt_token}"
@@ -163,6 +164,150 @@ def is_auth_required(url: str) -> bool:
     return endpoint not in ['login', 'onboardMember']
 
 
+def start_login_flow(state_manager: StateManagerInterface, url: str) -> Dict[str, Any]:
+    """Send member through login after an unrecoverable auth error
+
+    Returns:
+        Dict[str, Any]: AUTH_REQUIRED error for the caller to return
+    """
+    logger.warning("Auth error, initializing login flow")
+
+    # Store return URL in state for after login
+    state_manager.update_state({
+        "auth": {
+            "return_url": url
+        }
+    })
+
+    # Initialize proper login flow starting with Greeting
+    state_manager.update_flow_state(
+        path="login",
+        component="Greeting",
+        component_result="",
+        awaiting_input=False,
+        data={}
+    )
+
+    # Let flow processor handle the rest
+    # API layer's job is done - return error to trigger retry after flow completes
+    return ErrorHandler.handle_system_error(
+        code="AUTH_REQUIRED",
+        service="api_client",
+        action="make_request",
+        message="Authentication required - login flow initiated"
+    )
+
+
+def send_with_retries(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    refresh_token: Optional[Callable[[], Optional[str]]] = None,
+    requires_auth: bool = True,
+    idempotency_key: Optional[str] = None
+) -> Tuple[requests.Response, Optional[str], bool]:
+    """Send request with retries and one token refresh, without touching state
+
+    Safe to call from worker threads. Completes the idempotency key on a
+    response and releases it on failure.
+
+    Args:
+        method: HTTP method
+        url: Absolute request URL
+        headers: Request headers, with Authorization for authenticated calls
+        payload: JSON payload
+        refresh_token: Gets a fresh token after an auth error, None to not retry
+        requires_auth: Whether the endpoint needs a token
+        idempotency_key: Key of a mutating call, sent as a header
+
+    Returns:
+        Tuple: Response, token refreshed along the way (for the caller to
+        store), and whether authentication failed even after refreshing
+
+    Raises:
+        SystemException: If every attempt failed
+    """
+    headers = dict(headers)
+    if idempotency_key:
+        headers[idempotency.IDEMPOTENCY_HEADER] = idempotency_key
+
+    retries = 0
+    refreshed_token = None
+    token_refreshed = False
+    while retries < MAX_RETRIES:
+        try:
+            # Try request with current headers (idempotent reads may be hedged)
+            response = send_request(
+                method,
+                url,
+                headers=headers,
+                payload=payload,
+                timeout=TIMEOUT
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"API Response Status: {response.status_code}")
+                logger.debug(f"API Response Headers: {response.headers}")
+
+            # Handle auth errors - no token in headers, or got 401 response
+            if requires_auth and refresh_token and (
+                "Authorization" not in headers or response.status_code == 401
+            ):
+                # Refresh token once and retry original request transparently
+                if not token_refreshed:
+                    token_refreshed = True
+                    refreshed_token = refresh_token()
+                    if refreshed_token:
+                        logger.info("Auth error, retrying with refreshed token")
+                        headers["Authorization"] = f"Bearer {refreshed_token}"
+                        continue
+
+                if idempotency_key:
+                    idempotency.release(idempotency_key)
+                return response, refreshed_token, True
+
+            # Log non-200 responses (but don't treat as errors)
+            if response.status_code != 200:
+                try:
+                    response_data = response.json()
+                    logger.info(f"Non-200 response: {response.status_code}, data: {response_data}")
+                except Exception as e:
+                    logger.debug(f"Failed to parse response: {e}")
+
+            if idempotency_key:
+                idempotency.complete(idempotency_key, response)
+
+            return response, refreshed_token, False
+
+        except RequestException as e:
+            logger.error(f"Request failed: {str(e)}")
+            retries += 1
+            if retries < MAX_RETRIES:
+                time.sleep(RETRY_DELAY)
+                continue
+            if idempotency_key:
+                idempotency.release(idempotency_key)
+            raise SystemException(
+                message=f"Request failed after {MAX_RETRIES} retries: {str(e)}",
+                code="REQUEST_FAILED",
+                service="api_client",
+                action=f"{method}_{url}"
+            )
+        except Exception:
+            # Token refresh or request building failed - free the key for retries
+            if idempotency_key:
+                idempotency.release(idempotency_key)
+            raise
+
+    raise SystemException(
+        message=f"Failed after {MAX_RETRIES} retries",
+        code="MAX_RETRIES_EXCEEDED",
+        service="api_client",
+        action=f"{method}_{url}"
+    )
+
+
 def make_api_request(
     url: str,
     payload: Dict[str, Any],
@@ -194,98 +339,37 @@ def make_api_request(
         if "error" in validation:
             return validation
 
+        # Mutating calls carry an idempotency key and replay recorded outcomes
+        idempotency_key = None
+        endpoint = get_endpoint(url)
+        if state_manager and idempotency.is_mutating(endpoint):
+            idempotency_key = idempotency.make_key(state_manager, endpoint, payload)
+            recorded = idempotency.begin(idempotency_key, endpoint)
+            if recorded is not None:
+                return recorded
+
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Making API request to {url}")
             logger.debug(f"Headers: {headers}")
             logger.debug(f"Payload: {payload}")
 
-        retries = 0
-        while retries < MAX_RETRIES:
-            try:
-                # Try request with current headers
-                response = requests.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=TIMEOUT
-                )
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"API Response Status: {response.status_code}")
-                    logger.debug(f"API Response Headers: {response.headers}")
-
-                # Handle auth errors
-                if requires_auth and (
-                    # No token in headers
-                    ("Authorization" not in headers and retry_auth) or
-                    # Or got 401 response
-                    (response.status_code == 401 and retry_auth)
-                ):
-                    if not state_manager:
-                        return ErrorHandler.handle_system_error(
-                            code="AUTH_ERROR",
-                            service="api_client",
-                            action="validate_auth",
-                            message="State manager required for authenticated request"
-                        )
-
-                    logger.warning("Auth error, initializing login flow")
-
-                    # Store return URL in state for after login
-                    state_manager.update_state({
-                        "auth": {
-                            "return_url": url
-                        }
-                    })
-
-                    # Initialize proper login flow starting with Greeting
-                    state_manager.update_flow_state(
-                        path="login",
-                        component="Greeting",
-                        component_result="",
-                        awaiting_input=False,
-                        data={}
-                    )
-
-                    # Let flow processor handle the rest
-                    # API layer's job is done - return error to trigger retry after flow completes
-                    return ErrorHandler.handle_system_error(
-                        code="AUTH_REQUIRED",
-                        service="api_client",
-                        action="make_request",
-                        message="Authentication required - login flow initiated"
-                    )
-
-                # Log non-200 responses (but don't treat as errors)
-                if response.status_code != 200:
-                    try:
-                        response_data = response.json()
-                        logger.info(f"Non-200 response: {response.status_code}, data: {response_data}")
-                    except Exception as e:
-                        logger.debug(f"Failed to parse response: {e}")
-
-                return response
-
-            except RequestException as e:
-                logger.error(f"Request failed: {str(e)}")
-                retries += 1
-                if retries < MAX_RETRIES:
-                    time.sleep(RETRY_DELAY)
-                    continue
-                raise SystemException(
-                    message=f"Request failed after {MAX_RETRIES} retries: {str(e)}",
-                    code="REQUEST_FAILED",
-                    service="api_client",
-                    action=f"{method}_{url}"
-                )
-
-        raise SystemException(
-            message=f"Failed after {MAX_RETRIES} retries",
-            code="MAX_RETRIES_EXCEEDED",
-            service="api_client",
-            action=f"{method}_{url}"
+        channel_id = state_manager.get_channel_id() if state_manager and retry_auth else None
+        response, refreshed_token, auth_failed = send_with_retries(
+            method,
+            url,
+            headers,
+            payload,
+            refresh_token=(lambda: TokenManager.refresh(channel_id)) if channel_id else None,
+            requires_auth=requires_auth,
+            idempotency_key=idempotency_key
         )
+        if refreshed_token:
+            TokenManager.store_token(state_manager, refreshed_token)
+
+        if auth_failed:
+            return start_login_flow(state_manager, url)
+
+        return response
 
     except Exception as e:
         raise SystemException(
@@ -0,0 +1,336 @@
+"""Sticky dispatch of member turns to flow worker processes
+
+Without dispatch any web worker can run any member's turn, so per-process
+caches rarely hit and a member's concurrent messages race each other. In
+dispatcher mode (FLOW_DISPATCH) the webhook acknowledges the message and
+forwards the turn instead of running it:
+- Each member's channel ID is hashed onto a consistent-hash ring of flow
+  workers (FLOW_WORKERS processes started by manage.py run_flow_workers)
+- Every worker reads its own Redis stream partition and runs turns one at a
+  time, giving cache locality and per-member ordering
+- Virtual nodes keep the ring balanced; adding or removing a worker only
+  moves the members on the ring segments it gains or loses (about 1/N)
+
+Turns run strictly in partition order, each acknowledged before the next
+starts, so a worker restart or error replays its unfinished turns in order.
+A failing turn is retried inline with backoff, and after MAX_TURN_ATTEMPTS
+moved to the DEAD_LETTER_STREAM - a member's later turns never run ahead of
+an earlier one. A turn that keeps crashing its worker is dead-lettered once
+replayed more than MAX_TURN_ATTEMPTS times. When the workers
+start, queued turns whose owner changed with the ring (workers added or
+removed) are moved to their new owners. Forwarding fails open - if Redis is
+unavailable the webhook runs the turn itself.
+
+Reported metrics:
+- flow_partition_turns_total{partition} -> turns run by each worker
+- flow_dead_turns_total{partition} -> turns given up on
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+from core import metrics
+from core.messaging.inbound import InboundMessage
+from core.state.persistence.async_client import get_async_redis_client
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEY_PREFIX = "flow:partition"
+CONSUMER_GROUP = "flow_workers"
+DEAD_LETTER_STREAM = "flow:dead"
+
+VIRTUAL_NODES = 160  # ring points per worker
+STREAM_MAX_LENGTH = 100000  # approximate, per partition
+BATCH_SIZE = 100
+BLOCK_MS = 5000
+ERROR_BACKOFF = 5  # seconds
+MAX_TURN_ATTEMPTS = 3  # attempts before a turn is dead-lettered
+RETRY_BACKOFF = 1  # seconds before the first retry, doubled after each
+
+
+def _hash(key: str) -> int:
+    """Get ring position for key"""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys to nodes"""
+
+    def __init__(self, nodes: Iterable[str], replicas: int = VIRTUAL_NODES):
+        points = sorted(
+            (_hash(f"{node}#{replica}"), node)
+            for node in nodes
+            for replica in range(replicas)
+        )
+        if not points:
+            raise ValueError("Hash ring needs at least one node")
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+        self.nodes = sorted(set(self._nodes))
+
+    def node_for(self, key: str) -> str:
+        """Get node owning key"""
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
+
+
+_ring: Optional[HashRing] = None
+
+
+def worker_names(count: int) -> List[str]:
+    """Get ring node names for worker count"""
+    return [f"flow-{index}" for index in range(count)]
+
+
+def get_ring() -> HashRing:
+    """Get ring of configured flow workers"""
+    global _ring
+    if _ring is None:
+        _ring = HashRing(worker_names(settings.FLOW_WORKERS))
+    return _ring
+
+
+def partition_key(node: str) -> str:
+    """Get Redis stream for worker partition"""
+    return f"{PARTITION_KEY_PREFIX}:{node}"
+
+
+def _entry(inbound: InboundMessage) -> Dict[str, str]:
+    """Get stream entry for turn"""
+    return {"message": json.dumps(inbound.to_fields())}
+
+
+def forward(inbound: InboundMessage) -> bool:
+    """Forward turn to the member's flow worker
+
+    Returns:
+        bool: False if the turn could not be forwarded and must be run here
+    """
+    node = get_ring().node_for(inbound.channel_id)
+    try:
+        get_redis_client().xadd(
+            partition_key(node), _entry(inbound), maxlen=STREAM_MAX_LENGTH, approximate=True
+        )
+    except Exception as e:
+        logger.warning(f"Failed to forward turn to {node}: {str(e)}")
+        return False
+    return True
+
+
+async def aforward(inbound: InboundMessage) -> bool:
+    """Forward turn to the member's flow worker from the event loop (see forward)"""
+    node = get_ring().node_for(inbound.channel_id)
+    try:
+        await get_async_redis_client().xadd(
+            partition_key(node), _entry(inbound), maxlen=STREAM_MAX_LENGTH, approximate=True
+        )
+    except Exception as e:
+        logger.warning(f"Failed to forward turn to {node}: {str(e)}")
+        return False
+    return True
+
+
+def partition_lag() -> float:
+    """Get age in seconds of the oldest turn not yet read by its flow worker
+
+    Largest across partitions, 0 if none are waiting. Turns read but left
+    pending (failed, awaiting retry) are not counted.
+    """
+    redis_client = get_redis_client()
+    keys = [partition_key(node) for node in get_ring().nodes]
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.xinfo_groups(key)
+    # Partitions or groups not created yet come back as errors
+    groups = pipe.execute(raise_on_error=False)
+
+    pipe = redis_client.pipeline(transaction=False)
+    for key, key_groups in zip(keys, groups):
+        last_delivered = "0-0"
+        if isinstance(key_groups, list):
+            for group in key_groups:
+                if group["name"] == CONSUMER_GROUP:
+                    last_delivered = group["last-delivered-id"]
+        pipe.xrange(key, min=f"({last_delivered}", count=1)
+    waiting = [
+        int(entries[0][0].split("-")[0])
+        for entries in pipe.execute(raise_on_error=False)
+        if isinstance(entries, list) and entries
+    ]
+    if not waiting:
+        return 0.0
+    return max(0.0, time.time() - min(waiting) / 1000)
+
+
+def _owner(fields: Dict[str, str], ring: HashRing) -> Optional[str]:
+    """Get node owning turn entry, None if malformed"""
+    try:
+        return ring.node_for(json.loads(fields["message"])["channel_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def rebalance() -> None:
+    """Move queued turns to their owners on the current ring
+
+    Covers partitions of workers no longer on the ring and turns on surviving
+    partitions that changed owner. Run before workers start, while no
+    partition is being read. Moved turns queue behind any the new owner
+    already has, so when resizing restart the flow workers before the web
+    workers start forwarding with the new FLOW_WORKERS.
+    """
+    ring = get_ring()
+    redis_client = get_redis_client()
+    for key in redis_client.scan_iter(match=f"{PARTITION_KEY_PREFIX}:*"):
+        node = key[len(PARTITION_KEY_PREFIX) + 1:]
+        removed = node not in ring.nodes
+        moved = []
+        for entry_id, fields in redis_client.xrange(key):
+            owner = _owner(fields, ring)
+            if owner is not None and owner != node:
+                moved.append((entry_id, fields, owner))
+        if not moved and not removed:
+            continue
+
+        pipe = redis_client.pipeline(transaction=True)
+        for _, fields, owner in moved:
+            pipe.xadd(partition_key(owner), fields, maxlen=STREAM_MAX_LENGTH, approximate=True)
+        if removed:
+            pipe.delete(key)
+        elif moved:
+            # Pending references to deleted entries are acknowledged by serve
+            pipe.xdel(key, *[entry_id for entry_id, _, _ in moved])
+        pipe.execute()
+        logger.info(f"Moved {len(moved)} queued turns from {key}")
+
+
+def _run_turn(entry_id: str, fields: Optional[Dict[str, str]]) -> bool:
+    """Run turn from partition entry
+
+    Returns:
+        bool: False if the turn failed and should be retried
+    """
+    # Imported here - the flow stack is only needed in worker processes
+    from core.api.webhook import run_flow
+
+    # Pending entries deleted from the stream come back without fields
+    if fields is None:
+        return True
+    try:
+        inbound = InboundMessage(**json.loads(fields["message"]))
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Dropping malformed turn {entry_id}: {str(e)}")
+        return True
+
+    status_code, _ = run_flow(inbound, inbound.mock_testing)
+    return status_code == 200
+
+
+def _dead_letter(redis_client, key: str, node: str, entry_id: str, fields: Dict[str, str]) -> None:
+    """Move turn that kept failing to the dead letter stream"""
+    logger.error(f"Giving up on turn {entry_id} after {MAX_TURN_ATTEMPTS} attempts, dead-lettering")
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.xadd(
+        DEAD_LETTER_STREAM,
+        {**fields, "partition": node, "entry_id": entry_id},
+        maxlen=STREAM_MAX_LENGTH,
+        approximate=True
+    )
+    pipe.xack(key, CONSUMER_GROUP, entry_id)
+    pipe.xdel(key, entry_id)
+    pipe.execute()
+    metrics.increment("flow_dead_turns_total", labels={"partition": node})
+
+
+def _run_with_retries(entry_id: str, fields: Optional[Dict[str, str]]) -> bool:
+    """Run turn, retrying inline with backoff
+
+    Returns:
+        bool: False if every attempt failed
+    """
+    for attempt in range(1, MAX_TURN_ATTEMPTS + 1):
+        if _run_turn(entry_id, fields):
+            return True
+        if attempt < MAX_TURN_ATTEMPTS:
+            logger.warning(f"Turn {entry_id} failed (attempt {attempt}), retrying")
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+    return False
+
+
+def _delivery_count(redis_client, key: str, node: str, entry_id: str) -> int:
+    """Get times pending entry was delivered to worker"""
+    pending = redis_client.xpending_range(key, CONSUMER_GROUP, min=entry_id, max=entry_id, count=1, consumername=node)
+    return pending[0]["times_delivered"] if pending else 1
+
+
+def _run_entries(redis_client, key: str, node: str, entries: List, replay_head: bool) -> None:
+    """Run turns in order, acknowledging each before the next starts
+
+    Args:
+        replay_head: Whether the first entry is the oldest turn of a replay -
+            the one a crashed worker was running - so its delivery count is
+            checked before running it again
+    """
+    for position, (entry_id, fields) in enumerate(entries):
+        if (
+            position == 0 and replay_head and fields is not None
+            and _delivery_count(redis_client, key, node, entry_id) > MAX_TURN_ATTEMPTS
+        ):
+            _dead_letter(redis_client, key, node, entry_id, fields)
+            continue
+        if not _run_with_retries(entry_id, fields):
+            _dead_letter(redis_client, key, node, entry_id, fields)
+            continue
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.xack(key, CONSUMER_GROUP, entry_id)
+        pipe.xdel(key, entry_id)
+        pipe.execute()
+        if fields is not None:
+            metrics.increment("flow_partition_turns_total", labels={"partition": node})
+
+
+def serve(node: str) -> None:
+    """Run turns from worker partition until the process exits"""
+    redis_client = get_redis_client()
+    key = partition_key(node)
+    try:
+        redis_client.xgroup_create(key, CONSUMER_GROUP, id="0", mkstream=True)
+    except Exception as e:
+        # BUSYGROUP - partition served before
+        if "BUSYGROUP" not in str(e):
+            logger.warning(f"Failed to create flow consumer group: {str(e)}")
+
+    logger.info(f"Flow worker {node} started")
+    # Replay turns left unacknowledged by a previous run first
+    stream_id = "0"
+    while True:
+        try:
+            replay_head = stream_id == "0"
+            replaying = stream_id != ">"
+            response = redis_client.xreadgroup(
+                CONSUMER_GROUP,
+                node,
+                {key: stream_id},
+                count=BATCH_SIZE,
+                block=None if replaying else BLOCK_MS
+            )
+            entries = [entry for _, stream_entries in response or [] for entry in stream_entries]
+            if replaying:
+                if not entries:
+                    stream_id = ">"
+                    continue
+                stream_id = entries[-1][0]
+
+            _run_entries(redis_client, key, node, entries, replay_head=replay_head)
+        except Exception as e:
+            logger.warning(f"Flow worker {node} error: {str(e)}")
+            # Replay turns left pending by the failed batch
+            stream_id = "0"
+            time.sleep(ERROR_BACKOFF)
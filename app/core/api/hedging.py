@@ -0,0 +1,175 @@
+"""Hedged requests for idempotent credex-core reads
+
+A single slow upstream instance dominates tail latency. For read-only endpoints
+we send a duplicate request once the first has been outstanding longer than the
+endpoint's observed p95, and use whichever response arrives first:
+- Only endpoints in HEDGEABLE_ENDPOINTS are ever hedged - never mutations
+- No hedging until an endpoint has enough latency samples for a p95
+- A token bucket caps hedges at HEDGE_BUDGET of hedgeable traffic
+- The losing request is cancelled if not yet started, otherwise ignored
+
+Reported metrics:
+- api_hedgeable_requests_total / api_hedges_total -> hedge rate
+- api_hedge_wins_total / api_hedges_total -> win rate
+
+Enable with API_HEDGING_ENABLED.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Optional
+
+import requests
+from core import metrics
+from decouple import config
+from requests.exceptions import RequestException
+
+logger = logging.getLogger(__name__)
+
+HEDGING_ENABLED = config("API_HEDGING_ENABLED", default=False, cast=bool)
+
+# Read-only endpoints safe to send twice. Login returns the member dashboard
+# and is how dashboards are refreshed; a second login only issues another token.
+HEDGEABLE_ENDPOINTS = frozenset({
+    "getLedger",
+    "getAccountByHandle",
+    "login"
+})
+
+HEDGE_BUDGET = 0.05  # max share of hedgeable requests that may be hedged
+HEDGE_BURST = 5  # hedges available at once after a quiet period
+MIN_SAMPLES = 20  # latency samples needed before hedging an endpoint
+SAMPLE_WINDOW = 200  # latency samples kept per endpoint
+MIN_HEDGE_DELAY = 0.05  # seconds
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="api-hedge")
+
+
+class LatencyTracker:
+    """Recent per-endpoint latencies for this process"""
+
+    def __init__(self):
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record request latency in seconds"""
+        with self._lock:
+            if endpoint not in self._samples:
+                self._samples[endpoint] = deque(maxlen=SAMPLE_WINDOW)
+            self._samples[endpoint].append(latency)
+
+    def p95(self, endpoint: str) -> Optional[float]:
+        """Get p95 latency in seconds, None until enough samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[int(len(samples) * 0.95) - 1]
+
+
+class HedgeBudget:
+    """Token bucket earning HEDGE_BUDGET tokens per hedgeable request"""
+
+    def __init__(self):
+        self._tokens = float(HEDGE_BURST)
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        """Credit budget for a hedgeable request"""
+        with self._lock:
+            self._tokens = min(self._tokens + HEDGE_BUDGET, HEDGE_BURST)
+
+    def acquire(self) -> bool:
+        """Spend one hedge if budget allows"""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+_latencies = LatencyTracker()
+_budget = HedgeBudget()
+
+
+def get_endpoint(url: str) -> str:
+    """Get endpoint name from request URL"""
+    return url.rstrip('/').split('/')[-1]
+
+
+def send_request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    timeout: int
+) -> requests.Response:
+    """Send request, hedging idempotent reads that exceed their p95
+
+    Args:
+        method: HTTP method
+        url: Absolute request URL
+        headers: Request headers
+        payload: JSON payload
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        requests.Response: First successful response
+
+    Raises:
+        RequestException: If every attempt failed
+    """
+    endpoint = get_endpoint(url)
+    if not HEDGING_ENABLED or endpoint not in HEDGEABLE_ENDPOINTS:
+        return requests.request(method, url, headers=headers, json=payload, timeout=timeout)
+
+    labels = {"endpoint": endpoint}
+    metrics.increment("api_hedgeable_requests_total", labels=labels)
+    _budget.earn()
+
+    delay = _latencies.p95(endpoint)
+    started = time.monotonic()
+
+    def attempt() -> requests.Response:
+        attempt_started = time.monotonic()
+        response = requests.request(method, url, headers=headers, json=payload, timeout=timeout)
+        # Record every completed attempt so p95 reflects upstream, not hedged, latency
+        _latencies.record(endpoint, time.monotonic() - attempt_started)
+        return response
+
+    primary = _executor.submit(attempt)
+    done, _ = wait([primary], timeout=max(delay, MIN_HEDGE_DELAY) if delay else None)
+    if done or not _budget.acquire():
+        response = primary.result()
+        metrics.observe("api_request_duration_ms", (time.monotonic() - started) * 1000, labels)
+        return response
+
+    metrics.increment("api_hedges_total", labels=labels)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Hedging {endpoint} after {delay:.3f}s")
+
+    hedge = _executor.submit(attempt)
+    pending = {primary, hedge}
+    error: Optional[RequestException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                response = future.result()
+            except RequestException as e:
+                error = e
+                continue
+
+            if future is hedge:
+                metrics.increment("api_hedge_wins_total", labels=labels)
+                logger.info(f"Hedged {endpoint} request won")
+            for other in pending:
+                other.cancel()
+            metrics.observe("api_request_duration_ms", (time.monotonic() - started) * 1000, labels)
+            return response
+
+    raise error
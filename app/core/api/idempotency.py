@@ -0,0 +1,172 @@
+"""Idempotency keys for mutating credex-core calls
+
+Retrying a POST that changes money must never apply it twice. Every mutating
+call gets a stable key derived from the channel, the flow step, the triggering
+message and the payload:
+- The key is sent upstream as the Idempotency-Key header
+- The first caller claims the key, later callers wait briefly for its
+  outcome and otherwise get an "in progress" error response
+- Definitive outcomes are recorded in Redis for IDEMPOTENCY_TTL
+- Repeats (retries, duplicate webhook deliveries) replay the recorded response
+  without calling credex-core
+
+The triggering message ID keeps a member's genuine repeat of the same action
+(same amount to the same handle) distinct from a redelivery of one message.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from config.timing import API_TIMEOUT, IDEMPOTENCY_TTL
+from core import metrics
+from core.state.interface import StateManagerInterface
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_KEY_PREFIX = "idempotency"
+
+# Endpoints that change member or ledger data
+MUTATING_ENDPOINTS = frozenset({
+    "createCredex",
+    "acceptCredex",
+    "declineCredex",
+    "cancelCredex",
+    "hustler10k",
+    "onboardMember"
+})
+
+# Marker held while the claiming caller's request is in flight
+PENDING = "pending"
+CLAIM_TTL = API_TIMEOUT * 3  # covers make_api_request retries
+CLAIM_WAIT = 3  # seconds a repeat waits for the claimed call's outcome
+POLL_INTERVAL = 0.2  # seconds
+
+# Answer for repeats while the claimed call is still in flight
+IN_PROGRESS_STATUS = 409
+IN_PROGRESS_MESSAGE = "Your previous request is still being processed, please try again shortly"
+
+
+def is_mutating(endpoint: str) -> bool:
+    """Check if endpoint changes data upstream"""
+    return endpoint in MUTATING_ENDPOINTS
+
+
+def make_key(state_manager: StateManagerInterface, endpoint: str, payload: Dict[str, Any]) -> str:
+    """Derive idempotency key for call
+
+    Args:
+        state_manager: State manager instance
+        endpoint: credex-core endpoint name
+        payload: Request payload
+
+    Returns:
+        str: Hex digest identifying this call
+    """
+    incoming_message = state_manager.get_incoming_message() or {}
+    parts = [
+        state_manager.get_channel_id(),
+        state_manager.get_path() or "",
+        state_manager.get_component() or "",
+        incoming_message.get("id", ""),
+        endpoint,
+        json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _redis_key(key: str) -> str:
+    """Get Redis key for idempotency key"""
+    return f"{IDEMPOTENCY_KEY_PREFIX}:{key}"
+
+
+def begin(key: str, endpoint: str) -> Optional[requests.Response]:
+    """Claim key or get recorded outcome
+
+    Waits up to CLAIM_WAIT while another caller holds the claim, then gives
+    an in-progress error response rather than holding the request thread. If
+    the claim lapses without an outcome the caller proceeds, relying on the
+    header for upstream dedupe.
+
+    Args:
+        key: Idempotency key
+        endpoint: Endpoint name for metrics
+
+    Returns:
+        Optional[requests.Response]: Recorded or in-progress response to
+        return, None to proceed
+    """
+    try:
+        redis_client = get_redis_client()
+        deadline = time.monotonic() + CLAIM_WAIT
+        while True:
+            recorded = redis_client.get(_redis_key(key))
+            if recorded and recorded != PENDING:
+                metrics.increment("idempotency_replays_total", labels={"endpoint": endpoint})
+                logger.info(f"Replaying recorded {endpoint} outcome")
+                return _to_response(json.loads(recorded))
+
+            if recorded is None and redis_client.set(_redis_key(key), PENDING, nx=True, ex=CLAIM_TTL):
+                return None
+
+            if time.monotonic() >= deadline:
+                metrics.increment("idempotency_in_progress_total", labels={"endpoint": endpoint})
+                logger.warning(f"{endpoint} call still in progress, not waiting")
+                return _to_response({
+                    "status_code": IN_PROGRESS_STATUS,
+                    "content_type": "application/json",
+                    "body": json.dumps({"error": {"message": IN_PROGRESS_MESSAGE}})
+                })
+            time.sleep(POLL_INTERVAL)
+
+    except Exception as e:
+        logger.warning(f"Idempotency store unavailable: {str(e)}")
+        return None
+
+
+def complete(key: str, response: requests.Response) -> None:
+    """Record definitive outcome, or release claim so the call can be retried
+
+    Server errors, rate limits and auth failures are not definitive.
+    """
+    try:
+        if response.status_code >= 500 or response.status_code in (401, 429):
+            release(key)
+            return
+
+        get_redis_client().setex(
+            _redis_key(key),
+            IDEMPOTENCY_TTL,
+            json.dumps({
+                "status_code": response.status_code,
+                "content_type": response.headers.get("Content-Type", "application/json"),
+                "body": response.text
+            })
+        )
+    except Exception as e:
+        logger.warning(f"Failed to record idempotent outcome: {str(e)}")
+
+
+def release(key: str) -> None:
+    """Drop claim without recording outcome"""
+    try:
+        redis_client = get_redis_client()
+        if redis_client.get(_redis_key(key)) == PENDING:
+            redis_client.delete(_redis_key(key))
+    except Exception as e:
+        logger.warning(f"Failed to release idempotency claim: {str(e)}")
+
+
+def _to_response(recorded: Dict[str, Any]) -> requests.Response:
+    """Rebuild response from recorded outcome"""
+    response = requests.Response()
+    response.status_code = recorded["status_code"]
+    response.headers["Content-Type"] = recorded["content_type"]
+    response._content = recorded["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    return response
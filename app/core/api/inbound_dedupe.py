@@ -0,0 +1,90 @@
+"""Inbound message deduplication
+
+Meta redelivers a webhook when our 200 is slow, and each redelivery would run
+the whole flow again. Every inbound message is claimed by its WhatsApp message
+ID (wamid) before the flow runs:
+- The first delivery claims the ID with SET NX for INBOUND_PROCESSING_TTL,
+  extended to INBOUND_DEDUPE_TTL once its turn completes
+- Later deliveries of the same ID, including ones arriving while the first is
+  still processing, are acknowledged without processing
+- A claim is released if processing fails, so Meta's retry gets another try;
+  a turn lost without failing (e.g. a worker killed mid-turn) lets its claim
+  expire after INBOUND_PROCESSING_TTL
+
+Fails open - if Redis is unavailable messages are processed as usual.
+
+Reported metrics:
+- inbound_messages_total{outcome} -> new / duplicate messages
+"""
+
+import logging
+
+from config.timing import INBOUND_DEDUPE_TTL, INBOUND_PROCESSING_TTL
+from core import metrics
+from core.state.persistence.async_client import get_async_redis_client
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+INBOUND_DEDUPE_KEY_PREFIX = "inbound_message"
+
+
+def _redis_key(message_id: str) -> str:
+    """Get Redis key for message ID"""
+    return f"{INBOUND_DEDUPE_KEY_PREFIX}:{message_id}"
+
+
+def _claimed(message_id: str, claimed: bool) -> bool:
+    """Log claim outcome"""
+    if not claimed and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Dropping repeat delivery of message {message_id}")
+    return claimed
+
+
+def claim(message_id: str) -> bool:
+    """Claim inbound message for processing
+
+    Args:
+        message_id: Channel message ID (e.g. wamid)
+
+    Returns:
+        bool: False if the message was already delivered
+    """
+    try:
+        claimed = bool(get_redis_client().set(_redis_key(message_id), "1", nx=True, ex=INBOUND_PROCESSING_TTL))
+    except Exception as e:
+        logger.warning(f"Inbound dedupe unavailable: {str(e)}")
+        return True
+
+    metrics.increment("inbound_messages_total", labels={"outcome": "new" if claimed else "duplicate"})
+    return _claimed(message_id, claimed)
+
+
+async def aclaim(message_id: str) -> bool:
+    """Claim inbound message for processing from the event loop (see claim)"""
+    try:
+        claimed = bool(
+            await get_async_redis_client().set(_redis_key(message_id), "1", nx=True, ex=INBOUND_PROCESSING_TTL)
+        )
+    except Exception as e:
+        logger.warning(f"Inbound dedupe unavailable: {str(e)}")
+        return True
+
+    await metrics.aincrement("inbound_messages_total", labels={"outcome": "new" if claimed else "duplicate"})
+    return _claimed(message_id, claimed)
+
+
+def complete(message_id: str) -> None:
+    """Keep claim for INBOUND_DEDUPE_TTL once message's turn has completed"""
+    try:
+        get_redis_client().set(_redis_key(message_id), "1", ex=INBOUND_DEDUPE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to complete inbound message claim: {str(e)}")
+
+
+def release(message_id: str) -> None:
+    """Release claim so a redelivery is processed"""
+    try:
+        get_redis_client().delete(_redis_key(message_id))
+    except Exception as e:
+        logger.warning(f"Failed to release inbound message claim: {str(e)}")
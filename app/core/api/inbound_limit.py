@@ -0,0 +1,108 @@
+"""Inbound per-member rate limiting
+
+Every accepted message loads state and runs the flow, often with credex-core
+calls. A member (or bot) flooding the number is shed before any of that:
+- A sliding window log per channel ID allows MAX_REQUESTS_PER_WINDOW messages
+  per RATE_LIMIT_WINDOW
+- The check is a single Lua script, so a throttled message costs one Redis op
+- The first throttled message in a window gets THROTTLED_MESSAGE, the rest are
+  dropped silently
+
+Fails open - if Redis is unavailable messages are processed as usual.
+
+Reported metrics:
+- inbound_throttled_senders_total -> senders throttled, once per window
+"""
+
+import logging
+import uuid
+from typing import Tuple
+
+from config.timing import MAX_REQUESTS_PER_WINDOW, RATE_LIMIT_WINDOW
+from core import metrics
+from core.state.persistence.async_client import get_async_redis_client
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+INBOUND_LIMIT_KEY_PREFIX = "inbound_limit"
+
+THROTTLED_MESSAGE = "⏳ You're sending messages faster than we can handle them. Please wait a minute, then try again."
+
+# Uses the Redis clock so workers agree on the window.
+# KEYS: window log sorted set, notified flag
+# ARGV: window (ms), limit, entry ID
+# Returns: {allowed (0/1), notify (0/1)}
+_CHECK_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, 0}
+end
+if redis.call('SET', KEYS[2], '1', 'NX', 'PX', window) then
+    return {0, 1}
+end
+return {0, 0}
+"""
+
+_check = None
+_acheck = None
+
+
+def _keys(channel_id: str) -> list:
+    """Get Redis keys for channel"""
+    return [
+        f"{INBOUND_LIMIT_KEY_PREFIX}:{channel_id}",
+        f"{INBOUND_LIMIT_KEY_PREFIX}:{channel_id}:notified"
+    ]
+
+
+def _args() -> list:
+    """Get script arguments for a new message"""
+    return [RATE_LIMIT_WINDOW * 1000, MAX_REQUESTS_PER_WINDOW, uuid.uuid4().hex]
+
+
+def check(channel_id: str) -> Tuple[bool, bool]:
+    """Record inbound message and check it is within the member's limit
+
+    Args:
+        channel_id: Channel identifier (e.g. wa_id)
+
+    Returns:
+        Tuple[bool, bool]: Whether to process the message, and whether to send
+        THROTTLED_MESSAGE for a rejected one
+    """
+    global _check
+    try:
+        if _check is None:
+            _check = get_redis_client().register_script(_CHECK_SCRIPT)
+        allowed, notify = _check(keys=_keys(channel_id), args=_args())
+    except Exception as e:
+        logger.warning(f"Inbound rate limiter unavailable: {str(e)}")
+        return True, False
+
+    if notify:
+        metrics.increment("inbound_throttled_senders_total")
+        logger.warning(f"Throttling inbound messages from {channel_id}")
+    return bool(allowed), bool(notify)
+
+
+async def acheck(channel_id: str) -> Tuple[bool, bool]:
+    """Record inbound message and check limit from the event loop (see check)"""
+    global _acheck
+    try:
+        if _acheck is None:
+            _acheck = get_async_redis_client().register_script(_CHECK_SCRIPT)
+        allowed, notify = await _acheck(keys=_keys(channel_id), args=_args())
+    except Exception as e:
+        logger.warning(f"Inbound rate limiter unavailable: {str(e)}")
+        return True, False
+
+    if notify:
+        await metrics.aincrement("inbound_throttled_senders_total")
+        logger.warning(f"Throttling inbound messages from {channel_id}")
+    return bool(allowed), bool(notify)
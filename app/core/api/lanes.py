@@ -0,0 +1,207 @@
+"""Priority lanes for work run off the request thread
+
+Member turns, notification sends, status processing and background refreshes
+would otherwise share threads first come, first served, so a batch of
+notifications from credex-core delays live conversations. Work is submitted
+to a lane instead and run by one shared pool of LANE_THREADS threads per
+process:
+- Each lane has its own queue and concurrency limit, so no lane can take
+  every thread
+- Free threads pick the next lane by smooth weighted round robin over lanes
+  with queued work and spare capacity - interactive turns get most turns
+  under load, but every lane keeps moving
+- Threads are started as work arrives, up to LANE_THREADS
+- Queue depths are reported by a separate thread, woken when work is queued
+  or started, so submit stays free of I/O
+
+Lanes:
+- interactive -> member turns (ASGI mode)
+- notification -> credex-core notification sends and fixed notices (throttled,
+  busy)
+- status -> delivery status batches
+- maintenance -> token refreshes and cache prefetches
+
+Reported metrics:
+- lane_queue_depth{lane} -> tasks queued, at most every DEPTH_REPORT_INTERVAL
+- lane_wait_seconds{lane} -> time from submit to start
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from django.conf import settings
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+NOTIFICATION = "notification"
+STATUS = "status"
+MAINTENANCE = "maintenance"
+
+# Lane -> (weight, concurrency limit); None limit means the whole pool
+LANES: Dict[str, Tuple[int, Optional[int]]] = {
+    INTERACTIVE: (8, None),
+    NOTIFICATION: (3, 16),
+    STATUS: (2, 2),
+    MAINTENANCE: (1, 4),
+}
+
+# Queue wait buckets in seconds
+WAIT_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+DEPTH_REPORT_INTERVAL = 1  # seconds
+
+
+class _Lane:
+    """Queue and scheduling state for one lane"""
+
+    __slots__ = ("name", "weight", "limit", "queue", "running", "current")
+
+    def __init__(self, name: str, weight: int, limit: int):
+        self.name = name
+        self.weight = weight
+        self.limit = limit
+        self.queue: Deque[Tuple[float, Future, Callable, tuple]] = deque()
+        self.running = 0
+        self.current = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether lane has work it may start now"""
+        return bool(self.queue) and self.running < self.limit
+
+
+class LaneScheduler:
+    """Thread pool running queued work by lane priority"""
+
+    def __init__(self, threads: int):
+        self._max_threads = threads
+        self._threads = 0
+        self._idle = 0
+        self._condition = threading.Condition()
+        self._depth_changed = threading.Event()
+        self._reporter: Optional[threading.Thread] = None
+        self._lanes = {
+            name: _Lane(name, weight, min(limit or threads, threads))
+            for name, (weight, limit) in LANES.items()
+        }
+
+    def submit(self, lane: str, fn: Callable, *args: Any) -> Future:
+        """Queue call on lane
+
+        Does no I/O, so it is safe to call from the event loop.
+
+        Returns:
+            Future: Resolves with the call's result or exception
+        """
+        future: Future = Future()
+        with self._condition:
+            self._lanes[lane].queue.append((time.monotonic(), future, fn, args))
+            if self._reporter is None:
+                self._reporter = threading.Thread(
+                    target=self._report_depths, name="lane-depths", daemon=True
+                )
+                self._reporter.start()
+            if self._idle:
+                self._condition.notify()
+            elif self._threads < self._max_threads:
+                self._threads += 1
+                threading.Thread(
+                    target=self._work, name=f"lane-{self._threads}", daemon=True
+                ).start()
+        self._depth_changed.set()
+        return future
+
+    def saturation(self, lane: str) -> float:
+        """Get share of lane's concurrency limit running work"""
+        with self._condition:
+            return self._lanes[lane].running / self._lanes[lane].limit
+
+    def _next(self) -> Optional[_Lane]:
+        """Pick lane to run next (smooth weighted round robin), lock held"""
+        chosen = None
+        total = 0
+        for lane in self._lanes.values():
+            if not lane.ready:
+                continue
+            lane.current += lane.weight
+            total += lane.weight
+            if chosen is None or lane.current > chosen.current:
+                chosen = lane
+        if chosen is not None:
+            chosen.current -= total
+        return chosen
+
+    def _work(self) -> None:
+        """Run queued work until the process exits"""
+        while True:
+            with self._condition:
+                lane = self._next()
+                while lane is None:
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                    lane = self._next()
+                queued_at, future, fn, args = lane.queue.popleft()
+                lane.running += 1
+
+            self._depth_changed.set()
+            metrics.observe(
+                "lane_wait_seconds",
+                time.monotonic() - queued_at,
+                labels={"lane": lane.name},
+                buckets=WAIT_BUCKETS
+            )
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            with self._condition:
+                lane.running -= 1
+                # Lane may have held back work at its limit
+                if lane.queue and self._idle:
+                    self._condition.notify()
+
+    def _report_depths(self) -> None:
+        """Report queue depths after changes until the process exits"""
+        while True:
+            self._depth_changed.wait()
+            self._depth_changed.clear()
+            with self._condition:
+                depths = {name: len(lane.queue) for name, lane in self._lanes.items()}
+            for name, depth in depths.items():
+                metrics.set_gauge("lane_queue_depth", float(depth), labels={"lane": name})
+            time.sleep(DEPTH_REPORT_INTERVAL)
+
+
+_scheduler: Optional[LaneScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LaneScheduler:
+    """Get scheduler for this process"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LaneScheduler(settings.LANE_THREADS)
+    return _scheduler
+
+
+def submit(lane: str, fn: Callable, *args: Any) -> Future:
+    """Queue call on lane of this process's scheduler (see LaneScheduler.submit)"""
+    return get_scheduler().submit(lane, fn, *args)
+
+
+def saturation(lane: str) -> float:
+    """Get share of lane's limit in use in this process (0 before any work)"""
+    return _scheduler.saturation(lane) if _scheduler is not None else 0.0
@@ -0,0 +1,160 @@
+"""Ledger page cache
+
+Caches getLedger responses per account so paging back and forth through the
+ledger does not hit credex-core again:
+- Pages are keyed by (accountID, startRow, numRows) in one Redis hash per account
+- The whole account is invalidated when a credex action changes it, for the
+  acting member and every counterparty account the action names, and when a
+  dashboard merge finds its content changed (see core.state.dashboard)
+- The next page is prefetched on the maintenance lane while the member reads the current one
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional, Set
+
+import requests
+from config.timing import API_TIMEOUT, LEDGER_CACHE_TTL
+from core.state.persistence.client import get_redis_client
+
+from . import lanes
+
+logger = logging.getLogger(__name__)
+
+LEDGER_KEY_PREFIX = "ledger"
+
+# Action types that change an account's ledger
+LEDGER_CHANGING_ACTIONS = {
+    "CREDEX_CREATED",
+    "CREDEX_ACCEPTED",
+    "CREDEX_DECLINED",
+    "CREDEX_CANCELLED",
+    "HUSTLER_10K_ENROLLED",
+    "RECURRING_CREATED"
+}
+
+
+def _key(account_id: str) -> str:
+    """Get Redis hash key for account ledger pages"""
+    return f"{LEDGER_KEY_PREFIX}:{account_id}"
+
+
+def _field(start_row: int, num_rows: int) -> str:
+    """Get Redis hash field for ledger page"""
+    return f"{start_row}:{num_rows}"
+
+
+def get_page(account_id: str, start_row: int, num_rows: int) -> Optional[Dict[str, Any]]:
+    """Get cached ledger page response
+
+    Args:
+        account_id: Account ID
+        start_row: First row of page
+        num_rows: Rows per page
+
+    Returns:
+        Optional[Dict[str, Any]]: Cached API response data, None on miss
+    """
+    try:
+        cached = get_redis_client().hget(_key(account_id), _field(start_row, num_rows))
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"Failed to read ledger cache: {str(e)}")
+        return None
+
+
+def store_page(account_id: str, start_row: int, num_rows: int, response_data: Dict[str, Any]) -> None:
+    """Cache ledger page response
+
+    Args:
+        account_id: Account ID
+        start_row: First row of page
+        num_rows: Rows per page
+        response_data: Processed API response data
+    """
+    try:
+        redis_client = get_redis_client()
+        pipe = redis_client.pipeline()
+        pipe.hset(_key(account_id), _field(start_row, num_rows), json.dumps(response_data))
+        pipe.expire(_key(account_id), LEDGER_CACHE_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to write ledger cache: {str(e)}")
+
+
+def changed_accounts(action: Dict[str, Any]) -> Set[str]:
+    """Get account IDs named in credex action details (issuer, receiver, counterparty)"""
+    details = action.get("details") or {}
+    if not isinstance(details, dict):
+        return set()
+    return {
+        value for key, value in details.items()
+        if key.endswith("AccountID") and isinstance(value, str) and value
+    }
+
+
+def invalidate(account_id: str) -> None:
+    """Drop all cached ledger pages for account"""
+    try:
+        get_redis_client().delete(_key(account_id))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Invalidated ledger cache for account {account_id}")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate ledger cache: {str(e)}")
+
+
+def prefetch_page(
+    account_id: str,
+    start_row: int,
+    num_rows: int,
+    url: str,
+    headers: Dict[str, str]
+) -> None:
+    """Fetch ledger page into cache on the maintenance lane
+
+    Headers are resolved by the caller so the prefetch never touches
+    member state.
+
+    Args:
+        account_id: Account ID
+        start_row: First row of page to prefetch
+        num_rows: Rows per page
+        url: Absolute getLedger URL
+        headers: Authenticated request headers
+    """
+    try:
+        if get_redis_client().hexists(_key(account_id), _field(start_row, num_rows)):
+            return
+    except Exception as e:
+        logger.warning(f"Failed to check ledger cache: {str(e)}")
+        return
+
+    def run():
+        # Imported here to avoid circular imports
+        from .base import process_api_response
+
+        try:
+            response = requests.post(
+                url,
+                json={
+                    "accountID": account_id,
+                    "startRow": start_row,
+                    "numRows": num_rows
+                },
+                headers=headers,
+                timeout=API_TIMEOUT
+            )
+            if response.status_code != 200:
+                logger.info(f"Ledger prefetch returned {response.status_code}")
+                return
+
+            response_data = process_api_response(response)
+            action_type = response_data.get("data", {}).get("action", {}).get("type")
+            if action_type == "LEDGER_RETRIEVED":
+                store_page(account_id, start_row, num_rows, response_data)
+                logger.info(f"Prefetched ledger page {start_row} for account {account_id}")
+
+        except Exception as e:
+            logger.warning(f"Ledger prefetch failed: {str(e)}")
+
+    lanes.submit(lanes.MAINTENANCE, run)
@@ -0,0 +1,240 @@
+"""Overload controller
+
+Without shedding, a slow credex-core or Graph API backs turns up until
+gunicorn times workers out and Meta starts redelivering, making the backlog
+worse. Each process watches its own turns and, when overloaded, stops taking
+on new conversations:
+- Signals are p95 turn latency over the last OVERLOAD_WINDOW seconds, plus
+  the following where turns can queue:
+  - p95 queue age (webhook receipt to turn start) - ASGI workers queue turns
+    on the interactive lane, dispatched turns wait on flow worker partitions
+  - saturation - share of the interactive lane's limit running turns (ASGI)
+- Shedding starts when any signal crosses its high mark, and stops once every
+  signal has stayed under its low mark for OVERLOAD_RECOVERY_PERIOD
+- While shedding, members without live state get BUSY_MESSAGE instead of a
+  turn; members mid-flow carry on
+- Turns that waited past OVERLOAD_TURN_DEADLINE are dropped whatever the state
+
+Sync (WSGI) workers run each turn inline on the request thread, one at a
+time, and stamp receipt on that same thread - there is no in-process queue
+or spare concurrency to measure, so latency is their only signal.
+
+In dispatcher mode web processes run no turns, so a sampler thread feeds
+them the age of the oldest turn waiting on any flow worker partition (see
+core.api.dispatch.partition_lag) as the queue age.
+
+Reported metrics:
+- overload_state{host, pid} -> 1 while shedding, 0 otherwise
+- overload_shed_total{reason} -> turns shed (busy, stale)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from django.conf import settings
+
+from config.timing import (OVERLOAD_LATENCY_HIGH, OVERLOAD_LATENCY_LOW,
+                           OVERLOAD_QUEUE_AGE_HIGH, OVERLOAD_QUEUE_AGE_LOW,
+                           OVERLOAD_RECOVERY_PERIOD, OVERLOAD_TURN_DEADLINE)
+from core import metrics
+from core.messaging.inbound import InboundMessage
+from core.state.persistence.async_client import get_async_redis_client
+from core.state.persistence.client import get_redis_client
+
+from . import dispatch, lanes
+
+logger = logging.getLogger(__name__)
+
+BUSY_MESSAGE = "⏳ We're very busy right now. Please try again in a minute."
+
+OVERLOAD_WINDOW = 60  # seconds of turns considered
+MAX_SAMPLES = 1000
+EVALUATE_INTERVAL = 1  # seconds
+PARTITION_SAMPLE_INTERVAL = 1  # seconds
+
+# Share of interactive lane limit running turns
+SATURATION_HIGH = 0.9
+SATURATION_LOW = 0.7
+
+NORMAL = "normal"
+SHEDDING = "shedding"
+
+
+def _p95(values: List[float]) -> float:
+    """Get 95th percentile, 0 if no values"""
+    if not values:
+        return 0.0
+    values.sort()
+    return values[min(len(values) - 1, int(len(values) * 0.95))]
+
+
+class OverloadController:
+    """Shedding state for this process, with hysteresis"""
+
+    def __init__(self):
+        self.state = NORMAL
+        self._lock = threading.Lock()
+        # (finished at, queue age, duration) per turn
+        self._turns: Deque[Tuple[float, float, float]] = deque(maxlen=MAX_SAMPLES)
+        self._calm_since = 0.0
+        self._evaluated_at = 0.0
+        self._host = socket.gethostname()
+        # Oldest waiting dispatched turn, seconds (dispatcher mode)
+        self.partition_lag = 0.0
+
+    def record_turn(self, queue_age: float, duration: float) -> None:
+        """Record finished turn, reporting state at most once per interval"""
+        now = time.monotonic()
+        with self._lock:
+            self._turns.append((now, queue_age, duration))
+        if self._evaluate(now):
+            self._report()
+
+    def is_shedding(self, report: bool = True) -> bool:
+        """Whether new conversations are being turned away
+
+        Args:
+            report: Whether to report state when re-evaluated - pass False on
+                the event loop, where this then does no I/O
+        """
+        if self._evaluate(time.monotonic()) and report:
+            self._report()
+        return self.state == SHEDDING
+
+    def _report(self) -> None:
+        """Report current state"""
+        metrics.set_gauge(
+            "overload_state",
+            1.0 if self.state == SHEDDING else 0.0,
+            labels={"host": self._host, "pid": str(os.getpid())}
+        )
+
+    def _evaluate(self, now: float) -> bool:
+        """Update state from recent turns, False if evaluated too recently"""
+        if now - self._evaluated_at < EVALUATE_INTERVAL:
+            return False
+        with self._lock:
+            if now - self._evaluated_at < EVALUATE_INTERVAL:
+                return False
+            self._evaluated_at = now
+
+            while self._turns and now - self._turns[0][0] > OVERLOAD_WINDOW:
+                self._turns.popleft()
+            # Turns only queue on lanes (ASGI) or flow worker partitions (dispatch)
+            lane_turns = settings.SERVER_MODE == "asgi"
+            queue_age = self.partition_lag
+            if lane_turns or settings.FLOW_DISPATCH:
+                queue_age = max(_p95([turn[1] for turn in self._turns]), queue_age)
+            latency = _p95([turn[2] for turn in self._turns])
+            saturation = lanes.saturation(lanes.INTERACTIVE) if lane_turns else 0.0
+
+            previous = self.state
+            if (
+                queue_age > OVERLOAD_QUEUE_AGE_HIGH
+                or latency > OVERLOAD_LATENCY_HIGH
+                or saturation > SATURATION_HIGH
+            ):
+                self.state = SHEDDING
+                self._calm_since = 0.0
+            elif (
+                queue_age < OVERLOAD_QUEUE_AGE_LOW
+                and latency < OVERLOAD_LATENCY_LOW
+                and saturation < SATURATION_LOW
+            ):
+                if not self._calm_since:
+                    self._calm_since = now
+                if self.state == SHEDDING and now - self._calm_since >= OVERLOAD_RECOVERY_PERIOD:
+                    self.state = NORMAL
+            else:
+                self._calm_since = 0.0
+
+        if self.state != previous:
+            logger.warning(
+                f"Overload state {previous} -> {self.state} "
+                f"(queue age p95 {queue_age:.1f}s, latency p95 {latency:.1f}s, saturation {saturation:.0%})"
+            )
+        return True
+
+
+controller = OverloadController()
+
+_sampler: Optional[threading.Thread] = None
+_sampler_lock = threading.Lock()
+
+
+def _sample_partitions() -> None:
+    """Feed dispatch partition lag to the controller until the process exits"""
+    while True:
+        try:
+            controller.partition_lag = dispatch.partition_lag()
+        except Exception as e:
+            logger.warning(f"Failed to sample flow partition lag: {str(e)}")
+            controller.partition_lag = 0.0
+        controller.is_shedding()
+        time.sleep(PARTITION_SAMPLE_INTERVAL)
+
+
+def _ensure_sampler() -> None:
+    """Start partition lag sampler in this process if dispatching and not running"""
+    global _sampler
+    if not settings.FLOW_DISPATCH or (_sampler is not None and _sampler.is_alive()):
+        return
+    with _sampler_lock:
+        if _sampler is not None and _sampler.is_alive():
+            return
+        _sampler = threading.Thread(target=_sample_partitions, name="flow-partition-lag", daemon=True)
+        _sampler.start()
+
+
+def _state_key(inbound: InboundMessage) -> str:
+    """Get Redis key of member's channel state"""
+    return f"channel:{inbound.channel_id}"
+
+
+def should_shed(inbound: InboundMessage) -> bool:
+    """Whether to answer message with BUSY_MESSAGE instead of a turn
+
+    Only checks the member's state (one EXISTS) while shedding. Fails open.
+    """
+    _ensure_sampler()
+    if not controller.is_shedding():
+        return False
+    try:
+        if get_redis_client().exists(_state_key(inbound)):
+            return False
+    except Exception as e:
+        logger.warning(f"Failed to check conversation state: {str(e)}")
+        return False
+
+    metrics.increment("overload_shed_total", labels={"reason": "busy"})
+    return True
+
+
+async def ashould_shed(inbound: InboundMessage) -> bool:
+    """Whether to answer message with BUSY_MESSAGE from the event loop (see should_shed)"""
+    _ensure_sampler()
+    if not controller.is_shedding(report=False):
+        return False
+    try:
+        if await get_async_redis_client().exists(_state_key(inbound)):
+            return False
+    except Exception as e:
+        logger.warning(f"Failed to check conversation state: {str(e)}")
+        return False
+
+    await metrics.aincrement("overload_shed_total", labels={"reason": "busy"})
+    return True
+
+
+def is_stale(inbound: InboundMessage) -> bool:
+    """Whether turn waited past its deadline and should be dropped"""
+    if inbound.received_at is None or time.time() - inbound.received_at <= OVERLOAD_TURN_DEADLINE:
+        return False
+    metrics.increment("overload_shed_total", labels={"reason": "stale"})
+    logger.warning(f"Dropping turn queued for {time.time() - inbound.received_at:.0f}s")
+    return True
@@ -0,0 +1,144 @@
+"""API response projection
+
+Trims credex-core responses down to the fields components actually read before
+they enter state. Everything stored in state is re-validated, JSON-encoded and
+written to Redis on every later mutation, so unused fields cost us on every turn.
+
+Projections are driven by declared field specs:
+- True keeps the value as-is
+- A dict keeps only the listed keys, projecting each with its own spec
+- A single-item list projects every list item with that item's spec
+
+Add a field here before reading it from state in a component.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pending offer fields used by offer list and dashboard components
+OFFER_FIELDS = {
+    "credexID": True,
+    "formattedInitialAmount": True,
+    "counterpartyAccountName": True
+}
+
+# Dashboard fields used by components
+DASHBOARD_FIELDS = {
+    "member": {
+        "memberID": True,
+        "memberTier": True,
+        "firstname": True,
+        "lastname": True,
+        "memberHandle": True,
+        "defaultDenom": True,
+        "remainingAvailableUSD": True
+    },
+    "accounts": [{
+        "accountID": True,
+        "accountName": True,
+        "accountHandle": True,
+        "accountType": True,
+        "defaultDenom": True,
+        "isOwnedAccount": True,
+        "balanceData": True,
+        "pendingInData": [OFFER_FIELDS],
+        "pendingOutData": [OFFER_FIELDS]
+    }]
+}
+
+# Action fields used for flow control and display
+ACTION_FIELDS = {
+    "id": True,
+    "type": True,
+    "timestamp": True,
+    "actor": True,
+    "details": {
+        # Account lookups (ValidateAccountApiCall -> ConfirmOfferSecured/CreateCredexApiCall)
+        "accountID": True,
+        "accountName": True,
+        "accountHandle": True,
+        # Error reporting
+        "code": True,
+        "reason": True,
+        "message": True,
+        "field": True,
+        # Member tier upgrades
+        "previousTier": True,
+        "newTier": True
+    }
+}
+
+
+def project(value: Any, spec: Any) -> Any:
+    """Project value onto field spec
+
+    Args:
+        value: Value to project
+        spec: Field spec (True, dict or single-item list)
+
+    Returns:
+        Projected copy of value (values of unexpected type are kept as-is)
+    """
+    if spec is True:
+        return value
+
+    if isinstance(spec, dict) and isinstance(value, dict):
+        return {
+            key: project(value[key], field_spec)
+            for key, field_spec in spec.items()
+            if key in value
+        }
+
+    if isinstance(spec, list) and isinstance(value, list):
+        return [project(item, spec[0]) for item in value]
+
+    return value
+
+
+def project_with_report(value: Any, spec: Any, name: str) -> Tuple[Any, int]:
+    """Project value and report bytes dropped
+
+    Args:
+        value: Value to project
+        spec: Field spec
+        name: Section name for logging
+
+    Returns:
+        Tuple[Any, int]: Projected value and bytes dropped (0 when not measured)
+    """
+    projected = project(value, spec)
+
+    dropped = 0
+    if logger.isEnabledFor(logging.INFO):
+        dropped = _encoded_size(value) - _encoded_size(projected)
+        logger.info(f"Projected {name}: dropped {dropped} bytes")
+
+    return projected, dropped
+
+
+def project_response_data(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Project dashboard and action sections of API response data
+
+    Args:
+        data: Data section of API response
+
+    Returns:
+        Tuple[Dict[str, Any], int]: Projected sections and total bytes dropped
+    """
+    projected = {}
+    total_dropped = 0
+
+    for section, spec in (("dashboard", DASHBOARD_FIELDS), ("action", ACTION_FIELDS)):
+        if section in data:
+            projected[section], dropped = project_with_report(data[section], spec, section)
+            total_dropped += dropped
+
+    return projected, total_dropped
+
+
+def _encoded_size(value: Any) -> int:
+    """Get size of value as stored in Redis"""
+    return len(json.dumps(value).encode("utf-8"))
@@ -1,23 +1,24 @@
 """Cloud API webhook views"""
+import hmac
+import json
 import logging
 import sys
+import time
 
-from core.messaging.service import MessagingService
+from core import metrics
+from core.api import lanes, webhook
 from core.messaging.types import Message as DomainMessage
 from core.messaging.types import MessageRecipient, TemplateContent
-from core.state.manager import StateManager
 from core.state.persistence.client import get_redis_client
 from core.state.persistence.redis_operations import RedisAtomic
 from decouple import config
+from django.conf import settings
 from django.core.cache import cache
 from django.http import HttpResponse, JsonResponse
 from rest_framework import status
 from rest_framework.parsers import JSONParser
 from rest_framework.views import APIView
-from services.whatsapp.flow_processor import WhatsAppFlowProcessor
 from services.whatsapp.service import WhatsAppMessagingService
-from services.whatsapp.state_manager import \
-    StateManager as WhatsAppStateManager
 
 # Configure logging with a standardized format
 logging.basicConfig(
@@ -100,166 +101,54 @@ class HealthCheck(APIView):
             )
 
 
-def get_messaging_service(state_manager, channel_type: str):
-    """Get properly initialized messaging service with state and channel
+class Metrics(APIView):
+    """Metrics endpoint in Prometheus text format
 
-    Args:
-        state_manager: State manager instance
-        channel_type: Type of messaging channel ("whatsapp", "sms")
-
-    Returns:
-        MessagingService: Initialized messaging service
+    Requires "Authorization: Bearer <METRICS_TOKEN>".
     """
-    # Create channel-specific service based on type
-    if channel_type == "whatsapp":
-        channel_service = WhatsAppMessagingService()
-    elif channel_type == "sms":
-        # TODO: Implement SMS service
-        raise NotImplementedError("SMS channel not yet implemented")
-    else:
-        raise ValueError(f"Unsupported channel type: {channel_type}")
+    permission_classes = []
+    throttle_classes = []
 
-    # Create core messaging service with channel service and state
-    messaging_service = MessagingService(
-        channel_service=channel_service,
-        state_manager=state_manager
-    )
+    @staticmethod
+    def get(request):
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not settings.METRICS_TOKEN or not hmac.compare_digest(
+            request.headers.get("Authorization", "").encode("utf-8"), expected.encode("utf-8")
+        ):
+            return HttpResponse(status=status.HTTP_403_FORBIDDEN)
 
-    return messaging_service
+        try:
+            return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4")
+        except Exception as e:
+            logger.error(f"Error rendering metrics: {str(e)}")
+            return HttpResponse(status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 class CredexCloudApiWebhook(APIView):
-    """Cloud Api Webhook"""
+    """Cloud Api Webhook
+
+    POSTs are normally answered by the WSGI fast path (see core.api.wsgi)
+    before reaching Django; this view handles them when served without it.
+    """
 
     permission_classes = []
     parser_classes = (JSONParser,)
     throttle_classes = []  # Disable throttling for webhook endpoint
 
-    @staticmethod
-    def _extract_whatsapp_info(value: dict, is_mock_testing: bool) -> tuple[str, str] | None:
-        """Extract WhatsApp channel info from payload"""
-        # Validate WhatsApp value
-        if not is_mock_testing:
-            metadata = value.get("metadata", {})
-            if not metadata or metadata.get("phone_number_id") != config("WHATSAPP_PHONE_NUMBER_ID"):
-                return None
-
-        # Skip status updates
-        if value.get("statuses"):
-            return None
-
-        # Get contact info
-        contacts = value.get("contacts", [])
-        if not contacts:
-            return None
-
-        contact = contacts[0]
-        if not isinstance(contact, dict):
-            return None
-
-        channel_id = contact.get("wa_id")
-        if not channel_id:
-            return None
-
-        return "whatsapp", channel_id
-
-    @staticmethod
-    def _extract_channel_info(value: dict, is_mock_testing: bool) -> tuple[str, str] | None:
-        """Extract channel info from payload"""
-        if "messaging_product" in value and value["messaging_product"] == "whatsapp":
-            return CredexCloudApiWebhook._extract_whatsapp_info(value, is_mock_testing)
-        return None
-
     @staticmethod
     def post(request):
         try:
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Processing webhook request")
-
-            # Validate basic webhook structure
-            if not isinstance(request.data, dict):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            entries = request.data.get("entry", [])
-            if not entries or not isinstance(entries, list):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            changes = entries[0].get("changes", [])
-            if not changes or not isinstance(changes, list):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            # Get mock testing flag from header
-            is_mock_testing = request.headers.get('X-Mock-Testing') == 'true'
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Mock testing: {is_mock_testing}")
-
-            # Get and validate the raw payload value
-            value = changes[0].get("value", {})
-            if not value or not isinstance(value, dict):
-                logger.debug("Invalid or empty value object")
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            # Add mock testing flag to value metadata if header present
-            if is_mock_testing:
-                value.setdefault("metadata", {})["mock_testing"] = True
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"Updated value metadata: {value.get('metadata')}")
-
-            # Extract channel info from payload
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Extracting channel info from value: {value}")
-            channel_info = CredexCloudApiWebhook._extract_channel_info(value, is_mock_testing)
-            if not channel_info:
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            channel_type, channel_id = channel_info
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Extracted channel info - type: {channel_type}, id: {channel_id}")
-
-            # Initialize state managers
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Initializing state managers")
-            core_state_manager = StateManager(f"channel:{channel_id}")
-            state_manager = (
-                WhatsAppStateManager(core_state_manager)
-                if channel_type == "whatsapp"
-                else core_state_manager
-            )
-
-            # Initialize channel state with proper enum type
-            state_manager.initialize_channel(
-                channel_type=channel_type,
-                channel_id=channel_id,
-                mock_testing=is_mock_testing
-            )
-
-            try:
-                # Get messaging service for channel
-                service = get_messaging_service(state_manager, channel_type)
-
-                # Create flow processor for channel type
-                if channel_type == "whatsapp":
-                    flow_processor = WhatsAppFlowProcessor(service, state_manager)
-                else:
-                    raise ValueError(f"Unsupported channel type: {channel_type}")
-
-                # Process message - component handles its own messaging
-                flow_processor.process_message(request.data)
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            except Exception as e:
-                logger.error(f"Message processing error: {str(e)}")
-                return JsonResponse(
-                    {"error": str(e)},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-
+            data = request.data
         except Exception as e:
             logger.error(f"Webhook error: {str(e)}")
             return JsonResponse(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+        is_mock_testing = request.headers.get('X-Mock-Testing') == 'true'
+        status_code, body = webhook.handle(data, is_mock_testing)
+        return JsonResponse(body, status=status_code)
+
     def get(self, request, *args, **kwargs):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Webhook verification request")
@@ -279,19 +168,81 @@ class WipeCache(APIView):
         return JsonResponse({"message": "Success"}, status=status.HTTP_200_OK)
 
 
+NOTIFY_FAILURES_KEY = "notify:failures"
+MAX_NOTIFY_FAILURES = 1000  # most recent failures kept
+
+
+def _record_notification_failure(message: DomainMessage, error: str) -> None:
+    """Keep failed queued notification for GET /bot/notify"""
+    logger.error(f"Message sending error: {error}")
+    metrics.increment("notify_failures_total")
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.lpush(NOTIFY_FAILURES_KEY, json.dumps({
+            "phoneNumber": message.recipient.identifier,
+            "error": error,
+            "failedAt": time.time()
+        }))
+        pipe.ltrim(NOTIFY_FAILURES_KEY, 0, MAX_NOTIFY_FAILURES - 1)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record notification failure: {str(e)}")
+
+
+def _send_notification(service, message: DomainMessage) -> None:
+    """Send queued notification, recording failures"""
+    try:
+        sent = service.send_message(message)
+    except Exception as e:
+        _record_notification_failure(message, str(e))
+        return
+    # Channel services report send errors in metadata
+    if sent.metadata and sent.metadata.get("error"):
+        _record_notification_failure(message, str(sent.metadata["error"]))
+
+
+def _valid_api_key(request) -> bool:
+    """Whether request carries the client API key"""
+    return request.headers.get("apiKey", "").lower() == config("CLIENT_API_KEY").lower()
+
+
 class CredexSendMessageWebhook(APIView):
-    """Channel-agnostic message sending webhook"""
+    """Channel-agnostic message sending webhook
+
+    Notifications are sent before answering. With NOTIFY_ASYNC they are
+    queued on the notification lane (see core.api.lanes) and acknowledged
+    with 202 instead, so bulk sends from credex-core neither hold request
+    workers nor delay member turns; GET lists recent failed sends.
+    """
 
     parser_classes = (JSONParser,)
     throttle_classes = []  # Disable throttling for webhook endpoint
 
+    @staticmethod
+    def get(request):
+        """List most recent failed queued notifications"""
+        if not _valid_api_key(request):
+            return JsonResponse(
+                {"status": "error", "message": "Invalid API key"},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        try:
+            failures = [json.loads(failure) for failure in get_redis_client().lrange(NOTIFY_FAILURES_KEY, 0, -1)]
+        except Exception as e:
+            logger.error(f"Error reading notification failures: {str(e)}")
+            return JsonResponse(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        return JsonResponse({"failures": failures}, status=status.HTTP_200_OK)
+
     @staticmethod
     def post(request):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Processing send message request")
 
         # Validate API key
-        if request.headers.get("apiKey", "").lower() != config("CLIENT_API_KEY").lower():
+        if not _valid_api_key(request):
             return JsonResponse(
                 {"status": "error", "message": "Invalid API key"},
                 status=status.HTTP_401_UNAUTHORIZED
@@ -361,6 +312,14 @@ class CredexSendMessageWebhook(APIView):
                 message.metadata = message.metadata or {}
                 message.metadata["mock_testing"] = True
 
+            # Queue send on notification lane
+            if settings.NOTIFY_ASYNC:
+                lanes.submit(lanes.NOTIFICATION, _send_notification, service, message)
+                return JsonResponse(
+                    {"status": "queued", "message": "Notification queued"},
+                    status=status.HTTP_202_ACCEPTED
+                )
+
             # Send through service
             response = service.send_message(message)
             return JsonResponse(response.to_dict(), status=status.HTTP_200_OK)
@@ -0,0 +1,331 @@
+"""Cloud API webhook handling
+
+Shared by the DRF view, the WSGI fast path (see core.api.wsgi) and the ASGI
+entry point (see core.api.asgi), so all behave the same. Works on the parsed
+payload and returns the status code and response body; callers only deal with
+their own request and response types.
+
+Under ASGI, ahandle does the Redis work ahead of the flow (status stream,
+dedupe, rate limit) on the event loop, and runs the flow itself on the
+interactive lane (see core.api.lanes), since components call credex-core and
+the Cloud API synchronously.
+
+In dispatcher mode (FLOW_DISPATCH) both paths forward turns to flow worker
+processes instead of running them (see core.api.dispatch).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+
+from core.api import dispatch, inbound_dedupe, inbound_limit, lanes, overload
+from core.messaging import delivery
+from core.messaging.inbound import InboundMessage
+from core.messaging.service import MessagingService
+from core.messaging.types import Message as DomainMessage
+from core.messaging.types import MessageRecipient, TextContent
+from core.state.manager import StateManager
+from services.whatsapp.flow_processor import WhatsAppFlowProcessor
+from services.whatsapp.inbound import is_own_number, parse_value
+from services.whatsapp.payloads import encode_fixed_text
+from services.whatsapp.service import WhatsAppMessagingService
+from services.whatsapp.state_manager import \
+    StateManager as WhatsAppStateManager
+
+logger = logging.getLogger(__name__)
+
+# Body for every acknowledged delivery - callers may compare by identity
+RECEIVED: Dict[str, Any] = {"message": "received"}
+
+
+def get_messaging_service(state_manager, channel_type: str):
+    """Get properly initialized messaging service with state and channel
+
+    Args:
+        state_manager: State manager instance
+        channel_type: Type of messaging channel ("whatsapp", "sms")
+
+    Returns:
+        MessagingService: Initialized messaging service
+    """
+    # Create channel-specific service based on type
+    if channel_type == "whatsapp":
+        channel_service = WhatsAppMessagingService()
+    elif channel_type == "sms":
+        # TODO: Implement SMS service
+        raise NotImplementedError("SMS channel not yet implemented")
+    else:
+        raise ValueError(f"Unsupported channel type: {channel_type}")
+
+    # Create core messaging service with channel service and state
+    messaging_service = MessagingService(
+        channel_service=channel_service,
+        state_manager=state_manager
+    )
+
+    return messaging_service
+
+
+def send_notice(channel_type: str, channel_id: str, body: str, is_mock_testing: bool) -> None:
+    """Send fixed text to member outside a turn, without loading state
+
+    Sends are paced and may wait, so callers queue this on a lane.
+    """
+    if channel_type != "whatsapp":
+        return
+    try:
+        message = DomainMessage(
+            recipient=MessageRecipient(type=channel_type, identifier=channel_id),
+            content=TextContent(body=body),
+            metadata={"mock_testing": True} if is_mock_testing else {}
+        )
+        WhatsAppMessagingService().send_encoded(message, encode_fixed_text(channel_id, body))
+    except Exception as e:
+        logger.warning(f"Failed to send notice: {str(e)}")
+
+
+def _route(data: Any, is_mock_testing: bool) -> Tuple[Optional[list], Optional[InboundMessage]]:
+    """Find status updates or member message in delivery
+
+    Returns:
+        Tuple: Status updates to track, or message to process - neither if
+        the delivery only needs acknowledging
+    """
+    # Validate basic webhook structure
+    if not isinstance(data, dict):
+        return None, None
+
+    entries = data.get("entry", [])
+    if not entries or not isinstance(entries, list):
+        return None, None
+
+    changes = entries[0].get("changes", [])
+    if not changes or not isinstance(changes, list):
+        return None, None
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Mock testing: {is_mock_testing}")
+
+    # Get and validate the raw payload value
+    value = changes[0].get("value", {})
+    if not value or not isinstance(value, dict):
+        logger.debug("Invalid or empty value object")
+        return None, None
+
+    # Status updates for our number go to delivery tracking without further
+    # processing
+    statuses = value.get("statuses")
+    if statuses:
+        if not isinstance(statuses, list) or not is_own_number(value, is_mock_testing):
+            return None, None
+        return statuses, None
+
+    # Parse member message once for the whole turn
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Parsing message from value: {value}")
+    inbound = parse_value(value, is_mock_testing)
+    if inbound and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Extracted channel info - type: {inbound.channel_type}, id: {inbound.channel_id}")
+    return None, inbound
+
+
+def run_flow(inbound: InboundMessage, is_mock_testing: bool) -> Tuple[int, Dict[str, Any]]:
+    """Process member message through the flow
+
+    Drops turns that waited past OVERLOAD_TURN_DEADLINE and reports turn
+    timing to the overload controller. Keeps the message's dedupe claim once
+    the turn completes, and releases it if processing fails, so Meta's retry
+    is processed.
+
+    Returns:
+        Tuple[int, Dict[str, Any]]: Status code and response body
+    """
+    # Member has likely moved on, and Meta may already have retried
+    if overload.is_stale(inbound):
+        if inbound.message_id:
+            inbound_dedupe.complete(inbound.message_id)
+        return 200, RECEIVED
+
+    queue_age = time.time() - inbound.received_at if inbound.received_at else 0.0
+    started = time.monotonic()
+    try:
+        return _process(inbound, is_mock_testing)
+    finally:
+        overload.controller.record_turn(queue_age, time.monotonic() - started)
+
+
+def _process(inbound: InboundMessage, is_mock_testing: bool) -> Tuple[int, Dict[str, Any]]:
+    """Run turn for member message (see run_flow)"""
+    channel_type, channel_id = inbound.channel_type, inbound.channel_id
+    try:
+        # Initialize state managers
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initializing state managers")
+        core_state_manager = StateManager(f"channel:{channel_id}")
+        state_manager = (
+            WhatsAppStateManager(core_state_manager)
+            if channel_type == "whatsapp"
+            else core_state_manager
+        )
+
+        # Initialize channel state with proper enum type
+        state_manager.initialize_channel(
+            channel_type=channel_type,
+            channel_id=channel_id,
+            mock_testing=is_mock_testing
+        )
+
+        try:
+            # Get messaging service for channel
+            service = get_messaging_service(state_manager, channel_type)
+
+            # Create flow processor for channel type
+            if channel_type == "whatsapp":
+                flow_processor = WhatsAppFlowProcessor(service, state_manager)
+            else:
+                raise ValueError(f"Unsupported channel type: {channel_type}")
+
+            # Process message - component handles its own messaging
+            flow_processor.process_message(inbound)
+            if inbound.message_id:
+                inbound_dedupe.complete(inbound.message_id)
+            return 200, RECEIVED
+
+        except Exception as e:
+            logger.error(f"Message processing error: {str(e)}")
+            if inbound.message_id:
+                inbound_dedupe.release(inbound.message_id)
+            return 500, {"error": str(e)}
+
+    except Exception as e:
+        logger.error(f"Webhook error: {str(e)}")
+        if inbound.message_id:
+            inbound_dedupe.release(inbound.message_id)
+        return 500, {"error": str(e)}
+
+
+def handle(data: Any, is_mock_testing: bool) -> Tuple[int, Dict[str, Any]]:
+    """Handle webhook delivery
+
+    Args:
+        data: Parsed request body
+        is_mock_testing: Whether X-Mock-Testing header was set
+
+    Returns:
+        Tuple[int, Dict[str, Any]]: Status code and response body
+    """
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing webhook request")
+
+        statuses, inbound = _route(data, is_mock_testing)
+        if statuses:
+            delivery.enqueue(statuses)
+        if not inbound:
+            return 200, RECEIVED
+
+        # Acknowledge repeat deliveries without processing them again
+        if inbound.message_id and not inbound_dedupe.claim(inbound.message_id):
+            return 200, RECEIVED
+
+        # Shed members over their rate limit before loading any state -
+        # unsupported messages don't count against it
+        allowed, notify = (
+            inbound_limit.check(inbound.channel_id) if inbound.type is not None else (True, False)
+        )
+        if not allowed:
+            # Fixed notices go on the notification lane, clear of member turns
+            if notify:
+                lanes.submit(
+                    lanes.NOTIFICATION,
+                    send_notice,
+                    inbound.channel_type,
+                    inbound.channel_id,
+                    inbound_limit.THROTTLED_MESSAGE,
+                    is_mock_testing
+                )
+            return 200, RECEIVED
+
+        # Turn new conversations away while overloaded
+        if overload.should_shed(inbound):
+            lanes.submit(
+                lanes.NOTIFICATION,
+                send_notice,
+                inbound.channel_type,
+                inbound.channel_id,
+                overload.BUSY_MESSAGE,
+                is_mock_testing
+            )
+            return 200, RECEIVED
+
+        # Hand turn to the member's flow worker in dispatcher mode
+        if settings.FLOW_DISPATCH and dispatch.forward(inbound):
+            return 200, RECEIVED
+
+    except Exception as e:
+        logger.error(f"Webhook error: {str(e)}")
+        return 500, {"error": str(e)}
+
+    return run_flow(inbound, is_mock_testing)
+
+
+async def ahandle(data: Any, is_mock_testing: bool) -> Tuple[int, Dict[str, Any]]:
+    """Handle webhook delivery on the event loop (see handle)"""
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing webhook request")
+
+        statuses, inbound = _route(data, is_mock_testing)
+        if statuses:
+            await delivery.aenqueue(statuses)
+        if not inbound:
+            return 200, RECEIVED
+
+        # Acknowledge repeat deliveries without processing them again
+        if inbound.message_id and not await inbound_dedupe.aclaim(inbound.message_id):
+            return 200, RECEIVED
+
+        # Shed members over their rate limit before loading any state -
+        # unsupported messages don't count against it
+        allowed, notify = (
+            await inbound_limit.acheck(inbound.channel_id) if inbound.type is not None else (True, False)
+        )
+        if not allowed:
+            # Fixed notices go on the notification lane, clear of member turns
+            if notify:
+                lanes.submit(
+                    lanes.NOTIFICATION,
+                    send_notice,
+                    inbound.channel_type,
+                    inbound.channel_id,
+                    inbound_limit.THROTTLED_MESSAGE,
+                    is_mock_testing
+                )
+            return 200, RECEIVED
+
+        # Turn new conversations away while overloaded
+        if await overload.ashould_shed(inbound):
+            lanes.submit(
+                lanes.NOTIFICATION,
+                send_notice,
+                inbound.channel_type,
+                inbound.channel_id,
+                overload.BUSY_MESSAGE,
+                is_mock_testing
+            )
+            return 200, RECEIVED
+
+        # Hand turn to the member's flow worker in dispatcher mode
+        if settings.FLOW_DISPATCH and await dispatch.aforward(inbound):
+            return 200, RECEIVED
+
+    except Exception as e:
+        logger.error(f"Webhook error: {str(e)}")
+        return 500, {"error": str(e)}
+
+    return await asyncio.wrap_future(
+        lanes.submit(lanes.INTERACTIVE, run_flow, inbound, is_mock_testing)
+    )
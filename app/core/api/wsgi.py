@@ -0,0 +1,84 @@
+"""WSGI fast path for the Cloud API webhook
+
+Webhook POSTs (every inbound message and every status callback) are answered
+here, ahead of Django's middleware, URL routing and DRF content negotiation:
+- The body is read once and parsed with orjson when installed
+- Delivery is handled by core.api.webhook, the same code the DRF view runs
+- Acknowledgements use a pre-encoded response body
+
+Everything else, including webhook verification GETs and non-JSON POSTs, is
+passed to Django unchanged.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Iterable, List, Tuple
+
+from django.urls import get_resolver
+
+from . import webhook
+
+try:
+    import orjson
+
+    def _loads(body: bytes) -> Any:
+        return orjson.loads(body)
+except ImportError:  # optional speedup
+    def _loads(body: bytes) -> Any:
+        return json.loads(body)
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/bot/webhook"
+
+# Same bytes JsonResponse produces for webhook.RECEIVED
+RECEIVED_BODY = json.dumps(webhook.RECEIVED).encode("utf-8")
+
+STATUS_LINES = {200: "200 OK", 500: "500 Internal Server Error"}
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode response body as JsonResponse does"""
+    return json.dumps(value).encode("utf-8")
+
+
+class WebhookApplication:
+    """WSGI application answering webhook POSTs before Django"""
+
+    def __init__(self, django_application: Callable):
+        self.django_application = django_application
+        # Load URLconf now so view module setup (logging) applies from the
+        # first request, as it did when every request went through Django
+        get_resolver().url_patterns
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        if (
+            environ.get("PATH_INFO") != WEBHOOK_PATH
+            or environ.get("REQUEST_METHOD") != "POST"
+            or not environ.get("CONTENT_TYPE", "").startswith("application/json")
+        ):
+            return self.django_application(environ, start_response)
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            body = environ["wsgi.input"].read(length) if length > 0 else b""
+            # Empty body parses to no data, like DRF
+            data = _loads(body) if body else {}
+        except Exception as e:
+            logger.error(f"Webhook error: JSON parse error - {str(e)}")
+            return self._respond(start_response, 500, _dumps({"error": f"JSON parse error - {str(e)}"}))
+
+        is_mock_testing = environ.get("HTTP_X_MOCK_TESTING") == "true"
+        status_code, response_body = webhook.handle(data, is_mock_testing)
+        encoded = RECEIVED_BODY if response_body is webhook.RECEIVED else _dumps(response_body)
+        return self._respond(start_response, status_code, encoded)
+
+    @staticmethod
+    def _respond(start_response: Callable, status_code: int, body: bytes) -> List[bytes]:
+        """Start response with JSON body"""
+        headers: List[Tuple[str, str]] = [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(body)))
+        ]
+        start_response(STATUS_LINES.get(status_code, f"{status_code} Error"), headers)
+        return [body]
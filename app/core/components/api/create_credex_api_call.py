@@ -17,6 +17,9 @@ from ..base import ApiComponent
 class CreateCredexApiCall(ApiComponent):
     """Handles creating a new Credex offer and managing state"""
 
+    # Result notices do not gate the next step
+    independent_effects = True
+
     def __init__(self):
         super().__init__("create_credex_api")
         self.state_manager = None
@@ -2,16 +2,21 @@
 
 Handles retrieving paginated ledger entries through the API:
 - Gets pagination params from component_data
+- Serves pages from the ledger cache when possible
 - Makes API call to get ledger entries
 - Updates state with response
+- Prefetches the next page in the background
 - Passes data back to input component
 """
 
 import logging
 from typing import Any, Dict, Optional, Tuple
 
+from urllib.parse import urljoin
+
+from core.api import ledger_cache
 from core.error.types import ValidationResult
-from core.api.base import make_api_request, handle_api_response
+from core.api.base import BASE_URL, get_headers, make_api_request, handle_api_response
 
 from ..base import ApiComponent
 
@@ -21,6 +26,9 @@ logger = logging.getLogger(__name__)
 class GetLedgerApiCall(ApiComponent):
     """Processes ledger retrieval and manages state"""
 
+    # Cached page lookup starts before validate runs
+    requires = ("active_account", "component_data", "ledger_page")
+
     def __init__(self):
         super().__init__("get_ledger_api")
 
@@ -63,7 +71,7 @@ class GetLedgerApiCall(ApiComponent):
         """Get required data from state"""
         try:
             # Get pagination data from component_data
-            component_data = self.state_manager.get_state_value("component_data", {})
+            component_data = self.inputs.get("component_data", {})
             data = component_data.get("data", {})
             account_id = data.get("account_id")
             start_row = data.get("start_row", 0)
@@ -83,6 +91,12 @@ class GetLedgerApiCall(ApiComponent):
     ) -> ValidationResult:
         """Make API call to get ledger entries"""
         try:
+            # Serve page from cache if already fetched or prefetched
+            cached = self.inputs.get("ledger_page")
+            if cached:
+                logger.info(f"Ledger cache hit for account {account_id} (start: {start_row})")
+                return ValidationResult.success(cached)
+
             # Make request
             url = "getLedger"
             payload = {
@@ -111,6 +125,7 @@ class GetLedgerApiCall(ApiComponent):
                     details={"error": error}
                 )
 
+            ledger_cache.store_page(account_id, start_row, num_rows, result)
             return ValidationResult.success(result)
 
         except Exception as e:
@@ -125,18 +140,12 @@ class GetLedgerApiCall(ApiComponent):
         """Process API response and update state"""
         try:
             # Get account details for display
-            dashboard = self.state_manager.get_state_value("dashboard", {})
-            active_account_id = self.state_manager.get_state_value("active_account_id")
-            account = next(
-                (acc for acc in dashboard.get("accounts", [])
-                 if acc.get("accountID") == active_account_id),
-                None
-            )
+            account = self.inputs.get("active_account")
             if not account:
                 return ValidationResult.failure(
                     message="Active account not found",
                     field="account",
-                    details={"active_account_id": active_account_id}
+                    details={"component": self.type}
                 )
 
             # Get ledger data from response
@@ -144,6 +153,10 @@ class GetLedgerApiCall(ApiComponent):
             ledger_data = action.get("details", {}).get("ledger", [])
             pagination = response.get("data", {}).get("dashboard", {}).get("pagination", {})
 
+            # Prefetch next page while member reads this one
+            if pagination.get("hasMore", False):
+                self._prefetch_next_page()
+
             # Pass data to input component for display
             from ..input.view_ledger import ViewLedger
             view_ledger = ViewLedger()
@@ -178,6 +191,23 @@ class GetLedgerApiCall(ApiComponent):
                 details={"error": str(e)}
             )
 
+    def _prefetch_next_page(self) -> None:
+        """Start background fetch of the page after the current one"""
+        try:
+            account_id, start_row, num_rows = self._get_required_data()
+            if not account_id:
+                return
+
+            url = urljoin(BASE_URL, "getLedger")
+            headers = get_headers(self.state_manager, url)
+            if "Authorization" not in headers:
+                return
+
+            ledger_cache.prefetch_page(account_id, start_row + num_rows, num_rows, url, headers)
+
+        except Exception as e:
+            logger.warning(f"Failed to prefetch ledger page: {str(e)}")
+
     def to_verified_data(self, value: Any) -> Dict:
         """Convert API response to verified data
 
@@ -10,6 +10,7 @@ from typing import Any
 
 from core.api.base import handle_api_response, make_api_request
 from core.error.types import ValidationResult
+from core.state.dashboard import DashboardView
 
 from ..base import ApiComponent
 
@@ -77,11 +78,7 @@ class LoginApiCall(ApiComponent):
                     return ValidationResult.success(result)
 
                 # For other tiers, set personal account as active
-                accounts = dashboard.get("accounts", [])
-                personal_account = next(
-                    (acc for acc in accounts if acc.get("accountType") == "PERSONAL"),
-                    None
-                )
+                personal_account = DashboardView(dashboard).personal_account
                 if not personal_account:
                     return ValidationResult.failure(
                         message="Login failed: No personal account found",
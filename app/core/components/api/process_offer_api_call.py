@@ -5,13 +5,24 @@ Handles credex offer processing through the API:
 - Makes API call to process offer (accept/decline/cancel)
 - Updates state with response
 - Sets component_result for flow control
+
+Bulk actions (credex_ids in component data) run every offer call with bounded
+concurrency, then send one summary and refresh the dashboard once.
 """
 
 import logging
-from typing import Any, Dict, Optional, Tuple
-
-from core.api.base import handle_api_response, make_api_request
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from core.api import idempotency, ledger_cache
+from core.api.auth import TokenManager
+from core.api.base import (BASE_URL, get_headers, handle_api_response,
+                           make_api_request, process_api_response,
+                           send_with_retries, start_login_flow)
 from core.error.types import ValidationResult
+from core.state.dashboard import DashboardView
 
 from ..base import ApiComponent
 
@@ -23,32 +34,50 @@ API_CONFIG = {
         "url": "acceptCredex",
         "success_action": "CREDEX_ACCEPTED",
         "error_prefix": "accept",
+        "past_tense": "accepted",
         "emoji": "✅"
     },
     "decline_offer": {
         "url": "declineCredex",
         "success_action": "CREDEX_DECLINED",
         "error_prefix": "decline",
+        "past_tense": "declined",
         "emoji": "❌"
     },
     "cancel_offer": {
         "url": "cancelCredex",
         "success_action": "CREDEX_CANCELLED",
         "error_prefix": "cancel",
+        "past_tense": "cancelled",
         "emoji": "🚫"
     }
 }
 
 
+# Max offer calls in flight for bulk actions
+BULK_OFFER_CONCURRENCY = 4
+
+
 class ProcessOfferApiCall(ApiComponent):
     """Processes credex offer actions and manages state"""
 
+    # Result notices do not gate the next step
+    independent_effects = True
+
+    requires = ("member", "active_account_id", "component_data")
+
     def __init__(self):
         super().__init__("process_offer_api")
 
     def validate_api_call(self, value: Any) -> ValidationResult:
         """Process offer action and update state"""
         try:
+            # Bulk action over every pending offer
+            component_data = self.inputs.get("component_data", {})
+            credex_ids = component_data.get("data", {}).get("credex_ids")
+            if credex_ids:
+                return self._process_all(credex_ids)
+
             # Get required data from state
             member_id, account_id, credex_id = self._get_required_data()
             if not all([member_id, account_id, credex_id]):
@@ -91,14 +120,13 @@ class ProcessOfferApiCall(ApiComponent):
         """Get required data from state"""
         try:
             # Get member ID from dashboard
-            dashboard = self.state_manager.get_state_value("dashboard", {})
-            member_id = dashboard.get("member", {}).get("memberID")
+            member_id = self.inputs.get("member", {}).get("memberID")
 
             # Get active account ID
-            account_id = self.state_manager.get_state_value("active_account_id")
+            account_id = self.inputs.get("active_account_id")
 
             # Get credex ID from component data
-            component_data = self.state_manager.get_state_value("component_data", {})
+            component_data = self.inputs.get("component_data", {})
             credex_id = component_data.get("data", {}).get("credex_id")
 
             return member_id, account_id, credex_id
@@ -158,36 +186,28 @@ class ProcessOfferApiCall(ApiComponent):
             action_type = action.get("type")
 
             if action_type == config["success_action"]:
-                logger.info(f"Offer {config['error_prefix']}ed successfully")
+                logger.info(f"Offer {config['past_tense']} successfully")
 
                 # Send success notification
-                self.state_manager.messaging.send_text(f"{config['emoji']} Credex offer {config['error_prefix']}ed")
+                self.state_manager.messaging.send_text(f"{config['emoji']} Credex offer {config['past_tense']}")
 
                 # Check for more pending offers
-                dashboard = self.state_manager.get_state_value("dashboard", {})
+                dashboard_view = DashboardView(self.state_manager.get_state_value("dashboard", {}))
                 active_account_id = self.state_manager.get_state_value("active_account_id")
-                active_account = next(
-                    (acc for acc in dashboard.get("accounts", []) if acc.get("accountID") == active_account_id),
-                    None
-                )
 
                 # Get context to check correct offer list
                 context = self.state_manager.get_path()
-                offer_list = []
-                if active_account:
-                    if context in {"accept_offer", "decline_offer"}:
-                        offer_list = active_account.get("pendingInData", [])
-                    elif context == "cancel_offer":
-                        offer_list = active_account.get("pendingOutData", [])
+                direction = "out" if context == "cancel_offer" else "in"
+                remaining = dashboard_view.pending_count(active_account_id, direction)
 
                 # Log offer list status
-                logger.info(f"Remaining offers for {context}: {len(offer_list)}")
+                logger.info(f"Remaining offers for {context}: {remaining}")
 
                 # Return to list if more offers, otherwise to dashboard
-                if offer_list and len(offer_list) > 0:
+                if remaining > 0:
                     # Tell headquarters to return to list
                     self.set_result("return_to_list")
-                    logger.info(f"Returning to list with {len(offer_list)} remaining offers")
+                    logger.info(f"Returning to list with {remaining} remaining offers")
                 else:
                     # Tell headquarters to show dashboard
                     self.set_result("send_dashboard")
@@ -210,6 +230,123 @@ class ProcessOfferApiCall(ApiComponent):
                 details={"error": str(e)}
             )
 
+    def _process_all(self, credex_ids: List[str]) -> ValidationResult:
+        """Process every selected offer, then summarize and refresh dashboard once
+
+        Offer calls run in worker threads that never touch state, with the
+        same retries as make_api_request. An expired token is refreshed once
+        for all calls and stored afterwards. Each call carries a per-offer
+        idempotency key so redeliveries of the same bulk action replay
+        recorded outcomes instead of processing an offer twice.
+        """
+        context = self.state_manager.get_path()
+        config = API_CONFIG.get(context, API_CONFIG["accept_offer"])
+        channel_id = self.state_manager.get_channel_id()
+        account_id = self.inputs.get("active_account_id")
+
+        url = urljoin(BASE_URL, config["url"])
+        headers = get_headers(self.state_manager, url)
+        if "Authorization" not in headers:
+            return ValidationResult.failure(
+                message=f"Failed to {config['error_prefix']} offers: not authenticated",
+                field="api_call",
+                details={"error": "missing_token"}
+            )
+
+        logger.info(f"Bulk {config['error_prefix']} of {len(credex_ids)} offers on account {account_id}")
+
+        # Keys derived up front - worker threads never read state
+        idempotency_keys = {
+            credex_id: idempotency.make_key(self.state_manager, config["url"], {"credexID": credex_id})
+            for credex_id in credex_ids
+        }
+
+        # One refresh shared by every call that hits an expired token
+        refresh_lock = threading.Lock()
+        refreshed: Dict[str, Optional[str]] = {}
+
+        def refresh_token() -> Optional[str]:
+            with refresh_lock:
+                if "token" not in refreshed:
+                    refreshed["token"] = TokenManager.refresh(channel_id)
+                return refreshed["token"]
+
+        def process(credex_id: str) -> str:
+            idempotency_key = idempotency_keys[credex_id]
+            try:
+                response = idempotency.begin(idempotency_key, config["url"])
+                if response is None:
+                    call_headers = headers
+                    if refreshed.get("token"):
+                        call_headers = {**headers, "Authorization": f"Bearer {refreshed['token']}"}
+                    response, _, auth_failed = send_with_retries(
+                        "POST",
+                        url,
+                        call_headers,
+                        {"credexID": credex_id},
+                        refresh_token=refresh_token,
+                        idempotency_key=idempotency_key
+                    )
+                    if auth_failed:
+                        return "auth_failed"
+
+                action = process_api_response(response).get("data", {}).get("action", {})
+                return "succeeded" if action.get("type") == config["success_action"] else "failed"
+            except Exception as e:
+                logger.error(f"Failed to {config['error_prefix']} offer {credex_id}: {str(e)}")
+                return "failed"
+
+        with ThreadPoolExecutor(max_workers=BULK_OFFER_CONCURRENCY) as executor:
+            results = list(executor.map(process, credex_ids))
+
+        if refreshed.get("token"):
+            TokenManager.store_token(self.state_manager, refreshed["token"])
+
+        succeeded = results.count("succeeded")
+        failed = len(results) - succeeded
+        logger.info(f"Bulk {config['error_prefix']}: {succeeded} succeeded, {failed} failed")
+
+        # Token could not be refreshed - same handling as make_api_request
+        if "auth_failed" in results:
+            error = start_login_flow(self.state_manager, url)
+            return ValidationResult.failure(
+                message=f"Failed to {config['error_prefix']} offers: authentication required",
+                field="api_call",
+                details={"error": error}
+            )
+
+        # Clear offer data
+        self.update_data({})
+
+        # Send one summary message
+        summary = f"{config['emoji']} {succeeded} credex offer{'s' if succeeded != 1 else ''} {config['past_tense']}"
+        if failed:
+            summary += f"\n⚠️ {failed} could not be {config['past_tense']}, please try again"
+        self.state_manager.messaging.send_text(summary)
+
+        if succeeded and account_id:
+            ledger_cache.invalidate(account_id)
+
+        # Refresh dashboard once for all offers
+        response = make_api_request(
+            url="login",
+            payload={"phone": channel_id},
+            method="POST",
+            retry_auth=False,
+            state_manager=self.state_manager
+        )
+        _, error = handle_api_response(response=response, state_manager=self.state_manager)
+        if error:
+            logger.error(f"Failed to refresh dashboard after bulk action: {error}")
+
+        # Tell headquarters to show dashboard
+        self.set_result("send_dashboard")
+
+        return ValidationResult.success({
+            "action": self.state_manager.get_state_value("action", {}),
+            "success": failed == 0
+        })
+
     def to_verified_data(self, value: Any) -> Dict:
         """Convert API response to verified data
 
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class UpgradeMembertierApiCall(ApiComponent):
     """Processes member tier upgrade and manages state"""
 
+    # Result notices do not gate the next step
+    independent_effects = True
+
     def __init__(self):
         super().__init__("upgrade_membertier_api")
         self.state_manager = None
@@ -10,21 +10,32 @@ validation at the state manager level.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from core.error.exceptions import ComponentException
 from core.error.types import ValidationResult
+from core.flow.dependencies import ComponentInputs
+from core.messaging import deferred
 from core.state.interface import StateManagerInterface
 
 
 class Component:
     """Base component interface"""
 
+    # Set True when nothing the next step does depends on this component's
+    # sends completing - the flow engine then sends them in the background
+    independent_effects = False
+
+    # Inputs read on entry (state fields, derived inputs, upstream resources),
+    # resolved by the flow engine before validate - see core.flow.dependencies
+    requires: Tuple[str, ...] = ()
+
     def __init__(self, component_type: str):
         """Initialize component with standardized validation tracking"""
         self.type = component_type
         self.value = None
         self.state_manager: Optional[StateManagerInterface] = None
+        self.inputs = ComponentInputs()
         self.validation_state = {
             "in_progress": False,
             "error": None,
@@ -66,6 +77,17 @@ class Component:
 
         self.state_manager = state_manager
 
+    def set_inputs(self, inputs: ComponentInputs) -> None:
+        """Set inputs resolved for this step
+
+        Inputs are a snapshot taken on entry. Read state directly for anything
+        the component itself changes (e.g. dashboard after an API call).
+
+        Args:
+            inputs: Resolved inputs
+        """
+        self.inputs = inputs
+
     def send(self) -> None:
         """Send component's initial message/prompt
 
@@ -387,6 +409,10 @@ class ApiComponent(Component):
             logger.error(f"API validation error in {self.type}: {str(e)}")
             raise
 
+        finally:
+            # Call finished - drop processing notice if it has not gone out yet
+            deferred.settle(self.state_manager.get_channel_id())
+
     def validate_api_call(self, value: Any) -> ValidationResult:
         """Component-specific API validation logic"""
         raise NotImplementedError
@@ -29,6 +29,12 @@ _To:_
 💳 *{target_account_name}*
 💳 {target_account_handle}"""
 
+# Confirmation buttons
+CONFIRM_OFFER_BUTTONS = [
+    Button(id="confirm", title="📝 Sign and Send 💸"),
+    Button(id="cancel", title="❌ Cancel ❌")
+]
+
 
 class ConfirmOfferSecured(ConfirmBase):
     """Handles secured offer confirmation"""
@@ -52,7 +58,7 @@ class ConfirmOfferSecured(ConfirmBase):
             return super().validate(value)
 
         # Process confirmation if we have an incoming message
-        if current_data.get("incoming_message"):
+        if self.state_manager.get_incoming_message():
             # Process the confirmation
             return self.handle_confirmation(value)
 
@@ -152,10 +158,7 @@ class ConfirmOfferSecured(ConfirmBase):
 
         self.state_manager.messaging.send_interactive(
             body=confirmation_message,
-            buttons=[
-                Button(id="confirm", title="📝 Sign and Send 💸"),
-                Button(id="cancel", title="❌ Cancel ❌")
-            ]
+            buttons=CONFIRM_OFFER_BUTTONS
         )
         self.set_awaiting_input(True)
 
@@ -199,12 +202,9 @@ class ConfirmOfferSecured(ConfirmBase):
                 }
             )
 
-        # Get current state
-        current_data = self.state_manager.get_state_value("component_data", {})
-
         # Process button response
         logger.debug("Processing button response")
-        incoming_message = current_data.get("incoming_message", {})
+        incoming_message = self.state_manager.get_incoming_message() or {}
         if incoming_message.get("type") != "interactive":
             return ValidationResult.failure(
                 message="Please use the Confirm or Cancel button",
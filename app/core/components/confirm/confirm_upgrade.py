@@ -26,6 +26,12 @@ UPGRADE_CONFIRMATION = """📈 *Member Tier Upgrade*
 
 🔥 If you are hustling hard to make a dollar in the markets of Mbare or anywhere in Zimbabwe's informal economy, be one of the first 10,000 VimbisoPay Hustlers and get a full year for $1 💥💥💥"""
 
+# Confirmation buttons
+UPGRADE_BUTTONS = [
+    Button(id="confirm", title="💫 Upgrade Tier 📈"),
+    Button(id="cancel", title="❌ No Thanks ❌")
+]
+
 
 class ConfirmUpgrade(ConfirmBase):
     """Handles member tier upgrade confirmation"""
@@ -49,7 +55,7 @@ class ConfirmUpgrade(ConfirmBase):
             return super().validate(value)
 
         # Process confirmation if we have an incoming message
-        if current_data.get("incoming_message"):
+        if self.state_manager.get_incoming_message():
             # Process the confirmation
             return self.handle_confirmation(value)
 
@@ -98,10 +104,7 @@ class ConfirmUpgrade(ConfirmBase):
             # Send message with buttons
             self.state_manager.messaging.send_interactive(
                 body=confirmation_message,
-                buttons=[
-                    Button(id="confirm", title="💫 Upgrade Tier 📈"),
-                    Button(id="cancel", title="❌ No Thanks ❌")
-                ]
+                buttons=UPGRADE_BUTTONS
             )
             self.set_awaiting_input(True)
 
@@ -119,9 +122,8 @@ class ConfirmUpgrade(ConfirmBase):
         logger.info("Processing upgrade confirmation")
 
         try:
-            # Get current state
-            current_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = current_data.get("incoming_message", {})
+            # Get current message
+            incoming_message = self.state_manager.get_incoming_message() or {}
 
             # Validate interactive message
             if incoming_message.get("type") != "interactive":
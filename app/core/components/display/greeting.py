@@ -8,6 +8,9 @@ from ..base import DisplayComponent
 class Greeting(DisplayComponent):
     """Component for sending culturally-aware greetings"""
 
+    # Greeting goes out while the login call runs
+    independent_effects = True
+
     def __init__(self):
         super().__init__("greeting")
 
@@ -1,6 +1,14 @@
-"""Processing status messages with Zimbabwe-first, globally inclusive approach"""
+"""Processing status messages with Zimbabwe-first, globally inclusive approach
+
+The message is deferred: it is only sent if the API component that follows has
+not finished within PROCESSING_NOTICE_DELAY.
+"""
 import random
 from typing import Any, Dict
+
+from config.timing import PROCESSING_NOTICE_DELAY
+from core.messaging import deferred
+
 from ..base import DisplayComponent
 
 
@@ -11,12 +19,17 @@ class ProcessingNow(DisplayComponent):
         super().__init__("processing_now")
 
     def display(self, value: Any) -> None:
-        """Generate and send processing message"""
+        """Generate processing message and send it if the next step is slow"""
         # Generate message
         message = get_random_processing_message()
 
-        # Send through messaging service
-        self.state_manager.messaging.send_text(message)
+        # Send through messaging service once deadline passes
+        messaging = self.state_manager.messaging
+        deferred.schedule(
+            self.state_manager.get_channel_id(),
+            lambda: messaging.send_text(message),
+            PROCESSING_NOTICE_DELAY
+        )
 
     def to_message_content(self, value: Dict) -> str:
         """Convert validated value to message content"""
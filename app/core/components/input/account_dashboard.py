@@ -2,15 +2,21 @@
 
 This component handles displaying the account dashboard with proper validation.
 Also handles initial state setup after login.
+
+Rendered dashboards are cached per dashboard content, so members returning to
+an unchanged dashboard skip formatting.
 """
 
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 from core.components.base import InputComponent
 from core.error.exceptions import ComponentException
 from core.error.types import ValidationResult
 from core.messaging.types import InteractiveType, MessageType, Section
+from core.state.dashboard import DashboardView, content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +30,143 @@ ACCOUNT_DASHBOARD = """*💳 {account}*
 *📊 Net Assets*
 📊 {net_assets}{tier_limit_display}{pending_offer_message}"""
 
+# Rendered dashboards by (dashboard version, accountID, member content hash)
+RENDER_CACHE_SIZE = 1024
+_render_cache: "OrderedDict[Tuple, Tuple[Dict[str, str], str, List[Section]]]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def render_dashboard(
+    dashboard_view: DashboardView,
+    active_account: Dict[str, Any],
+    member: Dict[str, Any]
+) -> Tuple[Dict[str, str], str, List[Section]]:
+    """Render account dashboard, cached per dashboard content
+
+    Args:
+        dashboard_view: Dashboard view
+        active_account: Account to render
+        member: Member section of dashboard
+
+    Returns:
+        Tuple[Dict[str, str], str, List[Section]]: Formatted fields, message body
+        and menu sections
+    """
+    cache_key = (dashboard_view.version, active_account.get("accountID"), content_hash(member))
+    with _render_cache_lock:
+        if cache_key in _render_cache:
+            _render_cache.move_to_end(cache_key)
+            return _render_cache[cache_key]
+
+    # Format header data
+    account = active_account.get("accountName", "")
+    handle = active_account.get("accountHandle", "")
+
+    # Format secured balances
+    secured_balances = active_account.get("balanceData", {}).get("securedNetBalancesByDenom", [])
+    secured_balances_str = "\n💰 ".join(secured_balances) if secured_balances else "0.00 USD"
+
+    # Format net assets
+    try:
+        net_assets_str = active_account.get("balanceData", {}).get("netCredexAssetsInDefaultDenom", "0.00")
+        # Split into value and denomination
+        parts = net_assets_str.split()
+        if len(parts) == 2:
+            net_value = float(parts[0])
+            denom = parts[1]
+        else:
+            # If no denomination in string, use account default
+            net_value = float(net_assets_str)
+            denom = active_account.get("defaultDenom", "USD")
+        net_assets = f"  {net_value:.2f} {denom}"
+    except (ValueError, TypeError, AttributeError):
+        net_assets = f"- 0.00 {active_account.get('defaultDenom', 'USD')}"
+
+    # Format tier limit display
+    tier_limit_display = ""
+    if member and member.get("memberTier", 0) < 3:
+        try:
+            amount_remaining = float(member.get("remainingAvailableUSD", "0.00"))
+            tier_limit_display = f"\n\n⏳ *Daily Open Tier Limit*\n⏳  {amount_remaining:.2f} USD"
+        except (ValueError, TypeError):
+            tier_limit_display = "\n\n⏳ *Daily Open Tier Limit*\n0.00 USD"
+
+    # Get pending counts from dashboard index
+    pending_in = dashboard_view.pending_count(active_account.get("accountID"), "in")
+    pending_out = dashboard_view.pending_count(active_account.get("accountID"), "out")
+
+    # Format pending offer message
+    pending_offer_message = f"\n\n💸 {pending_in} offers to accept" if pending_in > 0 else ""
+
+    # Format final display data
+    formatted_data = {
+        "account": account,
+        "handle": handle,
+        "secured_balances": secured_balances_str,
+        "net_assets": net_assets,
+        "tier_limit_display": tier_limit_display,
+        "pending_offer_message": pending_offer_message
+    }
+
+    # Get account info text
+    account_info = ACCOUNT_DASHBOARD.format(**formatted_data)
+
+    # Define sections for menu options
+    sections = []
+
+    # Credex Actions section
+    credex_options = []
+    credex_options.append({"id": "offer_secured", "title": "💸 Offer Secured Credex 💸", "description": "Send a credex backed by currency or gold from your Secured Balances"})
+    if pending_in > 0:
+        credex_options.append({"id": "accept_offer", "title": "✅ Accept Offers ✅", "description": f"You have {pending_in} offers waiting"})
+        credex_options.append({"id": "decline_offer", "title": "❌ Decline Offers ❌", "description": f"You have {pending_in} offers waiting"})
+    if pending_out > 0:
+        credex_options.append({"id": "cancel_offer", "title": "🚫 Cancel Offers 🚫", "description": f"You have {pending_out} offers pending"})
+
+    if credex_options:
+        sections.append(Section(
+            title="Credex Actions",
+            rows=credex_options
+        ))
+
+    # Account Actions section
+    account_options = []
+    # Commented out for now
+    # account_options.append({"id": "view_ledger", "title": "📊 View account ledger", "description": "View account ledger"})
+
+    if account_options:
+        sections.append(Section(
+            title="Account Actions",
+            rows=account_options
+        ))
+
+    # Member Actions section
+    member_options = []
+    if member.get("memberTier") == 1:
+        member_options.append({"id": "upgrade_membertier", "title": "🌟 Hustler Tier 💫", "description": "$1/month *First 10,000 Hustlers: $1 for the first year* 🔥💥💥"})
+    elif member.get("memberTier") == 5:
+        member_options.append({"id": "switch_account", "title": "🔄 Switch Account", "description": "Switch to a different account"})
+
+    if member_options:
+        sections.append(Section(
+            title="Member Actions",
+            rows=member_options
+        ))
+
+    rendered = (formatted_data, account_info, sections)
+    with _render_cache_lock:
+        _render_cache[cache_key] = rendered
+        if len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+    return rendered
+
 
 class AccountDashboard(InputComponent):
     """Handles account dashboard display and initial state"""
 
+    requires = ("dashboard", "dashboard_view", "active_account", "member", "incoming_message")
+
     def __init__(self):
         super().__init__("account_dashboard")
 
@@ -45,7 +184,7 @@ class AccountDashboard(InputComponent):
             # Display Phase - When not awaiting input
             if not self.state_manager.is_awaiting_input():
                 # Get and validate dashboard data
-                dashboard = self.state_manager.get_state_value("dashboard")
+                dashboard = self.inputs.get("dashboard")
                 if not dashboard:
                     return ValidationResult.failure(
                         message="No dashboard data found",
@@ -53,21 +192,8 @@ class AccountDashboard(InputComponent):
                         details={"component": "account_dashboard"}
                     )
 
-                # Get active account ID set by flow
-                active_account_id = self.state_manager.get_state_value("active_account_id")
-                if not active_account_id:
-                    return ValidationResult.failure(
-                        message="No active account set",
-                        field="active_account",
-                        details={"component": "account_dashboard"}
-                    )
-
-                # Find active account
-                accounts = dashboard.get("accounts", [])
-                active_account = next(
-                    (acc for acc in accounts if acc.get("accountID") == active_account_id),
-                    None
-                )
+                # Get active account set by flow
+                active_account = self.inputs.get("active_account")
                 if not active_account:
                     return ValidationResult.failure(
                         message="Active account not found",
@@ -75,104 +201,11 @@ class AccountDashboard(InputComponent):
                         details={"component": "account_dashboard"}
                     )
 
-                # Format header data
-                account = active_account.get("accountName", "")
-                handle = active_account.get("accountHandle", "")
-
-                # Format secured balances
-                secured_balances = active_account.get("balanceData", {}).get("securedNetBalancesByDenom", [])
-                secured_balances_str = "\n💰 ".join(secured_balances) if secured_balances else "0.00 USD"
-
-                # Format net assets
-                try:
-                    net_assets_str = active_account.get("balanceData", {}).get("netCredexAssetsInDefaultDenom", "0.00")
-                    # Split into value and denomination
-                    parts = net_assets_str.split()
-                    if len(parts) == 2:
-                        net_value = float(parts[0])
-                        denom = parts[1]
-                    else:
-                        # If no denomination in string, use account default
-                        net_value = float(net_assets_str)
-                        denom = active_account.get("defaultDenom", "USD")
-                    net_assets = f"  {net_value:.2f} {denom}"
-                except (ValueError, TypeError, AttributeError):
-                    net_assets = f"- 0.00 {active_account.get('defaultDenom', 'USD')}"
-
-                # Format tier limit display
-                member = dashboard.get("member", {})
-                tier_limit_display = ""
-                if member and member.get("memberTier", 0) < 3:
-                    try:
-                        amount_remaining = float(member.get("remainingAvailableUSD", "0.00"))
-                        tier_limit_display = f"\n\n⏳ *Daily Open Tier Limit*\n⏳  {amount_remaining:.2f} USD"
-                    except (ValueError, TypeError):
-                        tier_limit_display = "\n\n⏳ *Daily Open Tier Limit*\n0.00 USD"
-
-                # Get pending counts from active account
-                pending_in = len(active_account.get("pendingInData", []))
-                pending_out = len(active_account.get("pendingOutData", []))
-
-                # Format pending offer message
-                pending_offer_message = f"\n\n💸 {pending_in} offers to accept" if pending_in > 0 else ""
-
-                # Format final display data
-                formatted_data = {
-                    "account": account,
-                    "handle": handle,
-                    "secured_balances": secured_balances_str,
-                    "net_assets": net_assets,
-                    "tier_limit_display": tier_limit_display,
-                    "pending_offer_message": pending_offer_message
-                }
-
-                # Get account info text
-                account_info = ACCOUNT_DASHBOARD.format(**formatted_data)
-
-                logger.info(f"Active account pendingOutData in dashboard: {active_account.get('pendingOutData')}")
-                logger.info(f"Pending out count: {pending_out}")
-
-                # Define sections for menu options
-                sections = []
-
-                # Credex Actions section
-                credex_options = []
-                credex_options.append({"id": "offer_secured", "title": "💸 Offer Secured Credex 💸", "description": "Send a credex backed by currency or gold from your Secured Balances"})
-                if pending_in > 0:
-                    credex_options.append({"id": "accept_offer", "title": "✅ Accept Offers ✅", "description": f"You have {pending_in} offers waiting"})
-                    credex_options.append({"id": "decline_offer", "title": "❌ Decline Offers ❌", "description": f"You have {pending_in} offers waiting"})
-                if pending_out > 0:
-                    credex_options.append({"id": "cancel_offer", "title": "🚫 Cancel Offers 🚫", "description": f"You have {pending_out} offers pending"})
-
-                if credex_options:
-                    sections.append(Section(
-                        title="Credex Actions",
-                        rows=credex_options
-                    ))
-
-                # Account Actions section
-                account_options = []
-                # Commented out for now
-                # account_options.append({"id": "view_ledger", "title": "📊 View account ledger", "description": "View account ledger"})
-
-                if account_options:
-                    sections.append(Section(
-                        title="Account Actions",
-                        rows=account_options
-                    ))
-
-                # Member Actions section
-                member_options = []
-                if member.get("memberTier") == 1:
-                    member_options.append({"id": "upgrade_membertier", "title": "🌟 Hustler Tier 💫", "description": "$1/month *First 10,000 Hustlers: $1 for the first year* 🔥💥💥"})
-                elif member.get("memberTier") == 5:
-                    member_options.append({"id": "switch_account", "title": "🔄 Switch Account", "description": "Switch to a different account"})
-
-                if member_options:
-                    sections.append(Section(
-                        title="Member Actions",
-                        rows=member_options
-                    ))
+                formatted_data, account_info, sections = render_dashboard(
+                    self.inputs.get("dashboard_view"),
+                    active_account,
+                    self.inputs.get("member", {})
+                )
 
                 try:
                     # Set component to await input before sending menu
@@ -196,8 +229,7 @@ class AccountDashboard(InputComponent):
                     )
 
             # Input Phase - When we get a response
-            component_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = component_data.get("incoming_message", {})
+            incoming_message = self.inputs.get("incoming_message", {})
 
             # For interactive messages, extract selection ID
             if incoming_message.get("type") == MessageType.INTERACTIVE.value:
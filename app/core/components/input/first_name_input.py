@@ -19,7 +19,7 @@ class FirstNameInput(InputComponent):
         """Validate first name with proper tracking"""
         # Get current state
         current_data = self.state_manager.get_state_value("component_data", {})
-        incoming_message = current_data.get("incoming_message")
+        incoming_message = self.state_manager.get_incoming_message()
 
         # Initial activation - send prompt
         if not current_data.get("awaiting_input"):
@@ -2,24 +2,165 @@
 
 This component handles displaying the multi-account dashboard for memberTier=5 users.
 Allows selection of accounts to transition into specific account flows.
+
+Owned accounts are listed in handle order from the dashboard's sorted index:
+- Pages fit WhatsApp's 10 row list limit, with previous/next rows when needed
+- Page cursors are handles carried in the navigation row IDs
+- Replying with text searches accounts by handle prefix
+- Rendered pages are cached per dashboard version
 """
 
 import logging
-from typing import Any
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.components.base import InputComponent
 from core.error.types import ValidationResult
 from core.messaging.types import InteractiveType, MessageType, Section
+from core.state.dashboard import DashboardView
 
 logger = logging.getLogger(__name__)
 
 # Multi-account template
 MULTI_ACCOUNT_DASHBOARD = """*👋 Hie {firstname}*"""
 
+# Appended when accounts span more than one page
+PAGE_SUMMARY = """
+
+Showing {first}-{last} of {total} accounts{matching}
+_Reply with the start of a handle to search_"""
+
+# WhatsApp allows 10 rows across all sections of a list
+MAX_ROWS = 10
+
+# Navigation row IDs, cursor handle follows the prefix
+NEXT_PAGE_ID = "accounts_after:"
+PREV_PAGE_ID = "accounts_before:"
+SHOW_ALL_ID = "accounts_all"
+
+# Rendered pages by (dashboard version, prefix, after, before)
+PAGE_CACHE_SIZE = 256
+_page_cache: "OrderedDict[Tuple, Tuple[List[Section], str]]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+
+def _account_row(account: Dict[str, Any]) -> Dict[str, str]:
+    """Build list row for account"""
+    account_handle = account.get("accountHandle", "")
+
+    # WhatsApp's 24 char limit for title
+    # "💳 " takes 4 chars, leaving 20 chars
+    max_name_length = 20
+    truncated_handle = (
+        account_handle[:max_name_length]
+        if len(account_handle) > max_name_length
+        else account_handle
+    )
+
+    # Get net assets in default denomination
+    net_assets = account.get("balanceData", {}).get("netCredexAssetsInDefaultDenom", "0.00")
+
+    try:
+        # Build and validate description length (WhatsApp 72 char limit)
+        description = f"{account.get('accountName', '')}: {net_assets}"
+        if len(description) > 72:
+            # Truncate to 69 chars + "..."
+            description = description[:69] + "..."
+    except Exception as e:
+        logger.error(f"Failed to build description: {str(e)}")
+        # Provide a fallback description (ensuring under 72 chars)
+        account_type = account.get('accountType', '')[:65]  # Leave room for "Type: " + "..."
+        description = f"Type: {account_type}"
+        if len(description) > 72:
+            description = description[:69] + "..."
+
+    return {
+        "id": account.get("accountID"),
+        "title": f"💳 {truncated_handle}",
+        "description": description
+    }
+
+
+def render_page(
+    view: DashboardView,
+    prefix: str = "",
+    after: Optional[str] = None,
+    before: Optional[str] = None
+) -> Tuple[List[Section], str]:
+    """Render page of owned accounts
+
+    Args:
+        view: Dashboard view
+        prefix: Handle prefix to search by
+        after: Handle cursor to start after
+        before: Handle cursor to end before
+
+    Returns:
+        Tuple[List[Section], str]: List sections (empty when no accounts match)
+        and page summary for the message body
+    """
+    cache_key = (view.version, prefix.lower(), after, before)
+    with _page_cache_lock:
+        if cache_key in _page_cache:
+            _page_cache.move_to_end(cache_key)
+            return _page_cache[cache_key]
+
+    # Searches keep a row for returning to all accounts
+    nav_rows = 1 if prefix else 0
+    accounts, position, total = view.owned_page(prefix, after, before, limit=MAX_ROWS - nav_rows)
+    if total > MAX_ROWS - nav_rows:
+        # Leave room for previous and next rows
+        accounts, position, total = view.owned_page(prefix, after, before, limit=MAX_ROWS - nav_rows - 2)
+
+    sections = []
+    summary = ""
+    if accounts:
+        sections.append(Section(title="Your Accounts", rows=[_account_row(account) for account in accounts]))
+
+        navigation = []
+        if position > 0:
+            navigation.append({
+                "id": f"{PREV_PAGE_ID}{accounts[0].get('accountHandle', '').lower()}",
+                "title": "⬅️ Previous accounts",
+                "description": f"Accounts before {accounts[0].get('accountHandle', '')}"[:72]
+            })
+        if position + len(accounts) < total:
+            navigation.append({
+                "id": f"{NEXT_PAGE_ID}{accounts[-1].get('accountHandle', '').lower()}",
+                "title": "➡️ More accounts",
+                "description": f"{total - position - len(accounts)} more accounts"
+            })
+        if prefix:
+            navigation.append({
+                "id": SHOW_ALL_ID,
+                "title": "📋 All accounts",
+                "description": "Clear search and list all accounts"
+            })
+        if navigation:
+            sections.append(Section(title="More", rows=navigation))
+
+        if prefix or len(accounts) < total:
+            summary = PAGE_SUMMARY.format(
+                first=position + 1,
+                last=position + len(accounts),
+                total=total,
+                matching=f' matching "{prefix}"' if prefix else ""
+            )
+
+    with _page_cache_lock:
+        _page_cache[cache_key] = (sections, summary)
+        if len(_page_cache) > PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+
+    return sections, summary
+
 
 class MultiAccountDashboard(InputComponent):
     """Handles multi-account dashboard display and account selection"""
 
+    requires = ("dashboard_view", "member", "component_data", "incoming_message")
+
     def __init__(self):
         super().__init__("multi_account_dashboard")
 
@@ -36,122 +177,37 @@ class MultiAccountDashboard(InputComponent):
         try:
             # Display Phase - When not awaiting input
             if not self.state_manager.is_awaiting_input():
-                # Get and validate dashboard data
-                dashboard = self.state_manager.get_state_value("dashboard")
-                if not dashboard:
-                    return ValidationResult.failure(
-                        message="No dashboard data found",
-                        field="dashboard",
-                        details={"component": "multi_account_dashboard"}
-                    )
-
-                # Get member info
-                member = dashboard.get("member", {})
-                firstname = member.get("firstname", "")
-
-                # Get accounts
-                accounts = dashboard.get("accounts", [])
-                if not accounts:
-                    return ValidationResult.failure(
-                        message="No accounts found",
-                        field="accounts",
-                        details={"component": "multi_account_dashboard"}
-                    )
-
-                # Format header with member name
-                header = MULTI_ACCOUNT_DASHBOARD.format(firstname=firstname)
-
-                # Create account selection options
-                account_options = []
-                for account in accounts:
-                    if account.get("isOwnedAccount"):
-                        account_id = account.get("accountID")
-                        account_name = account.get("accountName", "")
-                        account_handle = account.get("accountHandle", "")
-
-                        # WhatsApp's 24 char limit for title
-                        # "💳 " takes 4 chars, leaving 20 chars
-                        max_name_length = 20
-                        truncated_handle = (
-                            account_handle[:max_name_length]
-                            if len(account_handle) > max_name_length
-                            else account_handle
-                        )
-
-                        # Get net assets in default denomination
-                        net_assets = account.get("balanceData", {}).get("netCredexAssetsInDefaultDenom", "0.00")
-
-                        try:
-                            # Build and validate description length (WhatsApp 72 char limit)
-                            description = f"{account_name}: {net_assets}"
-                            if len(description) > 72:
-                                # Truncate to 69 chars + "..."
-                                description = description[:69] + "..."
-                        except Exception as e:
-                            logger.error(f"Failed to build description: {str(e)}")
-                            # Provide a fallback description (ensuring under 72 chars)
-                            account_type = account.get('accountType', '')[:65]  # Leave room for "Type: " + "..."
-                            description = f"Type: {account_type}"
-                            if len(description) > 72:
-                                description = description[:69] + "..."
-
-                        account_options.append({
-                            "id": account_id,
-                            "title": f"💳 {truncated_handle}",
-                            "description": description
-                        })
-
-                if not account_options:
-                    return ValidationResult.failure(
-                        message="No owned accounts found",
-                        field="accounts",
-                        details={"component": "multi_account_dashboard"}
-                    )
-
-                # Create sections for menu
-                sections = [
-                    Section(
-                        title="Your Accounts",
-                        rows=account_options
-                    )
-                ]
-
-                try:
-                    # Set component to await input before sending menu
-                    self.set_awaiting_input(True)
-
-                    # Send interactive menu
-                    self.state_manager.messaging.send_interactive(
-                        body=header,
-                        sections=sections,
-                        button_text="Select Account 💳"
-                    )
-
-                    return ValidationResult.success(True)
-                except Exception as e:
-                    return ValidationResult.failure(
-                        message=f"Failed to send menu message: {str(e)}",
-                        field="display",
-                        details={
-                            "component": "multi_account_dashboard",
-                            "error": str(e),
-                            "type": "validation"
-                        }
-                    )
+                return self._display_page()
 
             # Input Phase - When we get a response
-            component_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = component_data.get("incoming_message", {})
+            component_data = self.inputs.get("component_data", {})
+            incoming_message = self.inputs.get("incoming_message", {})
+            prefix = component_data.get("data", {}).get("prefix", "")
+
+            # For text messages, search accounts by handle prefix
+            if incoming_message.get("type") == MessageType.TEXT.value:
+                search = incoming_message.get("text", {}).get("body", "").strip().lstrip("@")
+                if search:
+                    return self._display_page(prefix=search)
 
             # For interactive messages, extract selection ID
             if incoming_message.get("type") == MessageType.INTERACTIVE.value:
                 text = incoming_message.get("text", {})
                 if text.get("interactive_type") == InteractiveType.LIST.value:
-                    selected_account_id = text.get("list_reply", {}).get("id")
-                    if selected_account_id:
+                    selected_id = text.get("list_reply", {}).get("id")
+
+                    # Page navigation
+                    if selected_id == SHOW_ALL_ID:
+                        return self._display_page()
+                    if selected_id and selected_id.startswith(NEXT_PAGE_ID):
+                        return self._display_page(prefix=prefix, after=selected_id[len(NEXT_PAGE_ID):])
+                    if selected_id and selected_id.startswith(PREV_PAGE_ID):
+                        return self._display_page(prefix=prefix, before=selected_id[len(PREV_PAGE_ID):])
+
+                    if selected_id:
                         # Set the selected account as active
                         self.state_manager.update_state({
-                            "active_account_id": selected_account_id
+                            "active_account_id": selected_id
                         })
                         # Tell headquarters to transition to account dashboard
                         self.set_result("account_selected")
@@ -174,3 +230,61 @@ class MultiAccountDashboard(InputComponent):
                     "error": str(e)
                 }
             )
+
+    def _display_page(
+        self,
+        prefix: str = "",
+        after: Optional[str] = None,
+        before: Optional[str] = None
+    ) -> ValidationResult:
+        """Display page of owned accounts and await selection"""
+        view = self.inputs.get("dashboard_view")
+        if not view.accounts:
+            return ValidationResult.failure(
+                message="No accounts found",
+                field="accounts",
+                details={"component": "multi_account_dashboard"}
+            )
+
+        sections, summary = render_page(view, prefix, after, before)
+        if not sections:
+            if prefix:
+                return ValidationResult.failure(
+                    message=f"No accounts found with a handle starting with {prefix}",
+                    field="selection",
+                    details={"component": self.type, "prefix": prefix}
+                )
+            return ValidationResult.failure(
+                message="No owned accounts found",
+                field="accounts",
+                details={"component": "multi_account_dashboard"}
+            )
+
+        # Keep search for page navigation
+        self.update_data({"prefix": prefix})
+
+        # Format header with member name
+        header = MULTI_ACCOUNT_DASHBOARD.format(firstname=self.inputs.get("member", {}).get("firstname", ""))
+
+        try:
+            # Set component to await input before sending menu
+            self.set_awaiting_input(True)
+
+            # Send interactive menu
+            self.state_manager.messaging.send_interactive(
+                body=header + summary,
+                sections=sections,
+                button_text="Select Account 💳"
+            )
+
+            return ValidationResult.success(True)
+        except Exception as e:
+            return ValidationResult.failure(
+                message=f"Failed to send menu message: {str(e)}",
+                field="display",
+                details={
+                    "component": "multi_account_dashboard",
+                    "error": str(e),
+                    "type": "validation"
+                }
+            )
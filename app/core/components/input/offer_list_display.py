@@ -1,14 +1,23 @@
 """Offer list display component
 
 This component handles displaying a list of Credex offers and processing offer selection.
+Accept and decline lists also offer a bulk action processing every pending offer in one turn.
+
+Offers are read from the dashboard index:
+- Sorted by amount or counterparty, orders built once per dashboard version
+- Paged to fit WhatsApp's 10 row list limit, cursors are sort keys carried
+  in the navigation row IDs
+- Selections are validated against the credexID index
 """
 
+import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from core.components.base import InputComponent
 from core.error.types import ValidationResult
 from core.messaging.types import Section
+from core.state.dashboard import offer_sort_key
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +28,34 @@ TITLES = {
     "cancel_offer": "*Cancel An Offer*"
 }
 
+# Bulk action rows for contexts that support processing every offer at once
+BULK_ACTION_ID = "process_all_offers"
+BULK_TITLES = {
+    "accept_offer": ("✅ Accept All", "Accept all {count} pending offers"),
+    "decline_offer": ("❌ Decline All", "Decline all {count} pending offers")
+}
+
+# WhatsApp allows 10 rows across all sections of a list
+MAX_ROWS = 10
+
+# Navigation row IDs, cursor sort key (JSON) follows the prefix
+NEXT_PAGE_ID = "offers_after:"
+PREV_PAGE_ID = "offers_before:"
+SORT_ID = "offers_sort:"
+
+# Sort orders and the row switching to them
+SORTS = {
+    "amount": ("💰 Sort by amount", "Largest offers first"),
+    "counterparty": ("👤 Sort by name", "Offers by counterparty name")
+}
+DEFAULT_SORT = "amount"
+
 
 class OfferListDisplay(InputComponent):
     """Handles displaying a list of Credex offers and processing selection"""
 
+    requires = ("dashboard", "dashboard_view", "active_account", "component_data", "incoming_message")
+
     def __init__(self):
         super().__init__("offer_list_display")
 
@@ -34,8 +67,8 @@ class OfferListDisplay(InputComponent):
         """
         try:
             # Get current state
-            current_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = current_data.get("incoming_message")
+            current_data = self.inputs.get("component_data", {})
+            incoming_message = self.inputs.get("incoming_message")
 
             # Initial activation - display offer list
             if not current_data.get("awaiting_input"):
@@ -81,6 +114,19 @@ class OfferListDisplay(InputComponent):
                 self.set_awaiting_input(False)
                 return ValidationResult.success(None)
 
+            # Handle bulk accept/decline of every pending offer
+            if credex_id == BULK_ACTION_ID:
+                return self._select_all_offers()
+
+            # Handle page navigation and sorting
+            sort = current_data.get("data", {}).get("sort", DEFAULT_SORT)
+            if credex_id.startswith(NEXT_PAGE_ID):
+                return self._display_offers(sort, after=json.loads(credex_id[len(NEXT_PAGE_ID):]))
+            if credex_id.startswith(PREV_PAGE_ID):
+                return self._display_offers(sort, before=json.loads(credex_id[len(PREV_PAGE_ID):]))
+            if credex_id.startswith(SORT_ID) and credex_id[len(SORT_ID):] in SORTS:
+                return self._display_offers(credex_id[len(SORT_ID):])
+
             # Validate credex_id exists in available offers
             if not self._is_valid_offer(credex_id):
                 return ValidationResult.failure(
@@ -110,11 +156,22 @@ class OfferListDisplay(InputComponent):
                 }
             )
 
-    def _display_offers(self) -> ValidationResult:
-        """Display offer list with selection buttons"""
+    def _display_offers(
+        self,
+        sort: str = DEFAULT_SORT,
+        after: Optional[List[Any]] = None,
+        before: Optional[List[Any]] = None
+    ) -> ValidationResult:
+        """Display page of offers with selection buttons
+
+        Args:
+            sort: Sort order from SORTS
+            after: Sort key cursor to start after
+            before: Sort key cursor to end before
+        """
         try:
             # Get dashboard data
-            dashboard = self.state_manager.get_state_value("dashboard")
+            dashboard = self.inputs.get("dashboard")
             logger.info(f"Dashboard state: {dashboard}")
             if not dashboard:
                 return ValidationResult.failure(
@@ -123,19 +180,26 @@ class OfferListDisplay(InputComponent):
                     details={"component": self.type}
                 )
 
-            # Get context and offers
+            # Get context and offer count
             context = self.state_manager.get_path()
-            offers = self._get_offers_for_context(context, dashboard)
-            logger.info(f"Got offers in _display_offers: {offers}")
+            direction = "out" if context == "cancel_offer" else "in"
+            account_id = (self.inputs.get("active_account") or {}).get("accountID")
+            dashboard_view = self.inputs.get("dashboard_view")
+            total = dashboard_view.pending_count(account_id, direction)
 
             # Display offers if available
-            if offers and len(offers) > 0:  # Explicitly check length
-                # No need to sort since we don't have timestamps
-                sorted_offers = offers
-
+            if total > 0:
                 # Get context-specific templates
                 title = TITLES.get(context, TITLES["accept_offer"])  # Use accept_offer as default
 
+                # Rows for back and bulk action, plus previous/next/sort when paged
+                fixed_rows = 1 + (1 if context in BULK_TITLES and total > 1 else 0)
+                paged = total > MAX_ROWS - fixed_rows
+                limit = MAX_ROWS - fixed_rows - (3 if paged else 0)
+                offers, position, total = dashboard_view.offer_page(
+                    account_id, direction, sort, after=after, before=before, limit=limit
+                )
+
                 # Create list message sections using Section objects
                 sections = [
                     Section(
@@ -154,15 +218,57 @@ class OfferListDisplay(InputComponent):
                     )
                 ]
 
-                # Add offer rows (up to 10)
-                for offer in sorted_offers[:10]:
-                    direction = "to" if context == "cancel_offer" else "from"
+                # Offer bulk action when there is more than one offer
+                if context in BULK_TITLES and total > 1:
+                    bulk_title, bulk_description = BULK_TITLES[context]
+                    sections.insert(1, Section(
+                        title="Bulk Actions ⚡",
+                        rows=[
+                            {
+                                "id": BULK_ACTION_ID,
+                                "title": bulk_title,
+                                "description": bulk_description.format(count=total)
+                            }
+                        ]
+                    ))
+
+                # Add page navigation and sort switch
+                if paged:
+                    navigation = []
+                    if position > 0:
+                        navigation.append({
+                            "id": f"{PREV_PAGE_ID}{json.dumps(offer_sort_key(offers[0], sort))}",
+                            "title": "⬅️ Previous offers",
+                            "description": f"Offers 1-{position}"
+                        })
+                    if position + len(offers) < total:
+                        navigation.append({
+                            "id": f"{NEXT_PAGE_ID}{json.dumps(offer_sort_key(offers[-1], sort))}",
+                            "title": "➡️ More offers",
+                            "description": f"{total - position - len(offers)} more offers"
+                        })
+                    other_sort = next(name for name in SORTS if name != sort)
+                    sort_title, sort_description = SORTS[other_sort]
+                    navigation.append({
+                        "id": f"{SORT_ID}{other_sort}",
+                        "title": sort_title,
+                        "description": sort_description
+                    })
+                    sections.insert(1, Section(title="More Offers", rows=navigation))
+                    title = f"{title}\n\nShowing {position + 1}-{position + len(offers)} of {total}"
+
+                # Keep sort for page navigation
+                self.update_data({"sort": sort})
+
+                # Add offer rows
+                for offer in offers:
+                    direction_text = "to" if context == "cancel_offer" else "from"
 
                     # Title shows amount (24 char limit)
                     row_title = f"💸 {offer['formattedInitialAmount']} 💸"
 
                     # Description shows full details (72 char limit)
-                    row_description = f"{direction} {offer['counterpartyAccountName']}"
+                    row_description = f"{direction_text} {offer['counterpartyAccountName']}"
 
                     sections[0].rows.append({
                         "id": str(offer["credexID"]),
@@ -201,22 +307,44 @@ class OfferListDisplay(InputComponent):
                 }
             )
 
-    def _get_offers_for_context(self, context: str, dashboard: Dict) -> List[Dict]:
+    def _select_all_offers(self) -> ValidationResult:
+        """Select every pending offer for bulk processing"""
+        context = self.state_manager.get_path()
+        if context not in BULK_TITLES:
+            return ValidationResult.failure(
+                message="Invalid offer selection. Please choose from the available offers.",
+                field="credex_id",
+                details={"credex_id": BULK_ACTION_ID, "context": context}
+            )
+
+        credex_ids = [
+            str(offer["credexID"])
+            for offer in self._get_offers_for_context(context)
+            if offer.get("credexID")
+        ]
+        if not credex_ids:
+            return ValidationResult.failure(
+                message="No offers available to process",
+                field="credex_id",
+                details={"credex_id": BULK_ACTION_ID}
+            )
+
+        # Store every credex_id for ProcessOfferApiCall
+        self.update_data({"credex_ids": credex_ids})
+
+        # Tell headquarters to process offers
+        self.set_result("process_offer")
+
+        # Release input wait
+        self.set_awaiting_input(False)
+        return ValidationResult.success(None)
+
+    def _get_offers_for_context(self, context: str) -> List[Dict]:
         """Get relevant offers based on context"""
         # Get active account
-        active_account_id = self.state_manager.get_state_value("active_account_id")
-        if not active_account_id:
-            logger.info("No active_account_id found in state")
-            return []
-
-        # Find active account
-        accounts = dashboard.get("accounts", [])
-        active_account = next(
-            (acc for acc in accounts if acc.get("accountID") == active_account_id),
-            None
-        )
+        active_account = self.inputs.get("active_account")
         if not active_account:
-            logger.info(f"Active account {active_account_id} not found in dashboard accounts")
+            logger.info("Active account not found in dashboard accounts")
             return []
 
         # Get offers based on context
@@ -236,15 +364,15 @@ class OfferListDisplay(InputComponent):
     def _is_valid_offer(self, credex_id: str) -> bool:
         """Check if credex_id exists in available offers"""
         try:
-            # Get dashboard and context
-            dashboard = self.state_manager.get_state_value("dashboard", {})
+            # Get context
             context = self.state_manager.get_path()
 
-            # Get relevant offers
-            offers = self._get_offers_for_context(context, dashboard)
-
-            # Check if credex_id exists
-            return any(str(offer.get("credexID")) == credex_id for offer in offers)
+            # Check if credex_id exists in the context's offer index
+            direction = "out" if context == "cancel_offer" else "in"
+            active_account = self.inputs.get("active_account") or {}
+            return self.inputs.get("dashboard_view").has_offer(
+                active_account.get("accountID"), direction, credex_id
+            )
 
         except Exception as e:
             logger.error(f"Error validating offer: {str(e)}")
@@ -35,6 +35,8 @@ LEDGER_ENTRY = """💰 {amount}
 class ViewLedger(InputComponent):
     """Handles ledger display and navigation"""
 
+    requires = ("active_account", "component_data", "incoming_message")
+
     def __init__(self):
         super().__init__("view_ledger")
 
@@ -42,8 +44,8 @@ class ViewLedger(InputComponent):
         """Validate ledger display and handle navigation"""
         try:
             # Get current state
-            current_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = current_data.get("incoming_message")
+            current_data = self.inputs.get("component_data", {})
+            incoming_message = self.inputs.get("incoming_message")
 
             # Initial activation - display first page
             if not current_data.get("awaiting_input"):
@@ -92,30 +94,17 @@ class ViewLedger(InputComponent):
         """Display ledger entries with navigation"""
         try:
             # Get account details
-            dashboard = self.state_manager.get_state_value("dashboard", {})
-            active_account_id = self.state_manager.get_state_value("active_account_id")
-            if not active_account_id:
-                return ValidationResult.failure(
-                    message="No active account selected",
-                    field="active_account",
-                    details={"component": self.type}
-                )
-
-            account = next(
-                (acc for acc in dashboard.get("accounts", [])
-                 if acc.get("accountID") == active_account_id),
-                None
-            )
+            account = self.inputs.get("active_account")
             if not account:
                 return ValidationResult.failure(
                     message="Active account not found",
                     field="account",
-                    details={"active_account_id": active_account_id}
+                    details={"component": self.type}
                 )
 
             # Store pagination state
             self.update_data({
-                "account_id": active_account_id,
+                "account_id": account.get("accountID"),
                 "start_row": start_row,
                 "num_rows": 7  # Fixed to 7 rows per page
             })
@@ -144,7 +133,7 @@ class ViewLedger(InputComponent):
         """Handle navigation button press"""
         try:
             # Get current pagination state
-            current_data = self.state_manager.get_state_value("component_data", {}).get("data", {})
+            current_data = self.inputs.get("component_data", {}).get("data", {})
             start_row = current_data.get("start_row", 0)
 
             # Handle different buttons
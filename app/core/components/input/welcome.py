@@ -17,6 +17,11 @@ We're your portal 🚪to the credex ecosystem 🌱
 
 Become a member 🌐 and open a free account 💳 to get started 📈"""
 
+# Registration button
+WELCOME_BUTTONS = [
+    Button(id="become_member", title="Become a Member")
+]
+
 
 class Welcome(InputComponent):
     """Handles registration welcome screen"""
@@ -33,16 +38,13 @@ class Welcome(InputComponent):
         try:
             # Get current state
             current_data = self.state_manager.get_state_value("component_data", {})
-            incoming_message = current_data.get("incoming_message")
+            incoming_message = self.state_manager.get_incoming_message()
 
             # Initial activation - send welcome message
             if not current_data.get("awaiting_input"):
                 self.state_manager.messaging.send_interactive(
                     body=REGISTER,
-                    buttons=[Button(
-                        id="become_member",
-                        title="Become a Member"
-                    )]
+                    buttons=WELCOME_BUTTONS
                 )
                 self.set_awaiting_input(True)
                 return ValidationResult.success(None)
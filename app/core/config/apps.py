@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        # Compile static WhatsApp payload templates before serving
+        from services.whatsapp import payloads
+        payloads.warm()
@@ -13,6 +13,8 @@ from core.error.exceptions import ComponentException
 from core.error.types import ValidationResult
 from core.state.interface import StateManagerInterface
 
+from .dependencies import report_usage, resolve
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,10 +71,15 @@ def activate_component(component_type: str, state_manager: StateManagerInterface
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Set state manager on component")
 
+        # Resolve declared inputs in one pass before validation
+        component.set_inputs(resolve(component.requires, state_manager))
+
         # Activate component
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Activating component")
-        result = component.validate(None)
+        with state_manager.messaging.background_sends(component.independent_effects):
+            result = component.validate(None)
+        report_usage(component.type, component.inputs)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Activation result: {result}")
 
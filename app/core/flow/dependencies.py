@@ -0,0 +1,171 @@
+"""Component data dependencies
+
+Components declare the inputs they read on entry in their `requires` tuple and
+the flow engine resolves them all before validate runs:
+- State fields are read once from the state loaded for this turn
+- The incoming message comes from the envelope parsed when it arrived
+- Derived inputs (member, dashboard view, active account) are computed once
+  per step, using the dashboard index instead of scanning accounts
+- Upstream resources are started in parallel on a shared executor and only
+  awaited when the component first reads them
+
+Upstream resolvers run off the request thread and must never touch state -
+they only get the resolved state fields.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Set
+
+from core.api import ledger_cache
+from core.state.dashboard import DashboardView
+from core.state.interface import StateManagerInterface
+
+logger = logging.getLogger(__name__)
+
+# State fields components may require
+STATE_FIELDS = frozenset({
+    "dashboard",
+    "active_account_id",
+    "component_data",
+    "action"
+})
+
+
+def _member(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Get member section of dashboard"""
+    return (fields.get("dashboard") or {}).get("member") or {}
+
+
+def _dashboard_view(fields: Dict[str, Any]) -> DashboardView:
+    """Get indexed view of dashboard"""
+    return DashboardView(fields.get("dashboard"))
+
+
+def _active_account(fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get active account from dashboard"""
+    active_account_id = fields.get("active_account_id")
+    if not active_account_id:
+        return None
+    return DashboardView(fields.get("dashboard")).account(active_account_id)
+
+
+def _ledger_page(fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get cached ledger page for pagination stored in component data"""
+    data = (fields.get("component_data") or {}).get("data", {})
+    account_id = data.get("account_id")
+    if not account_id:
+        return None
+    return ledger_cache.get_page(account_id, data.get("start_row", 0), data.get("num_rows", 7))
+
+
+# Inputs for the current turn that are not kept in state
+TURN_INPUTS: Dict[str, Any] = {
+    "incoming_message": lambda state_manager: state_manager.get_incoming_message()
+}
+
+# Derived inputs and the state fields they are computed from
+DERIVED: Dict[str, tuple] = {
+    "member": (_member, ("dashboard",)),
+    "dashboard_view": (_dashboard_view, ("dashboard",)),
+    "active_account": (_active_account, ("dashboard", "active_account_id"))
+}
+
+# Upstream resources fetched in parallel, and the state fields they need
+UPSTREAM: Dict[str, tuple] = {
+    "ledger_page": (_ledger_page, ("component_data",))
+}
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
+
+class ComponentInputs:
+    """Inputs resolved for one component step"""
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None, pending: Optional[Dict[str, Future]] = None):
+        self._values = values or {}
+        self._pending = pending or {}
+        self.accessed: Set[str] = set()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get input, waiting for upstream resource if still in flight"""
+        self.accessed.add(name)
+        if name in self._pending:
+            future = self._pending.pop(name)
+            try:
+                self._values[name] = future.result()
+            except Exception as e:
+                logger.warning(f"Prefetch of {name} failed: {str(e)}")
+                self._values[name] = None
+
+        value = self._values.get(name)
+        return value if value is not None else default
+
+    @property
+    def declared(self) -> Set[str]:
+        """Names of all declared inputs"""
+        return set(self._values) | set(self._pending)
+
+
+def resolve(requires: Iterable[str], state_manager: StateManagerInterface) -> ComponentInputs:
+    """Resolve declared inputs for component step
+
+    Args:
+        requires: Declared input names
+        state_manager: State manager instance
+
+    Returns:
+        ComponentInputs: Resolved inputs
+
+    Raises:
+        ValueError: If an input name is unknown
+    """
+    requires = tuple(requires)
+    if not requires:
+        return ComponentInputs()
+
+    started = time.monotonic()
+
+    # Collect every state field needed, directly or by derived/upstream inputs
+    field_names = set()
+    for name in requires:
+        if name in STATE_FIELDS:
+            field_names.add(name)
+        elif name in DERIVED:
+            field_names.update(DERIVED[name][1])
+        elif name in UPSTREAM:
+            field_names.update(UPSTREAM[name][1])
+        elif name not in TURN_INPUTS:
+            raise ValueError(f"Unknown component input: {name}")
+
+    fields = {name: state_manager.get_state_value(name) for name in field_names}
+
+    # Start upstream fetches first so they overlap with the rest
+    pending = {
+        name: _executor.submit(UPSTREAM[name][0], fields)
+        for name in requires if name in UPSTREAM
+    }
+
+    values = {name: fields[name] for name in requires if name in STATE_FIELDS}
+    for name in requires:
+        if name in TURN_INPUTS:
+            values[name] = TURN_INPUTS[name](state_manager)
+    for name in requires:
+        if name in DERIVED:
+            values[name] = DERIVED[name][0](fields)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Resolved inputs {list(requires)} in {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+
+    return ComponentInputs(values, pending)
+
+
+def report_usage(component_type: str, inputs: ComponentInputs) -> None:
+    """Log declared inputs the component never read"""
+    if logger.isEnabledFor(logging.DEBUG):
+        unused = inputs.declared - inputs.accessed
+        if unused:
+            logger.debug(f"{component_type} declared unused inputs: {sorted(unused)}")
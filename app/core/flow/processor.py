@@ -13,11 +13,12 @@ freedom to store their own data.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Union
 
 from core.error.exceptions import ComponentException
 from core.error.handler import ErrorHandler
 from core.error.types import ValidationResult
+from core.messaging.inbound import InboundMessage
 from core.messaging.service import MessagingService
 from core.messaging.types import Message, MessageType, TextContent
 from core.messaging.utils import get_recipient
@@ -45,35 +46,55 @@ class FlowProcessor:
         if not hasattr(state_manager, 'messaging') or state_manager.messaging is None:
             state_manager.messaging = messaging_service
 
-    def process_message(self, payload: Dict[str, Any]) -> Message:
+    def process_message(self, message: Union[InboundMessage, Dict[str, Any]]) -> Message:
         """Process message through flow framework
 
+        Sends from components with independent effects overlap with later steps
+        during the turn. The turn completes once they have all gone out.
+
         Args:
-            payload: Raw message payload
+            message: Envelope parsed where the message arrived, or raw payload
+
+        Returns:
+            Message: Response message
+        """
+        self.messaging.begin_turn()
+        try:
+            response = self._process_turn(message)
+        finally:
+            send_error = self.messaging.end_turn()
+
+        if send_error:
+            return self._system_error_message(send_error)
+        return response
+
+    def _process_turn(self, message: Union[InboundMessage, Dict[str, Any]]) -> Message:
+        """Process message through components until awaiting input
+
+        Args:
+            message: Envelope parsed where the message arrived, or raw payload
 
         Returns:
             Message: Response message
         """
         try:
-            # Extract message data using channel-specific implementation
-            extracted_data = self._extract_message_data(payload)
-            if not extracted_data:
+            # Parse raw payloads using channel-specific implementation
+            inbound = message if isinstance(message, InboundMessage) else self._extract_message_data(message)
+            if not inbound:
                 logger.debug("No valid message data extracted")
                 return None
 
             # Initialize channel state
-            channel_info = extracted_data.get("channel")
-            if channel_info:
-                self.state_manager.initialize_channel(
-                    channel_type=channel_info["type"],
-                    channel_id=channel_info["identifier"],
-                    mock_testing=channel_info.get("mock_testing", False)
-                )
-
-            # Set message in state
-            message = extracted_data.get("message")
+            self.state_manager.initialize_channel(
+                channel_type=inbound.channel_type,
+                channel_id=inbound.channel_id,
+                mock_testing=inbound.mock_testing
+            )
+
+            # Hold message for the turn - components read it from the state manager
+            message = inbound.to_dict()
             if message:
-                self.state_manager.set_incoming_message(message)
+                self.state_manager.set_incoming_message(inbound)
             else:
                 logger.debug("No valid message content")
                 return None
@@ -100,10 +121,9 @@ class FlowProcessor:
             # For greetings, always start fresh
             if message_type == MessageType.TEXT.value and message_text in GREETING_COMMANDS:
                 try:
-                    # Preserve channel and message info
+                    # Preserve channel info
                     channel_type = self.state_manager.get_channel_type()
                     channel_id = self.state_manager.get_channel_id()
-                    current_message = self.state_manager.get_incoming_message()
 
                     # Clear all state (mock_testing is preserved)
                     self.state_manager.clear_all_state()
@@ -114,10 +134,6 @@ class FlowProcessor:
                         channel_id=channel_id
                     )
 
-                    # Restore message and start login flow
-                    if current_message:
-                        self.state_manager.set_incoming_message(current_message)
-
                     # Start login flow through headquarters
                     self.state_manager.transition_flow(
                         path="login",
@@ -140,7 +156,6 @@ class FlowProcessor:
                     # Initialize channel with preserved info
                     channel_type = self.state_manager.get_channel_type()
                     channel_id = self.state_manager.get_channel_id()
-                    current_message = self.state_manager.get_incoming_message()
 
                     # Clear all state (mock_testing is preserved)
                     self.state_manager.clear_all_state()
@@ -151,10 +166,6 @@ class FlowProcessor:
                         channel_id=channel_id
                     )
 
-                    # Restore message
-                    if current_message:
-                        self.state_manager.set_incoming_message(current_message)
-
                     # Start login flow through headquarters
                     self.state_manager.transition_flow(
                         path="login",
@@ -208,7 +219,6 @@ class FlowProcessor:
                         # Clear state and start login flow
                         channel_type = self.state_manager.get_channel_type()
                         channel_id = self.state_manager.get_channel_id()
-                        current_message = self.state_manager.get_incoming_message()
 
                         self.state_manager.clear_all_state()
 
@@ -218,10 +228,6 @@ class FlowProcessor:
                             channel_id=channel_id
                         )
 
-                        # Restore message
-                        if current_message:
-                            self.state_manager.set_incoming_message(current_message)
-
                         # Start login flow
                         self.state_manager.transition_flow(
                             path="login",
@@ -278,33 +284,34 @@ class FlowProcessor:
             return Message(content=content, recipient=recipient)
 
         except Exception as e:
-            # Handle system errors
-            error_response = ErrorHandler.handle_system_error(
-                code="FLOW_ERROR",
-                service="flow_processor",
-                action="process_message",
-                message=str(e),
-                error=e
-            )
-            recipient = get_recipient(self.state_manager)
-            content = TextContent(body=error_response["error"]["message"])
-            return Message(content=content, recipient=recipient)
-
-    def _extract_message_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract message data from payload
+            return self._system_error_message(e)
+
+    def _system_error_message(self, error: Exception) -> Message:
+        """Handle system error and build response message"""
+        error_response = ErrorHandler.handle_system_error(
+            code="FLOW_ERROR",
+            service="flow_processor",
+            action="process_message",
+            message=str(error),
+            error=error
+        )
+        recipient = get_recipient(self.state_manager)
+        content = TextContent(body=error_response["error"]["message"])
+        return Message(content=content, recipient=recipient)
+
+    def _extract_message_data(self, payload: Dict[str, Any]) -> Optional[InboundMessage]:
+        """Parse raw payload into inbound message
 
         This method should be overridden by channel-specific processors
-        to handle channel-specific payload formats.
+        to handle channel-specific payload formats. Callers that have already
+        parsed the message pass the InboundMessage instead.
 
         Args:
             payload: Raw message payload
 
         Returns:
-            Dict[str, Any]: Extracted message data including:
-                - type: Message type
-                - text: Message text data
-                - channel_type: Channel type string ("whatsapp" or "sms")
-                - channel_id: Channel identifier string (e.g. phone number)
+            Optional[InboundMessage]: Parsed message, None if payload has no
+            member message
 
         Raises:
             ComponentException: If payload is invalid
@@ -0,0 +1,60 @@
+"""Run flow worker processes for dispatcher mode (see core.api.dispatch)"""
+
+import logging
+import multiprocessing
+import signal
+import time
+from typing import Dict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.api import dispatch
+
+logger = logging.getLogger(__name__)
+
+RESTART_CHECK_INTERVAL = 1  # seconds
+
+
+def _run_worker(node: str) -> None:
+    """Serve partition with default signal handling (not the supervisor's)"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    dispatch.serve(node)
+
+
+class Command(BaseCommand):
+    help = "Run one flow worker process per node on the dispatch ring (FLOW_WORKERS)"
+
+    def handle(self, *args, **options):
+        dispatch.rebalance()
+
+        # Fork so workers share the loaded app; redis-py pools reset per process
+        context = multiprocessing.get_context("fork")
+        workers: Dict[str, multiprocessing.Process] = {}
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        self.stdout.write(f"Starting {settings.FLOW_WORKERS} flow workers")
+        while not stopping:
+            for node in dispatch.worker_names(settings.FLOW_WORKERS):
+                process = workers.get(node)
+                if process is not None and process.is_alive():
+                    continue
+                if process is not None:
+                    logger.warning(f"Flow worker {node} exited ({process.exitcode}), restarting")
+                workers[node] = context.Process(target=_run_worker, args=(node,), name=node, daemon=True)
+                workers[node].start()
+            time.sleep(RESTART_CHECK_INTERVAL)
+
+        self.stdout.write("Stopping flow workers")
+        for process in workers.values():
+            process.terminate()
+        for process in workers.values():
+            process.join()
@@ -0,0 +1,231 @@
+"""Adaptive outbound send concurrency
+
+Limits in-flight sends per sender with an AIMD limit shared by every worker
+through Redis, so we find the most throughput the channel will take without
+manual tuning:
+- Each send holds a slot (a leased entry in a Redis sorted set) while in flight
+- Healthy responses grow the limit by 1/limit, about one slot per round trip
+- 429s, 5xx responses, timeouts and responses slower than GRAPH_LATENCY_TARGET
+  halve it, at most once per DECREASE_COOLDOWN so one bad burst counts once
+- Retry-After pauses all sends for the sender until it has passed
+
+Slots are leased, so a worker dying mid-send cannot leak capacity. Redis
+errors, or waiting past OUTBOUND_MAX_WAIT for a full limit, let the send go
+out without a slot. A Retry-After pause is never skipped - sends that would
+have to wait past OUTBOUND_MAX_WAIT for it fail instead.
+
+Reported metrics:
+- outbound_concurrency_limit{sender} -> current limit
+- outbound_backoffs_total{reason} -> limit decreases by cause
+"""
+
+import logging
+import time
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from config.timing import (GRAPH_CONCURRENCY_INITIAL, GRAPH_CONCURRENCY_MAX,
+                           GRAPH_CONCURRENCY_MIN, GRAPH_LATENCY_TARGET,
+                           OUTBOUND_MAX_WAIT)
+from core import metrics
+from core.messaging.exceptions import MessageDeliveryError
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_KEY_PREFIX = "outbound_concurrency"
+
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 1.0  # seconds
+SLOT_LEASE = 30  # seconds, longer than any send
+POLL_INTERVAL = 0.05  # seconds
+DEFAULT_RETRY_AFTER = 1.0  # seconds, for 429s without Retry-After
+
+# KEYS: limit hash, in-flight sorted set
+# ARGV: slot token, lease seconds, initial limit
+# Returns: {wait seconds (0 acquired, -1 full), limit}
+_ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'limit', 'retry_until')
+local limit = tonumber(state[1]) or tonumber(ARGV[3])
+local retry_until = tonumber(state[2]) or 0
+
+if retry_until > now then
+    return {tostring(retry_until - now), tostring(limit)}
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+if redis.call('ZCARD', KEYS[2]) < math.floor(limit) then
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), ARGV[1])
+    redis.call('EXPIRE', KEYS[2], tonumber(ARGV[2]))
+    return {'0', tostring(limit)}
+end
+return {'-1', tostring(limit)}
+"""
+
+# KEYS: limit hash, in-flight sorted set
+# ARGV: slot token, overloaded (0/1), retry after seconds, initial, min, max,
+#       decrease factor, decrease cooldown
+# Returns: {limit, decreased (0/1), previous limit}
+_RELEASE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+if ARGV[1] ~= '' then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+end
+
+local state = redis.call('HMGET', KEYS[1], 'limit', 'last_decrease')
+local limit = tonumber(state[1]) or tonumber(ARGV[4])
+local last_decrease = tonumber(state[2]) or 0
+local previous = limit
+local decreased = 0
+
+if ARGV[2] == '1' then
+    if now - last_decrease >= tonumber(ARGV[8]) then
+        limit = math.max(tonumber(ARGV[5]), limit * tonumber(ARGV[7]))
+        redis.call('HSET', KEYS[1], 'last_decrease', tostring(now))
+        decreased = 1
+    end
+else
+    limit = math.min(tonumber(ARGV[6]), limit + 1 / limit)
+end
+
+local retry_after = tonumber(ARGV[3])
+if retry_after > 0 then
+    redis.call('HSET', KEYS[1], 'retry_until', tostring(now + retry_after))
+end
+
+redis.call('HSET', KEYS[1], 'limit', tostring(limit))
+return {tostring(limit), decreased, tostring(previous)}
+"""
+
+_scripts = {}
+
+
+def _script(source: str):
+    """Get registered script"""
+    if source not in _scripts:
+        _scripts[source] = get_redis_client().register_script(source)
+    return _scripts[source]
+
+
+def _keys(sender_id: str) -> list:
+    """Get Redis keys for sender"""
+    return [
+        f"{CONCURRENCY_KEY_PREFIX}:{sender_id}:limit",
+        f"{CONCURRENCY_KEY_PREFIX}:{sender_id}:inflight"
+    ]
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Get Retry-After header (seconds or HTTP date) in seconds"""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def acquire(sender_id: str) -> Optional[str]:
+    """Wait for in-flight slot
+
+    Args:
+        sender_id: Sending channel identity (e.g. WhatsApp phone number ID)
+
+    Returns:
+        Optional[str]: Slot token for release, None if sending without a slot
+
+    Raises:
+        MessageDeliveryError: If sends are paused (Retry-After) past OUTBOUND_MAX_WAIT
+    """
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + OUTBOUND_MAX_WAIT
+
+    while True:
+        try:
+            wait, limit = _script(_ACQUIRE_SCRIPT)(
+                keys=_keys(sender_id),
+                args=[token, SLOT_LEASE, GRAPH_CONCURRENCY_INITIAL]
+            )
+        except Exception as e:
+            logger.warning(f"Outbound concurrency limiter unavailable: {str(e)}")
+            return None
+
+        wait = float(wait)
+        if wait == 0:
+            return token
+
+        remaining = deadline - time.monotonic()
+        if wait > remaining:
+            # Paused by Retry-After - never send before it has passed
+            logger.warning(f"Sends paused for {wait:.1f}s (Retry-After), failing send")
+            raise MessageDeliveryError(
+                message="Sends paused by Retry-After",
+                service="outbound",
+                action="acquire",
+                delivery_details={"sender": sender_id, "retry_after": wait}
+            )
+        if remaining <= 0:
+            logger.warning(f"No send slot within {OUTBOUND_MAX_WAIT}s (limit {float(limit):.1f}), sending anyway")
+            return None
+        time.sleep(min(remaining, wait if wait > 0 else POLL_INTERVAL))
+
+
+def release(
+    sender_id: str,
+    token: Optional[str],
+    status_code: Optional[int],
+    latency: float,
+    retry_after: Optional[str] = None
+) -> None:
+    """Release slot and adjust limit from send outcome
+
+    Args:
+        sender_id: Sending channel identity
+        token: Slot token from acquire, None if sent without a slot
+        status_code: Response status, None if the request failed
+        latency: Request duration in seconds
+        retry_after: Retry-After response header
+    """
+    if status_code is None:
+        reason = "error"
+    elif status_code == 429:
+        reason = "rate_limited"
+    elif status_code >= 500:
+        reason = "server_error"
+    elif latency > GRAPH_LATENCY_TARGET:
+        reason = "latency"
+    else:
+        reason = None
+
+    delay = parse_retry_after(retry_after)
+    if status_code == 429 and not delay:
+        delay = DEFAULT_RETRY_AFTER
+
+    try:
+        limit, decreased, previous = _script(_RELEASE_SCRIPT)(
+            keys=_keys(sender_id),
+            args=[
+                token or "", 1 if reason else 0, delay,
+                GRAPH_CONCURRENCY_INITIAL, GRAPH_CONCURRENCY_MIN, GRAPH_CONCURRENCY_MAX,
+                DECREASE_FACTOR, DECREASE_COOLDOWN
+            ]
+        )
+        if int(decreased):
+            metrics.increment("outbound_backoffs_total", labels={"reason": reason})
+            logger.warning(f"Outbound concurrency reduced to {float(limit):.1f} ({reason})")
+        if int(float(limit)) != int(float(previous)):
+            # Report whole-slot changes only
+            metrics.set_gauge("outbound_concurrency_limit", float(limit), labels={"sender": sender_id})
+        if delay:
+            logger.warning(f"Pausing sends for {delay:.1f}s (Retry-After)")
+
+    except Exception as e:
+        logger.warning(f"Failed to update outbound concurrency: {str(e)}")
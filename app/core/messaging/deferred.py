@@ -0,0 +1,99 @@
+"""Deferred messages
+
+A deferred message is only sent if the work it announces outlasts a deadline.
+ProcessingNow uses this so fast credex-core calls skip the "processing" notice
+(and its Graph round trip) while slow calls still reassure the member:
+- schedule() arms a timer for the channel
+- settle() cancels the timer, or waits for an in-flight send so the notice
+  always lands before whatever is sent next
+
+MessagingService settles the recipient's deferred message before every send,
+and API components settle it as soon as their call finishes.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict
+
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+_pending: Dict[str, "DeferredMessage"] = {}
+_pending_lock = threading.Lock()
+
+
+class DeferredMessage:
+    """Message sent by timer unless settled first"""
+
+    def __init__(self, channel_id: str, send: Callable[[], None], delay: float):
+        self.channel_id = channel_id
+        self._send = send
+        self._lock = threading.Lock()
+        self._settled = False
+        self._sent = False
+        self._timer = threading.Timer(delay, self._fire)
+        self._timer.daemon = True
+
+    def start(self) -> None:
+        """Start deadline timer"""
+        self._timer.start()
+
+    def _fire(self) -> None:
+        """Send message if not settled"""
+        with self._lock:
+            if self._settled:
+                return
+            self._settled = True
+
+            # Unregister first so the send itself does not try to settle us
+            with _pending_lock:
+                if _pending.get(self.channel_id) is self:
+                    del _pending[self.channel_id]
+
+            try:
+                self._send()
+                self._sent = True
+                metrics.increment("deferred_messages_total", labels={"outcome": "sent"})
+            except Exception as e:
+                logger.warning(f"Failed to send deferred message: {str(e)}")
+
+    def settle(self) -> bool:
+        """Cancel pending send, waiting for one already in progress
+
+        Returns:
+            bool: Whether the message was sent
+        """
+        self._timer.cancel()
+        with self._lock:
+            self._settled = True
+            return self._sent
+
+
+def schedule(channel_id: str, send: Callable[[], None], delay: float) -> None:
+    """Schedule deferred message for channel, settling any earlier one
+
+    Args:
+        channel_id: Channel identifier
+        send: Callable sending the message
+        delay: Seconds to wait before sending
+    """
+    settle(channel_id)
+
+    deferred = DeferredMessage(channel_id, send, delay)
+    with _pending_lock:
+        _pending[channel_id] = deferred
+    deferred.start()
+
+
+def settle(channel_id: str) -> None:
+    """Settle pending deferred message for channel, if any"""
+    with _pending_lock:
+        deferred = _pending.pop(channel_id, None)
+    if deferred is None:
+        return
+
+    if not deferred.settle():
+        metrics.increment("deferred_messages_total", labels={"outcome": "skipped"})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Deferred message skipped")
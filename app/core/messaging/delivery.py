@@ -0,0 +1,244 @@
+"""Outbound delivery tracking from status webhooks
+
+Status callbacks (sent, delivered, read, failed) are most of our webhook
+traffic. They are acknowledged on a fast path and measured off the request:
+- Each outbound send records its message ID (wamid), type and send time
+- The webhook appends statuses to a Redis stream with a single pipelined XADD
+- A consumer thread in each worker reads the stream in batches through a
+  shared consumer group and hands each batch to the status lane, which
+  correlates statuses with the recorded sends and reports latencies and
+  failures
+
+Tracking is best-effort - statuses are read without acknowledgement, so a
+worker dying mid-batch only loses those data points.
+
+Reported metrics:
+- delivery_latency_seconds{type, stage} -> send to delivered, delivered to read
+- delivery_statuses_total{status} -> statuses received
+- delivery_failures_total{type, code} -> failed deliveries by error code
+
+Status and error code labels outside the known sets are reported as "other",
+so callbacks cannot grow metric cardinality.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config.timing import DELIVERY_TRACK_TTL
+from core import metrics
+from core.api import lanes
+from core.state.persistence.async_client import get_async_redis_client
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_KEY_PREFIX = "delivery"
+STATUS_STREAM = "delivery:statuses"
+CONSUMER_GROUP = "delivery_metrics"
+
+STREAM_MAX_LENGTH = 100000  # approximate, oldest statuses trimmed
+BATCH_SIZE = 200
+BLOCK_MS = 5000
+ERROR_BACKOFF = 5  # seconds
+
+# Delivery latency buckets in seconds (a minute to a day for reads)
+LATENCY_BUCKETS = (1, 2, 5, 10, 30, 60, 300, 900, 3600, 21600, 86400)
+
+# Label values reported as is, others as "other"
+STATUSES = frozenset({"sent", "delivered", "read", "failed"})
+# Cloud API error codes for failed deliveries
+ERROR_CODES = frozenset({
+    "0", "1", "2", "3", "4", "10", "100", "190", "200", "368", "80007",
+    "130429", "130472", "130497", "131000", "131005", "131008", "131009",
+    "131016", "131021", "131026", "131031", "131042", "131045", "131047",
+    "131048", "131049", "131050", "131051", "131052", "131053", "131056",
+    "131057", "132000", "132001", "132005", "132007", "132012", "132015",
+    "132016", "132068", "132069", "133000", "133004", "133005", "133006",
+    "133008", "133009", "133010", "133015", "133016", "134011", "135000",
+})
+
+_consumer: Optional[threading.Thread] = None
+_consumer_lock = threading.Lock()
+
+
+def _redis_key(message_id: str) -> str:
+    """Get Redis key for outbound message record"""
+    return f"{DELIVERY_KEY_PREFIX}:{message_id}"
+
+
+def record_sent(message_id: str, message_type: str) -> None:
+    """Record outbound message for status correlation
+
+    Args:
+        message_id: Channel message ID returned by the send (e.g. wamid)
+        message_type: Content type sent (text, interactive, template)
+    """
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.hset(_redis_key(message_id), mapping={"sent": time.time(), "type": message_type})
+        pipe.expire(_redis_key(message_id), DELIVERY_TRACK_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record outbound message: {str(e)}")
+
+
+def _entries(statuses: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Get stream entries for status callbacks"""
+    entries = []
+    for status in statuses:
+        if not isinstance(status, dict) or not status.get("id"):
+            continue
+        errors = status.get("errors") or [{}]
+        entries.append({
+            "id": status["id"],
+            "status": status.get("status", ""),
+            "timestamp": status.get("timestamp", ""),
+            "code": str(errors[0].get("code", "")) if isinstance(errors[0], dict) else ""
+        })
+    return entries
+
+
+def enqueue(statuses: List[Dict[str, Any]]) -> None:
+    """Append status callbacks to stream for the consumer
+
+    Args:
+        statuses: Status objects from webhook value.statuses
+    """
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for entry in _entries(statuses):
+            pipe.xadd(STATUS_STREAM, entry, maxlen=STREAM_MAX_LENGTH, approximate=True)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to enqueue delivery statuses: {str(e)}")
+        return
+
+    _ensure_consumer()
+
+
+async def aenqueue(statuses: List[Dict[str, Any]]) -> None:
+    """Append status callbacks to stream from the event loop (see enqueue)"""
+    try:
+        pipe = get_async_redis_client().pipeline(transaction=False)
+        for entry in _entries(statuses):
+            pipe.xadd(STATUS_STREAM, entry, maxlen=STREAM_MAX_LENGTH, approximate=True)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to enqueue delivery statuses: {str(e)}")
+        return
+
+    _ensure_consumer()
+
+
+def _ensure_consumer() -> None:
+    """Start consumer thread in this process if not running"""
+    global _consumer
+    if _consumer is not None and _consumer.is_alive():
+        return
+    with _consumer_lock:
+        if _consumer is not None and _consumer.is_alive():
+            return
+        _consumer = threading.Thread(target=_consume, name="delivery-status-consumer", daemon=True)
+        _consumer.start()
+
+
+def _consume() -> None:
+    """Read status batches from stream until the process exits"""
+    redis_client = get_redis_client()
+    consumer_name = f"{socket.gethostname()}-{os.getpid()}"
+    try:
+        redis_client.xgroup_create(STATUS_STREAM, CONSUMER_GROUP, id="0", mkstream=True)
+    except Exception as e:
+        # BUSYGROUP - another worker created it first
+        if "BUSYGROUP" not in str(e):
+            logger.warning(f"Failed to create delivery consumer group: {str(e)}")
+
+    logger.info(f"Delivery status consumer {consumer_name} started")
+    while True:
+        try:
+            response = redis_client.xreadgroup(
+                CONSUMER_GROUP,
+                consumer_name,
+                {STATUS_STREAM: ">"},
+                count=BATCH_SIZE,
+                block=BLOCK_MS,
+                noack=True
+            )
+            for _, entries in response or []:
+                # Wait for the batch so a backlog stays in the stream
+                lanes.submit(lanes.STATUS, process_batch, [fields for _, fields in entries]).result()
+        except Exception as e:
+            logger.warning(f"Delivery status consumer error: {str(e)}")
+            time.sleep(ERROR_BACKOFF)
+
+
+def _error_code(code: Optional[str]) -> str:
+    """Get failures metric label for error code"""
+    if not code:
+        return "unknown"
+    return code if code in ERROR_CODES else "other"
+
+
+def process_batch(statuses: List[Dict[str, str]]) -> None:
+    """Correlate statuses with recorded sends and report metrics
+
+    Args:
+        statuses: Stream entries (id, status, timestamp, code)
+    """
+    if not statuses:
+        return
+
+    redis_client = get_redis_client()
+    pipe = redis_client.pipeline(transaction=False)
+    for status in statuses:
+        pipe.hmget(_redis_key(status["id"]), "sent", "delivered", "type")
+    records = pipe.execute()
+
+    updates = redis_client.pipeline(transaction=False)
+    # Delivered times recorded by this batch, not yet written
+    delivered_at: Dict[str, float] = {}
+    for status, (sent, delivered, message_type) in zip(statuses, records):
+        state = status.get("status", "")
+        metrics.increment("delivery_statuses_total", labels={"status": state if state in STATUSES else "other"})
+        if sent is None:
+            # Not sent by us or record expired
+            continue
+
+        try:
+            timestamp = float(status.get("timestamp") or time.time())
+        except ValueError:
+            timestamp = time.time()
+
+        delivered = delivered_at.get(status["id"], delivered)
+        if state == "delivered" and delivered is None:
+            metrics.observe(
+                "delivery_latency_seconds",
+                max(0.0, timestamp - float(sent)),
+                labels={"type": message_type, "stage": "delivered"},
+                buckets=LATENCY_BUCKETS
+            )
+            updates.hset(_redis_key(status["id"]), "delivered", timestamp)
+            delivered_at[status["id"]] = timestamp
+        elif state == "read":
+            # Read can arrive without a delivered status
+            metrics.observe(
+                "delivery_latency_seconds",
+                max(0.0, timestamp - float(delivered or sent)),
+                labels={"type": message_type, "stage": "read"},
+                buckets=LATENCY_BUCKETS
+            )
+            updates.delete(_redis_key(status["id"]))
+        elif state == "failed":
+            metrics.increment(
+                "delivery_failures_total",
+                labels={"type": message_type, "code": _error_code(status.get("code"))}
+            )
+            updates.delete(_redis_key(status["id"]))
+    updates.execute()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Processed {len(statuses)} delivery statuses")
@@ -0,0 +1,125 @@
+"""Inbound message envelope
+
+Channel payloads are parsed once, where they arrive, into an InboundMessage.
+The envelope is then handed to the flow processor and held by the state
+manager for the rest of the turn, so components read the current message
+without it being written to and read back from state.
+"""
+
+from typing import Any, Dict, Optional
+
+from .types import InteractiveType, MessageType
+
+
+class InboundMessage:
+    """Channel-agnostic message received from a member"""
+
+    __slots__ = (
+        "channel_type",
+        "channel_id",
+        "message_id",
+        "mock_testing",
+        "type",
+        "body",
+        "interactive_type",
+        "reply_id",
+        "reply_title",
+        "reply_description",
+        "received_at",
+        "_dict"
+    )
+
+    def __init__(
+        self,
+        channel_type: str,
+        channel_id: str,
+        message_id: Optional[str] = None,
+        mock_testing: bool = False,
+        type: Optional[str] = None,
+        body: str = "",
+        interactive_type: Optional[str] = None,
+        reply_id: Optional[str] = None,
+        reply_title: Optional[str] = None,
+        reply_description: Optional[str] = None,
+        received_at: Optional[float] = None
+    ):
+        """Initialize envelope
+
+        Args:
+            channel_type: Channel type ("whatsapp", "sms")
+            channel_id: Sender identifier on the channel (e.g. wa_id)
+            message_id: Channel message ID (e.g. wamid)
+            mock_testing: Whether the message came from the mock server
+            type: MessageType value, None for unsupported messages
+            body: Text body for text messages
+            interactive_type: InteractiveType value for interactive replies
+            reply_id: Selected button or list row ID
+            reply_title: Selected button or list row title
+            reply_description: Selected list row description
+            received_at: When the webhook delivered the message (epoch seconds)
+        """
+        self.channel_type = channel_type
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.mock_testing = mock_testing
+        self.type = type
+        self.body = body
+        self.interactive_type = interactive_type
+        self.reply_id = reply_id
+        self.reply_title = reply_title
+        self.reply_description = reply_description
+        self.received_at = received_at
+        self._dict = None
+
+    @property
+    def is_supported(self) -> bool:
+        """Whether the flow can process this message"""
+        return self.type == MessageType.TEXT.value or (
+            self.type == MessageType.INTERACTIVE.value and self.interactive_type is not None
+        )
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        """Get message in incoming_message format, None if unsupported
+
+        Built once per envelope - callers must not modify the result.
+        """
+        if self._dict is None and self.is_supported:
+            if self.type == MessageType.TEXT.value:
+                text = {"body": self.body}
+            elif self.interactive_type == InteractiveType.BUTTON.value:
+                text = {
+                    "interactive_type": InteractiveType.BUTTON.value,
+                    "button": {
+                        "id": self.reply_id,
+                        "title": self.reply_title,
+                        "type": "reply"
+                    }
+                }
+            else:
+                text = {
+                    "interactive_type": InteractiveType.LIST.value,
+                    "list_reply": {
+                        "id": self.reply_id,
+                        "title": self.reply_title,
+                        "description": self.reply_description
+                    }
+                }
+
+            message = {"type": self.type, "text": text}
+            # Keep channel message ID to tell repeat deliveries from new messages
+            if self.message_id:
+                message["id"] = self.message_id
+            self._dict = message
+        return self._dict
+
+    def to_fields(self) -> Dict[str, Any]:
+        """Get constructor arguments, to rebuild the envelope in another process"""
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+
+    def channel_info(self) -> Dict[str, Any]:
+        """Get channel info in extracted message format"""
+        return {
+            "type": self.channel_type,
+            "identifier": self.channel_id,
+            "mock_testing": self.mock_testing
+        }
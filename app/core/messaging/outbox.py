@@ -0,0 +1,69 @@
+"""Per-turn outbox
+
+Lets sends that nothing downstream depends on run in the background while the
+flow moves on to the next step (for example the greeting going out while the
+login call is in flight):
+- One worker thread per turn, so queued messages keep their order
+- Any synchronous send drains the outbox first, so order is kept across both
+- Errors from background sends are raised at the next drain, or returned at
+  the end of the turn for the flow processor to report
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Outbox:
+    """Ordered background sends for one turn"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+
+    def submit(self, send: Callable[[], Any]) -> None:
+        """Queue send behind any earlier queued sends"""
+        with self._lock:
+            if self._executor is None:
+                # Created on first use - most turns never queue a send
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="outbox")
+            self._futures.append(self._executor.submit(send))
+
+    def drain(self) -> None:
+        """Wait for queued sends
+
+        Raises:
+            Exception: First error raised by a queued send
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        if not futures:
+            return
+
+        wait(futures)
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+    def close(self) -> Optional[Exception]:
+        """Drain and stop worker
+
+        Returns:
+            Optional[Exception]: First error raised by a queued send
+        """
+        try:
+            self.drain()
+            return None
+        except Exception as e:
+            logger.error(f"Background send failed: {str(e)}")
+            return e
+        finally:
+            with self._lock:
+                executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=False)
@@ -0,0 +1,142 @@
+"""Outbound send rate limiting
+
+Paces outbound sends against two Redis token buckets shared by every worker:
+- One per sender (WhatsApp phone number ID), at the channel's throughput limit
+- One per recipient, at MAX_REQUESTS_PER_WINDOW per RATE_LIMIT_WINDOW
+
+A send without a token is queued rather than failed: it reserves the next
+token in both buckets and waits until that token is due, so bursts drain at
+the bucket rate in arrival order. Reservations are capped at OUTBOUND_MAX_WAIT
+ahead; past that the send retries until its own deadline, then goes out
+anyway and is counted as an overflow.
+
+Reported metrics:
+- outbound_sends_total{outcome} -> immediate / queued / overflow sends
+- outbound_queue_wait_ms -> time queued sends waited
+- outbound_bucket_tokens{bucket="sender"} -> tokens left, negative while queued
+"""
+
+import logging
+import time
+
+from config.timing import (MAX_REQUESTS_PER_WINDOW, OUTBOUND_MAX_WAIT,
+                           OUTBOUND_RECIPIENT_BURST, OUTBOUND_SENDER_BURST,
+                           OUTBOUND_SENDER_RATE, RATE_LIMIT_WINDOW)
+from core import metrics
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "outbound_bucket"
+RECIPIENT_RATE = MAX_REQUESTS_PER_WINDOW / RATE_LIMIT_WINDOW  # messages per second
+
+# Refill both buckets, then reserve a token in each if the later of the two is
+# due within max_wait. Uses the Redis clock so workers agree on elapsed time.
+# KEYS: sender bucket, recipient bucket
+# ARGV: sender rate, sender burst, recipient rate, recipient burst, max wait (s)
+# Returns: {wait seconds or -1 if not reserved, sender tokens}
+_RESERVE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local max_wait = tonumber(ARGV[5])
+local tokens = {}
+local wait = 0
+
+for i = 1, 2 do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local burst = tonumber(ARGV[i * 2])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local current = tonumber(state[1]) or burst
+    local last = tonumber(state[2]) or now
+    current = math.min(burst, current + (now - last) * rate)
+    tokens[i] = current
+    if current < 1 then
+        wait = math.max(wait, (1 - current) / rate)
+    end
+end
+
+if wait > max_wait then
+    return {'-1', tostring(tokens[1])}
+end
+
+for i = 1, 2 do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local burst = tonumber(ARGV[i * 2])
+    tokens[i] = tokens[i] - 1
+    redis.call('HSET', KEYS[i], 'tokens', tostring(tokens[i]), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], math.ceil(burst / rate + max_wait) + 1)
+end
+
+return {tostring(wait), tostring(tokens[1])}
+"""
+
+_reserve = None
+
+
+def _reserve_script():
+    """Get registered reserve script"""
+    global _reserve
+    if _reserve is None:
+        _reserve = get_redis_client().register_script(_RESERVE_SCRIPT)
+    return _reserve
+
+
+def acquire(sender_id: str, recipient_id: str) -> float:
+    """Wait for send slot for recipient
+
+    Never raises - if Redis is unavailable the send goes out unpaced.
+
+    Args:
+        sender_id: Sending channel identity (e.g. WhatsApp phone number ID)
+        recipient_id: Recipient channel identifier
+
+    Returns:
+        float: Seconds waited
+    """
+    started = time.monotonic()
+    deadline = started + OUTBOUND_MAX_WAIT
+    queued = False
+
+    try:
+        while True:
+            wait, sender_tokens = _reserve_script()(
+                keys=[
+                    f"{RATE_LIMIT_KEY_PREFIX}:sender:{sender_id}",
+                    f"{RATE_LIMIT_KEY_PREFIX}:recipient:{recipient_id}"
+                ],
+                args=[
+                    OUTBOUND_SENDER_RATE, OUTBOUND_SENDER_BURST,
+                    RECIPIENT_RATE, OUTBOUND_RECIPIENT_BURST,
+                    OUTBOUND_MAX_WAIT
+                ]
+            )
+            wait = float(wait)
+
+            if wait == 0 and not queued:
+                metrics.increment("outbound_sends_total", labels={"outcome": "immediate"})
+                return 0.0
+
+            queued = True
+            metrics.set_gauge("outbound_bucket_tokens", float(sender_tokens), labels={"bucket": "sender"})
+
+            if wait >= 0:
+                # Reserved - wait until our token is due
+                time.sleep(wait)
+                waited = time.monotonic() - started
+                metrics.increment("outbound_sends_total", labels={"outcome": "queued"})
+                metrics.observe("outbound_queue_wait_ms", waited * 1000)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Outbound send queued for {waited:.2f}s")
+                return waited
+
+            # Queue full - retry until our own deadline
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.increment("outbound_sends_total", labels={"outcome": "overflow"})
+                logger.warning("Outbound rate limit queue full, sending unpaced")
+                return time.monotonic() - started
+            time.sleep(min(remaining, 1 / RECIPIENT_RATE))
+
+    except Exception as e:
+        logger.warning(f"Outbound rate limiter unavailable: {str(e)}")
+        return time.monotonic() - started
@@ -6,9 +6,12 @@ This service maintains the layered architecture:
 3. MessagingService orchestrates which implementation to use
 """
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
+from core.messaging import deferred
 from core.messaging.base import BaseMessagingService
+from core.messaging.outbox import Outbox
 from core.messaging.types import (
     Button, InteractiveContent, InteractiveType, Message, MessageRecipient,
     TemplateContent, TextContent
@@ -35,6 +38,11 @@ class MessagingService:
 
         self.channel_service = channel_service
         self.state_manager = state_manager
+
+        # Per-turn background sends (see begin_turn)
+        self._outbox: Optional[Outbox] = None
+        self._background_sends = False
+
         if state_manager:
             # Set up bidirectional relationships
             self.channel_service.state_manager = state_manager  # Give channel service access to state
@@ -46,6 +54,42 @@ class MessagingService:
 
     def send_message(self, message: Message) -> Message:
         """Send message through appropriate channel service"""
+        return self._deliver(message)
+
+    def begin_turn(self) -> None:
+        """Start turn, allowing background sends"""
+        self._outbox = Outbox()
+
+    def end_turn(self) -> Optional[Exception]:
+        """Finish turn once background sends complete
+
+        Returns:
+            Optional[Exception]: First background send error, for the caller to report
+        """
+        outbox, self._outbox = self._outbox, None
+        return outbox.close() if outbox else None
+
+    @contextmanager
+    def background_sends(self, enabled: bool = True) -> Iterator[None]:
+        """Send in background while active, for effects nothing downstream depends on"""
+        previous, self._background_sends = self._background_sends, enabled
+        try:
+            yield
+        finally:
+            self._background_sends = previous
+
+    def _deliver(self, message: Message) -> Message:
+        """Send message after any deferred or queued message for its recipient"""
+        if message.recipient:
+            deferred.settle(message.recipient.identifier)
+
+        outbox = self._outbox
+        if outbox is not None:
+            if self._background_sends:
+                outbox.submit(lambda: self.channel_service.send_message(message))
+                return message
+            outbox.drain()
+
         return self.channel_service.send_message(message)
 
     def _get_recipient(self) -> MessageRecipient:
@@ -90,7 +134,7 @@ class MessagingService:
 
         # Inject recipient and send
         message = self._inject_recipient(message)
-        return self.channel_service.send_message(message)
+        return self._deliver(message)
 
     def send_interactive(
         self,
@@ -131,7 +175,7 @@ class MessagingService:
 
         # Inject recipient and send
         message = self._inject_recipient(message)
-        return self.channel_service.send_message(message)
+        return self._deliver(message)
 
     def send_template(
         self,
@@ -162,7 +206,7 @@ class MessagingService:
 
         # Inject recipient and send
         message = self._inject_recipient(message)
-        return self.channel_service.send_message(message)
+        return self._deliver(message)
 
     def handle_incoming_message(self, payload: Dict[str, Any]) -> None:
         """Handle incoming message through appropriate channel service"""
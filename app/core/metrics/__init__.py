@@ -0,0 +1,15 @@
+"""Core Metrics
+
+Counters, gauges and histograms shared across workers through Redis and
+exported in Prometheus text format at /metrics/.
+"""
+
+from .registry import aincrement, increment, observe, render, set_gauge
+
+__all__ = [
+    'aincrement',
+    'increment',
+    'observe',
+    'render',
+    'set_gauge'
+]
@@ -0,0 +1,181 @@
+"""Redis-backed metrics registry
+
+Counters, gauges and histograms are kept in Redis hashes so every gunicorn
+worker (and background thread) reports into the same series. Each series is a
+hash field named in Prometheus exposition format, so rendering is a straight
+dump of the hashes.
+
+Recording a metric does no I/O, so it is safe on hot paths and the event
+loop. Each process aggregates in memory and a flusher thread writes the
+accumulated deltas (and latest gauges) to Redis every METRICS_FLUSH_INTERVAL,
+one pipeline per flush. Rendering flushes the serving process first.
+
+Recording a metric never raises - a Redis failure costs us the data points of
+one flush, not the member's request.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from config.timing import METRICS_FLUSH_INTERVAL
+from core.state.persistence.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "vimbiso_"
+
+COUNTERS_KEY = "metrics:counters"
+GAUGES_KEY = "metrics:gauges"
+HISTOGRAMS_KEY = "metrics:histograms"
+
+# Latency buckets in milliseconds
+DEFAULT_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Pending since the last flush: series -> delta (counters, histograms) or
+# latest value (gauges)
+_counters: Dict[str, int] = {}
+_gauges: Dict[str, float] = {}
+_histogram_counts: Dict[str, int] = {}
+_histogram_sums: Dict[str, float] = {}
+_lock = threading.Lock()
+
+_flusher: Optional[threading.Thread] = None
+
+
+def _series(name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    """Get series name in exposition format"""
+    if not labels:
+        return f"{METRIC_PREFIX}{name}"
+    label_str = ",".join(f'{key}="{labels[key]}"' for key in sorted(labels))
+    return f"{METRIC_PREFIX}{name}{{{label_str}}}"
+
+
+def increment(name: str, amount: int = 1, labels: Optional[Dict[str, str]] = None) -> None:
+    """Increment counter
+
+    Args:
+        name: Counter name (without prefix, conventionally ending in _total)
+        amount: Amount to add
+        labels: Optional series labels
+    """
+    series = _series(name, labels)
+    with _lock:
+        _counters[series] = _counters.get(series, 0) + amount
+    _ensure_flusher()
+
+
+async def aincrement(name: str, amount: int = 1, labels: Optional[Dict[str, str]] = None) -> None:
+    """Increment counter from the event loop (see increment)"""
+    increment(name, amount, labels)
+
+
+def set_gauge(name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+    """Set gauge to current value
+
+    Args:
+        name: Gauge name (without prefix)
+        value: Current value
+        labels: Optional series labels
+    """
+    series = _series(name, labels)
+    with _lock:
+        _gauges[series] = value
+    _ensure_flusher()
+
+
+def observe(
+    name: str,
+    value: float,
+    labels: Optional[Dict[str, str]] = None,
+    buckets: Iterable[float] = DEFAULT_BUCKETS
+) -> None:
+    """Record histogram observation
+
+    Args:
+        name: Histogram name (without prefix)
+        value: Observed value
+        labels: Optional series labels
+        buckets: Upper bounds of cumulative buckets
+    """
+    labels = labels or {}
+    counts = [
+        _series(f"{name}_bucket", {**labels, "le": str(bound)})
+        for bound in buckets
+        if value <= bound
+    ]
+    counts.append(_series(f"{name}_bucket", {**labels, "le": "+Inf"}))
+    counts.append(_series(f"{name}_count", labels))
+    sum_series = _series(f"{name}_sum", labels)
+    with _lock:
+        for series in counts:
+            _histogram_counts[series] = _histogram_counts.get(series, 0) + 1
+        _histogram_sums[sum_series] = _histogram_sums.get(sum_series, 0.0) + value
+    _ensure_flusher()
+
+
+def flush() -> None:
+    """Write metrics recorded by this process since the last flush to Redis"""
+    global _counters, _gauges, _histogram_counts, _histogram_sums
+    with _lock:
+        counters, gauges = _counters, _gauges
+        histogram_counts, histogram_sums = _histogram_counts, _histogram_sums
+        _counters, _gauges, _histogram_counts, _histogram_sums = {}, {}, {}, {}
+    if not (counters or gauges or histogram_counts or histogram_sums):
+        return
+
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for series, amount in counters.items():
+            pipe.hincrby(COUNTERS_KEY, series, amount)
+        if gauges:
+            pipe.hset(GAUGES_KEY, mapping=gauges)
+        for series, amount in histogram_counts.items():
+            pipe.hincrby(HISTOGRAMS_KEY, series, amount)
+        for series, amount in histogram_sums.items():
+            pipe.hincrbyfloat(HISTOGRAMS_KEY, series, amount)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to flush metrics: {str(e)}")
+
+
+def _flush_periodically() -> None:
+    """Flush metrics until the process exits"""
+    while True:
+        time.sleep(METRICS_FLUSH_INTERVAL)
+        flush()
+
+
+def _ensure_flusher() -> None:
+    """Start flusher thread in this process if not running"""
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _lock:
+        if _flusher is not None and _flusher.is_alive():
+            return
+        _flusher = threading.Thread(target=_flush_periodically, name="metrics-flusher", daemon=True)
+        _flusher.start()
+
+
+def _reset_after_fork() -> None:
+    """Drop parent's pending metrics and lock in a forked child"""
+    global _lock, _counters, _gauges, _histogram_counts, _histogram_sums
+    _lock = threading.Lock()
+    _counters, _gauges, _histogram_counts, _histogram_sums = {}, {}, {}, {}
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def render() -> str:
+    """Render all series in Prometheus text exposition format"""
+    flush()
+    redis_client = get_redis_client()
+    lines = []
+    for key in (COUNTERS_KEY, GAUGES_KEY, HISTOGRAMS_KEY):
+        series = redis_client.hgetall(key) or {}
+        lines.extend(f"{name} {value}" for name, value in sorted(series.items()))
+    return "\n".join(lines) + "\n"
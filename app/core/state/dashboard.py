@@ -0,0 +1,384 @@
+"""Dashboard state helpers
+
+Merges dashboard sections from API responses into stored dashboard state at
+account level instead of replacing the whole dashboard:
+- Accounts are indexed by accountID with a content hash per account
+- Changed or new accounts are upserted, missing accounts are deleted
+- Unchanged accounts keep their stored instance
+- Callers skip the state write entirely when nothing changed
+- Cached ledger pages of changed accounts are dropped, whichever client
+  changed them
+
+Components read the dashboard through DashboardView, which gets accounts,
+pending counts and offers in constant time from a lookup index instead of
+scanning account and offer lists on every render. Only the account hashes are
+stored with the dashboard; the index is built in process from them and
+cached by dashboard version, so state stays small.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Dashboard key holding accountID -> content hash index
+ACCOUNT_HASHES_KEY = "accountHashes"
+
+# Dashboard key of the lookup index stored by earlier versions, dropped on merge
+LEGACY_INDEX_KEY = "index"
+
+INDEX_CACHE_SIZE = 1024
+_index_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+# Offer directions and the account lists holding them
+OFFER_LISTS = {
+    "in": "pendingInData",
+    "out": "pendingOutData"
+}
+
+
+def content_hash(value: Any) -> str:
+    """Get stable content hash for JSON-serializable value"""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def merge_dashboard(current: Dict[str, Any], incoming: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Merge incoming dashboard into current dashboard
+
+    Accounts are only replaced when present in the incoming dashboard. When they
+    are, the incoming list is authoritative for membership and order.
+
+    Args:
+        current: Dashboard currently stored in state
+        incoming: Dashboard section from API response
+
+    Returns:
+        Tuple[Dict[str, Any], bool]: Merged dashboard and whether anything changed
+    """
+    current = current or {}
+    merged = dict(current)
+    changed = False
+
+    # Non-account sections (member, etc.) replaced when different
+    for key, value in incoming.items():
+        if key in ("accounts", ACCOUNT_HASHES_KEY, LEGACY_INDEX_KEY):
+            continue
+        if current.get(key) != value:
+            merged[key] = value
+            changed = True
+
+    if LEGACY_INDEX_KEY in merged:
+        del merged[LEGACY_INDEX_KEY]
+        changed = True
+
+    if "accounts" not in incoming:
+        return merged, changed
+
+    stored_hashes = current.get(ACCOUNT_HASHES_KEY) or {}
+    current_accounts = {
+        account.get("accountID"): account
+        for account in current.get("accounts") or []
+    }
+
+    accounts = []
+    hashes = {}
+    upserted = 0
+    changed_ids = []
+    for account in incoming["accounts"] or []:
+        account_id = account.get("accountID")
+        account_hash = content_hash(account)
+        hashes[account_id] = account_hash
+
+        if account_id in current_accounts and stored_hashes.get(account_id) == account_hash:
+            # Unchanged - keep stored account
+            accounts.append(current_accounts[account_id])
+        else:
+            accounts.append(account)
+            upserted += 1
+            if account_id:
+                changed_ids.append(account_id)
+
+    deleted = len(set(current_accounts) - set(hashes))
+    reordered = list(current_accounts) != list(hashes)
+
+    # Balance or pending offers changed, possibly through another client
+    if changed_ids:
+        # Imported here to avoid circular imports
+        from core.api import ledger_cache
+        for account_id in changed_ids:
+            ledger_cache.invalidate(account_id)
+
+    if upserted or deleted or reordered or ACCOUNT_HASHES_KEY not in merged:
+        changed = True
+        merged["accounts"] = accounts
+        merged[ACCOUNT_HASHES_KEY] = hashes
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Dashboard merge: {upserted} upserted, {deleted} deleted, "
+            f"{len(accounts) - upserted} unchanged"
+        )
+
+    return merged, changed
+
+
+def _offer_amount(offer: Dict[str, Any]) -> float:
+    """Get numeric amount from formatted offer amount (e.g. "1,250.00 USD")"""
+    try:
+        return float((offer.get("formattedInitialAmount") or "0").split()[0].replace(",", ""))
+    except (ValueError, IndexError):
+        return 0.0
+
+
+# Offer sort orders, keys end in credexID so they are unique
+OFFER_SORTS = {
+    "amount": lambda offer: [-_offer_amount(offer), str(offer.get("credexID"))],  # largest first
+    "counterparty": lambda offer: [(offer.get("counterpartyAccountName") or "").lower(), str(offer.get("credexID"))]
+}
+
+
+def offer_sort_key(offer: Dict[str, Any], sort: str) -> List[Any]:
+    """Get offer's position key in sort order"""
+    return OFFER_SORTS[sort](offer)
+
+
+def _page(keys: List[List[Any]], low: int, high: int, after: Optional[List[Any]],
+          before: Optional[List[Any]], limit: int) -> Tuple[int, int]:
+    """Get [start, end) of page within keys[low:high] for cursor"""
+    if after is not None:
+        start = min(high, max(low, bisect_right(keys, after)))
+        end = min(high, start + limit)
+    elif before is not None:
+        end = max(low, min(high, bisect_left(keys, before)))
+        start = max(low, end - limit)
+    else:
+        start = low
+        end = min(high, low + limit)
+    return start, end
+
+
+def dashboard_version(accounts: List[Dict[str, Any]], account_hashes: Dict[str, str]) -> str:
+    """Get hash of account contents and order, changes whenever any account does"""
+    return content_hash([
+        [account.get("accountID"), account_hashes.get(account.get("accountID"))]
+        for account in accounts
+    ])
+
+
+def get_index(
+    accounts: List[Dict[str, Any]],
+    account_hashes: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Get lookup index for dashboard accounts, built once per version in each process
+
+    Args:
+        accounts: Dashboard accounts
+        account_hashes: accountID -> content hash, computed when not given
+    """
+    accounts = accounts or []
+    if account_hashes is None:
+        account_hashes = {account.get("accountID"): content_hash(account) for account in accounts}
+    version = dashboard_version(accounts, account_hashes)
+
+    with _index_cache_lock:
+        index = _index_cache.get(version)
+        if index is not None:
+            _index_cache.move_to_end(version)
+            return index
+
+    index = build_index(accounts, account_hashes)
+    with _index_cache_lock:
+        _index_cache[version] = index
+        if len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def build_index(
+    accounts: List[Dict[str, Any]],
+    account_hashes: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Build lookup index for dashboard accounts
+
+    Args:
+        accounts: Dashboard accounts
+        account_hashes: accountID -> content hash, computed when not given
+
+    Returns:
+        Dict[str, Any]: Index with
+            accounts: accountID -> position in accounts
+            offers: accountID -> direction ("in"/"out") -> credexID -> position in offer list
+            offerOrders: accountID -> direction -> sort -> sorted offer sort keys
+            personalAccountID: ID of member's personal account
+            ownedHandles: [lowercased handle, accountID] of owned accounts, sorted
+            version: Dashboard version (see dashboard_version)
+    """
+    accounts = accounts or []
+    if account_hashes is None:
+        account_hashes = {account.get("accountID"): content_hash(account) for account in accounts}
+
+    account_positions = {}
+    offers = {}
+    offer_orders = {}
+    owned_handles = []
+    personal_account_id = None
+
+    for position, account in enumerate(accounts):
+        account_id = account.get("accountID")
+        account_positions[account_id] = position
+        offers[account_id] = {
+            direction: {
+                str(offer.get("credexID")): offer_position
+                for offer_position, offer in enumerate(account.get(list_key) or [])
+            }
+            for direction, list_key in OFFER_LISTS.items()
+        }
+        offer_orders[account_id] = {
+            direction: {
+                sort: sorted(sort_key(offer) for offer in account.get(list_key) or [])
+                for sort, sort_key in OFFER_SORTS.items()
+            }
+            for direction, list_key in OFFER_LISTS.items()
+        }
+        if personal_account_id is None and account.get("accountType") == "PERSONAL":
+            personal_account_id = account_id
+        if account.get("isOwnedAccount"):
+            owned_handles.append([(account.get("accountHandle") or "").lower(), account_id])
+
+    owned_handles.sort()
+
+    return {
+        "accounts": account_positions,
+        "offers": offers,
+        "offerOrders": offer_orders,
+        "personalAccountID": personal_account_id,
+        "ownedHandles": owned_handles,
+        "version": dashboard_version(accounts, account_hashes)
+    }
+
+
+class DashboardView:
+    """Indexed read access to dashboard state"""
+
+    __slots__ = ("data", "_index")
+
+    def __init__(self, dashboard: Optional[Dict[str, Any]]):
+        self.data = dashboard or {}
+        self._index = get_index(self.data.get("accounts"), self.data.get(ACCOUNT_HASHES_KEY))
+
+    @property
+    def version(self) -> str:
+        """Hash of account contents and order"""
+        return self._index["version"]
+
+    @property
+    def member(self) -> Dict[str, Any]:
+        """Member section"""
+        return self.data.get("member") or {}
+
+    @property
+    def accounts(self) -> List[Dict[str, Any]]:
+        """Accounts in dashboard order"""
+        return self.data.get("accounts") or []
+
+    def account(self, account_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get account by ID"""
+        position = self._index["accounts"].get(account_id)
+        return self.accounts[position] if position is not None else None
+
+    @property
+    def personal_account(self) -> Optional[Dict[str, Any]]:
+        """Member's personal account"""
+        return self.account(self._index.get("personalAccountID"))
+
+    def pending_count(self, account_id: Optional[str], direction: str) -> int:
+        """Get number of pending offers in direction ("in" or "out")"""
+        return len(self._index["offers"].get(account_id, {}).get(direction, {}))
+
+    def offers(self, account_id: Optional[str], direction: str) -> List[Dict[str, Any]]:
+        """Get pending offers in direction ("in" or "out")"""
+        account = self.account(account_id)
+        return (account.get(OFFER_LISTS[direction]) or []) if account else []
+
+    def offer(self, account_id: Optional[str], direction: str, credex_id: str) -> Optional[Dict[str, Any]]:
+        """Get pending offer by credexID"""
+        position = self._index["offers"].get(account_id, {}).get(direction, {}).get(str(credex_id))
+        return self.offers(account_id, direction)[position] if position is not None else None
+
+    def has_offer(self, account_id: Optional[str], direction: str, credex_id: str) -> bool:
+        """Check if credexID is pending in direction"""
+        return str(credex_id) in self._index["offers"].get(account_id, {}).get(direction, {})
+
+    def owned_page(
+        self,
+        prefix: str = "",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Get page of owned accounts in handle order
+
+        Cursors are lowercased handles, so pages stay stable when accounts are
+        added or removed between requests.
+
+        Args:
+            prefix: Only include handles starting with prefix (case-insensitive)
+            after: Start after this handle
+            before: End before this handle
+            limit: Maximum accounts in page
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int, int]: Accounts, position of first
+            account among matches, and number of matches
+        """
+        handles = self._index["ownedHandles"]
+        prefix = prefix.lower()
+        low = bisect_left(handles, [prefix])
+        high = bisect_left(handles, [prefix + "\uffff"]) if prefix else len(handles)
+
+        start, end = _page(
+            handles, low, high,
+            [after, "\uffff"] if after is not None else None,
+            [before] if before is not None else None,
+            limit
+        )
+        accounts = [self.account(account_id) for _, account_id in handles[start:end]]
+        return accounts, start - low, high - low
+
+    def offer_page(
+        self,
+        account_id: Optional[str],
+        direction: str,
+        sort: str = "amount",
+        after: Optional[List[Any]] = None,
+        before: Optional[List[Any]] = None,
+        limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Get page of pending offers in sort order
+
+        Cursors are sort keys (see offer_sort_key), so pages stay stable when
+        offers are accepted or arrive between requests.
+
+        Args:
+            account_id: Account ID
+            direction: "in" or "out"
+            sort: Sort order from OFFER_SORTS
+            after: Start after this sort key
+            before: End before this sort key
+            limit: Maximum offers in page
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int, int]: Offers, position of first
+            offer, and number of offers
+        """
+        keys = self._index["offerOrders"].get(account_id, {}).get(direction, {}).get(sort, [])
+        start, end = _page(keys, 0, len(keys), after, before, limit)
+        offers = [self.offer(account_id, direction, key[-1]) for key in keys[start:end]]
+        return offers, start, len(keys)
@@ -6,8 +6,9 @@ while avoiding circular dependencies.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
+from core.messaging.inbound import InboundMessage
 from core.messaging.interface import MessagingServiceInterface
 
 
@@ -213,11 +214,12 @@ class StateManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def set_incoming_message(self, message: Dict[str, Any]) -> None:
-        """Set the incoming message
+    def set_incoming_message(self, message: Union[InboundMessage, Dict[str, Any]]) -> None:
+        """Set the incoming message for the current turn
 
         Args:
-            message: Message dict conforming to incoming_message schema in component_data
+            message: Inbound message envelope, or message dict conforming to
+                incoming_message schema in component_data
         """
         pass
 
@@ -9,11 +9,12 @@ This module implements the StateManagerInterface with:
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from core.error.exceptions import ComponentException
 from core.error.handler import ErrorHandler
 from core.error.types import ErrorContext
+from core.messaging.inbound import InboundMessage
 from core.messaging.interface import MessagingServiceInterface
 from core.state.persistence.client import get_redis_client
 
@@ -39,6 +40,7 @@ class StateManager(StateManagerInterface):
 
         self.key_prefix = key_prefix
         self._messaging = None  # Will be set by MessagingService
+        self._incoming_message = None  # Current turn's message, never persisted
 
         # Initialize Redis with explicit error handling
         try:
@@ -220,27 +222,21 @@ class StateManager(StateManagerInterface):
 
     def get_incoming_message(self) -> Optional[Dict[str, Any]]:
         """Get current incoming message if it exists"""
-        try:
-            component_data = self.get_state_value("component_data", {})
-            message = component_data.get("incoming_message")
-
-            # Validate message structure if present
-            if message:
-                test_update = {
-                    "component_data": {
-                        "incoming_message": message
-                    }
-                }
-                StateValidator.prepare_state_update(test_update)
+        message = self._incoming_message
+        if isinstance(message, InboundMessage):
+            return message.to_dict()
+        return message
 
-            return message
+    def set_incoming_message(self, message: Union[InboundMessage, Dict[str, Any]]) -> None:
+        """Set the incoming message for this turn
 
-        except Exception as e:
-            logger.error(f"Error getting incoming message: {str(e)}")
-            return None
+        The message is held in memory rather than state - it arrives with the
+        request and is only read while processing it.
+        """
+        if isinstance(message, InboundMessage):
+            self._incoming_message = message
+            return
 
-    def set_incoming_message(self, message: Dict[str, Any]) -> None:
-        """Set the incoming message with validation"""
         if not isinstance(message, dict):
             raise ComponentException(
                 message="Message must be a dictionary",
@@ -249,23 +245,9 @@ class StateManager(StateManagerInterface):
                 value=str(type(message))
             )
 
-        try:
-            current_data = self.get_state_value("component_data", {})
-            updates = {
-                "component_data": {
-                    **current_data,
-                    "incoming_message": message
-                }
-            }
-            self.update_state(updates)
-
-        except Exception as e:
-            raise ComponentException(
-                message=f"Failed to set incoming message: {str(e)}",
-                component="state_manager",
-                field="incoming_message",
-                value=str(message)
-            ) from e
+        # Validate message structure
+        StateValidator.prepare_state_update({"component_data": {"incoming_message": message}})
+        self._incoming_message = message
 
     def transition_flow(self, path: str, component: str) -> None:
         """Transition flow to new path/component.
@@ -400,13 +382,6 @@ class StateManager(StateManagerInterface):
                 "awaiting_input": awaiting_input
             }
 
-            # Only preserve incoming_message if it exists and is valid
-            current = self.get_state_value("component_data", {})
-            incoming_message = current.get("incoming_message")
-            if incoming_message and isinstance(incoming_message, dict):
-                if "type" in incoming_message and "text" in incoming_message:
-                    new_data["incoming_message"] = incoming_message
-
             # Update state
             self.update_state({"component_data": new_data})
 
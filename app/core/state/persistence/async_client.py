@@ -0,0 +1,40 @@
+"""Async Redis client factory
+
+Used by the ASGI webhook path for the work done on the event loop before a
+turn is handed to the flow (status streams, dedupe, rate limits, metrics).
+Keys are shared with the sync client, so both paths see the same data.
+"""
+from typing import Optional
+
+import redis.asyncio as redis
+from django.conf import settings
+
+_client: Optional[redis.Redis] = None
+
+
+def get_async_redis_client() -> redis.Redis:
+    """Get async Redis client for this process
+
+    Configured like the django-redis client (decode_responses, retry on
+    timeout, keepalive) with its own connection pool.
+    """
+    global _client
+    if _client is None:
+        _client = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            retry_on_timeout=True,
+            socket_keepalive=True,
+            socket_connect_timeout=30,
+            socket_timeout=30,
+            max_connections=settings.REDIS_MAX_CONNECTIONS
+        )
+    return _client
+
+
+async def close_async_redis_client() -> None:
+    """Close async client connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -70,7 +70,9 @@ class StateValidator:
                             "isOwnedAccount": {"type": bool}
                         }
                     }
-                }
+                },
+                # accountID -> content hash index used for per-account merges
+                "accountHashes": {"type": dict}
             }
         },
 
@@ -106,6 +108,7 @@ class StateValidator:
                 "incoming_message": {
                     "type": dict,
                     "fields": {
+                        "id": {"type": str},  # Channel message ID when provided
                         "type": {"type": str},
                         "text": {"type": dict}  # Structure varies by type
                     }
@@ -0,0 +1,117 @@
+"""WhatsApp webhook payload parsing
+
+The single parser for inbound Cloud API payloads. The webhook, flow processor
+and messaging service all build their view of a message from parse_value.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from core.messaging.inbound import InboundMessage
+from core.messaging.types import InteractiveType, MessageType
+from decouple import config
+
+# WhatsApp interactive reply types and the InteractiveType they map to
+REPLY_TYPES = {
+    "button_reply": InteractiveType.BUTTON.value,
+    "list_reply": InteractiveType.LIST.value
+}
+
+
+def is_own_number(value: Dict[str, Any], is_mock_testing: bool = False) -> bool:
+    """Whether change value is for our phone number (always, from the mock server)"""
+    if is_mock_testing:
+        return True
+    metadata = value.get("metadata") or {}
+    return isinstance(metadata, dict) and metadata.get("phone_number_id") == config("WHATSAPP_PHONE_NUMBER_ID")
+
+
+def parse_value(value: Dict[str, Any], is_mock_testing: bool = False) -> Optional[InboundMessage]:
+    """Parse change value from webhook payload
+
+    Args:
+        value: entry[0].changes[0].value from the payload
+        is_mock_testing: Whether the request came from the mock server
+
+    Returns:
+        Optional[InboundMessage]: Envelope for a member's message, None for
+        status updates, other phone numbers and payloads without a sender.
+        Unsupported message types give an envelope with no type.
+    """
+    if value.get("messaging_product") != "whatsapp":
+        return None
+
+    metadata = value.get("metadata") or {}
+    if not isinstance(metadata, dict):
+        return None
+    mock_testing = is_mock_testing or bool(metadata.get("mock_testing", False))
+
+    # Only messages for our number, unless from the mock server
+    if not is_own_number(value, is_mock_testing):
+        return None
+
+    # Skip status updates
+    if value.get("statuses"):
+        return None
+
+    # Get contact info
+    contacts = value.get("contacts")
+    if not contacts or not isinstance(contacts, list) or not isinstance(contacts[0], dict):
+        return None
+    channel_id = contacts[0].get("wa_id")
+    if not channel_id:
+        return None
+
+    inbound = InboundMessage("whatsapp", channel_id, mock_testing=mock_testing, received_at=time.time())
+
+    messages = value.get("messages")
+    if not messages or not isinstance(messages, list) or not isinstance(messages[0], dict):
+        return inbound
+    message = messages[0]
+    inbound.message_id = message.get("id") or None
+
+    # Only process member-initiated messages
+    if not message.get("from"):
+        return inbound
+
+    message_type = message.get("type")
+    if message_type == "text":
+        inbound.type = MessageType.TEXT.value
+        inbound.body = (message.get("text") or {}).get("body", "")
+
+    elif message_type == "interactive":
+        interactive = message.get("interactive") or {}
+        reply_type = interactive.get("type")
+        if reply_type in REPLY_TYPES:
+            reply = interactive.get(reply_type) or {}
+            inbound.type = MessageType.INTERACTIVE.value
+            inbound.interactive_type = REPLY_TYPES[reply_type]
+            inbound.reply_id = reply.get("id")
+            inbound.reply_title = reply.get("title")
+            inbound.reply_description = reply.get("description")
+
+    return inbound
+
+
+def parse_payload(payload: Dict[str, Any], is_mock_testing: bool = False) -> Optional[InboundMessage]:
+    """Parse full webhook payload, None if it has no member message
+
+    Raises:
+        ValueError: If payload structure is invalid
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Payload must be an object")
+
+    entry = payload.get("entry")
+    if not entry or not isinstance(entry, list) or not isinstance(entry[0], dict):
+        raise ValueError("Missing entry array")
+
+    changes = entry[0].get("changes")
+    if not changes or not isinstance(changes, list) or not isinstance(changes[0], dict):
+        raise ValueError("Missing changes array")
+
+    value = changes[0].get("value")
+    if not value or not isinstance(value, dict):
+        raise ValueError("Missing value object")
+
+    return parse_value(value, is_mock_testing)
@@ -0,0 +1,171 @@
+"""Compiled WhatsApp payload templates
+
+Most outbound messages reuse a handful of menu structures (confirm buttons,
+dashboard actions, ledger navigation) with only the body text changing. Rather
+than walking and validating every button, section and row on each send, each
+distinct structure is compiled once into a PayloadTemplate:
+- The structure is validated against WhatsApp limits once
+- The payload around the recipient and body is pre-encoded to bytes
+- Sends splice the JSON-encoded recipient and body between the fragments
+
+Templates are cached per structure in each process, and the static confirm and
+welcome menus are compiled at startup (see warm). Anything not covered falls
+back to the general WhatsAppMessage conversion.
+"""
+
+import functools
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from core.messaging.exceptions import MessageValidationError
+from core.messaging.types import Message
+from core.state.interface import StateManagerInterface
+
+from .types import WhatsAppMessage
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CACHE_SIZE = 512
+
+# Payload fragments shared by every message
+_MESSAGE_PREFIX = b'{"messaging_product":"whatsapp","recipient_type":"individual","to":'
+_TEXT_INFIX = b',"type":"text","text":{"body":'
+
+
+def _encode(value: Any) -> bytes:
+    """JSON-encode value compactly"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class PayloadTemplate:
+    """Validated interactive payload with recipient and body spliced in at send time"""
+
+    __slots__ = ("_infix",)
+
+    def __init__(self, structure: Dict[str, Any], encoded: bytes):
+        """Validate structure and pre-encode payload around body
+
+        Args:
+            structure: Interactive object without body
+            encoded: JSON encoding of structure
+
+        Raises:
+            MessageValidationError: If structure exceeds WhatsApp limits
+        """
+        WhatsAppMessage.validate_interactive({**structure, "body": {"text": ""}})
+        fields = encoded[1:-1]
+        self._infix = (
+            b',"type":"interactive","interactive":{'
+            + fields + (b"," if fields else b"")
+            + b'"body":{"text":'
+        )
+
+    def render(self, to: str, body: str) -> bytes:
+        """Render payload for recipient and body"""
+        return _MESSAGE_PREFIX + _encode(to) + self._infix + _encode(body) + b"}}}"
+
+
+_templates: "OrderedDict[bytes, PayloadTemplate]" = OrderedDict()
+_templates_lock = threading.Lock()
+
+
+def get_template(structure: Dict[str, Any]) -> PayloadTemplate:
+    """Get compiled template for interactive structure, compiling on first use
+
+    Raises:
+        MessageValidationError: If structure exceeds WhatsApp limits
+    """
+    encoded = _encode(structure)
+    with _templates_lock:
+        template = _templates.get(encoded)
+        if template is not None:
+            _templates.move_to_end(encoded)
+            return template
+
+    template = PayloadTemplate(structure, encoded)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Compiled payload template ({len(encoded)} bytes)")
+
+    with _templates_lock:
+        _templates[encoded] = template
+        if len(_templates) > TEMPLATE_CACHE_SIZE:
+            _templates.popitem(last=False)
+    return template
+
+
+def encode_text(to: str, body: str) -> Optional[bytes]:
+    """Encode text message, None if body is not sendable as-is"""
+    if not body or len(body) > WhatsAppMessage.LIMITS["text_body"]:
+        return None
+    return _MESSAGE_PREFIX + _encode(to) + _TEXT_INFIX + _encode(body) + b"}}"
+
+
+@functools.lru_cache(maxsize=32)
+def _fixed_text_suffix(body: str) -> bytes:
+    """Get encoded payload after recipient for fixed text"""
+    return _TEXT_INFIX + _encode(body) + b"}}"
+
+
+def encode_fixed_text(to: str, body: str) -> bytes:
+    """Encode fixed text (e.g. a notice), reusing the body's encoding
+
+    Body is trusted to be sendable as-is.
+    """
+    return _MESSAGE_PREFIX + _encode(to) + _fixed_text_suffix(body)
+
+
+def encode_interactive(to: str, interactive: Dict[str, Any]) -> Optional[bytes]:
+    """Encode interactive message from template, None if not sendable as-is"""
+    body = interactive.get("body", {}).get("text", "")
+    if len(body) > WhatsAppMessage.LIMITS["text_body"]:
+        return None
+
+    structure = {key: value for key, value in interactive.items() if key != "body"}
+    try:
+        template = get_template(structure)
+    except MessageValidationError as e:
+        logger.warning(f"Interactive structure failed validation: {str(e)}")
+        return None
+    return template.render(to, body)
+
+
+def encode_message(message: Message, state_manager: Optional[StateManagerInterface] = None) -> bytes:
+    """Encode core message as WhatsApp request body
+
+    Text and interactive messages with a WhatsApp recipient use the compiled
+    path. Everything else, including messages failing validation, goes through
+    WhatsAppMessage.from_core_message so errors are reported the same way.
+    """
+    content = message.content if message else None
+    recipient = message.recipient if message else None
+    if content is not None and recipient is not None and recipient.type == "whatsapp":
+        payload = None
+        content_type = content.type.value
+        if content_type == "text":
+            payload = encode_text(recipient.identifier, content.body)
+        elif content_type == "interactive" and hasattr(content, "to_dict"):
+            payload = encode_interactive(recipient.identifier, content.to_dict()["interactive"])
+        if payload is not None:
+            return payload
+
+    return _encode(WhatsAppMessage.from_core_message(message, state_manager=state_manager))
+
+
+def warm() -> None:
+    """Compile static menu templates"""
+    # Imported here - components are only needed once at startup
+    from core.components.confirm.confirm_offer_secured import CONFIRM_OFFER_BUTTONS
+    from core.components.confirm.confirm_upgrade import UPGRADE_BUTTONS
+    from core.components.input.welcome import WELCOME_BUTTONS
+    from core.messaging.types import InteractiveContent, InteractiveType
+
+    static_menus = (CONFIRM_OFFER_BUTTONS, UPGRADE_BUTTONS, WELCOME_BUTTONS)
+    for buttons in static_menus:
+        content = InteractiveContent(interactive_type=InteractiveType.BUTTON, body=" ", buttons=buttons)
+        interactive = content.to_dict()["interactive"]
+        get_template({key: value for key, value in interactive.items() if key != "body"})
+
+    logger.info(f"Compiled {len(static_menus)} static payload templates")
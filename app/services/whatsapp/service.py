@@ -1,21 +1,26 @@
 """WhatsApp messaging service implementation"""
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
+from core.messaging import concurrency, delivery, rate_limit
 from core.messaging.base import BaseMessagingService
 from core.messaging.exceptions import MessageValidationError
 from core.messaging.types import (Button, InteractiveContent, InteractiveType,
-                                  Message, MessageType, Section, TemplateContent,
+                                  Message, Section, TemplateContent,
                                   TextContent)
 from core.state.interface import StateManagerInterface
 from decouple import config
 
-from .types import WhatsAppMessage
+from .inbound import parse_payload
+from .payloads import encode_message
 
 logger = logging.getLogger(__name__)
 
+MAX_SEND_ATTEMPTS = 3  # sends of a rate limited (429) message
+
 
 class WhatsAppMessagingService(BaseMessagingService):
     """WhatsApp implementation of messaging service"""
@@ -180,8 +185,8 @@ class WhatsAppMessagingService(BaseMessagingService):
     def send_message(self, message: Message) -> Message:
         """Send a message through WhatsApp Cloud API or mock"""
         try:
-            # Convert to WhatsApp format using state if available
-            whatsapp_message = WhatsAppMessage.from_core_message(
+            # Encode request body, compiled templates for text/interactive
+            whatsapp_message = encode_message(
                 message,
                 state_manager=self.state_manager
             )
@@ -210,7 +215,15 @@ class WhatsAppMessagingService(BaseMessagingService):
                 }
             )
 
-    def _handle_mock_send(self, message: Message, whatsapp_message: Dict) -> Message:
+    def send_encoded(self, message: Message, whatsapp_message: bytes) -> Message:
+        """Send message already encoded as WhatsApp request body"""
+        handler = (
+            self._handle_mock_send if self._is_mock_mode(message)
+            else self._handle_production_send
+        )
+        return handler(message, whatsapp_message)
+
+    def _handle_mock_send(self, message: Message, whatsapp_message: bytes) -> Message:
         """Handle mock message sending path"""
         logger.info("Mock mode: sending to mock server")
 
@@ -218,7 +231,7 @@ class WhatsAppMessagingService(BaseMessagingService):
             # Send and wait for response
             response = requests.post(
                 "http://mock:8001/bot/webhook",
-                json=whatsapp_message,
+                data=whatsapp_message,
                 headers={"Content-Type": "application/json"},
                 timeout=10
             )
@@ -272,7 +285,7 @@ class WhatsAppMessagingService(BaseMessagingService):
             }
             return message
 
-    def _handle_production_send(self, message: Message, whatsapp_message: Dict) -> Message:
+    def _handle_production_send(self, message: Message, whatsapp_message: bytes) -> Message:
         """Handle production message sending path"""
         logger.info("Production mode: sending to WhatsApp")
 
@@ -288,13 +301,34 @@ class WhatsAppMessagingService(BaseMessagingService):
         }
 
         try:
-            # Send and wait for response
-            response = requests.post(
-                url,
-                json=whatsapp_message,
-                headers=headers,
-                timeout=10
-            )
+            for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+                # Wait for send slot for this number and recipient
+                rate_limit.acquire(phone_number_id, message.recipient.identifier)
+                slot = concurrency.acquire(phone_number_id)
+
+                # Send and wait for response, feeding outcome back to the limit
+                started = time.monotonic()
+                response = None
+                try:
+                    response = requests.post(
+                        url,
+                        data=whatsapp_message,
+                        headers=headers,
+                        timeout=10
+                    )
+                finally:
+                    concurrency.release(
+                        phone_number_id,
+                        slot,
+                        response.status_code if response is not None else None,
+                        time.monotonic() - started,
+                        response.headers.get("Retry-After") if response is not None else None
+                    )
+
+                # Rate limited - next acquire waits out Retry-After
+                if response.status_code != 429 or attempt == MAX_SEND_ATTEMPTS:
+                    break
+                logger.warning(f"WhatsApp API rate limited, retrying send (attempt {attempt})")
 
             # Track when sent and response
             message.metadata = {
@@ -345,6 +379,10 @@ class WhatsAppMessagingService(BaseMessagingService):
                         }
                     )
 
+                # Track message ID (wamid) so status callbacks can be correlated
+                message.metadata["message_id"] = messages[0]["id"]
+                delivery.record_sent(messages[0]["id"], message.content.type.value)
+
                 return message
 
             except MessageValidationError:
@@ -552,132 +590,22 @@ class WhatsAppMessagingService(BaseMessagingService):
             )
 
         try:
-            # Extract and validate each level
-            entry = payload.get("entry", [])
-            if not entry:
-                raise ValueError("Missing entry array")
-
-            changes = entry[0].get("changes", [])
-            if not changes:
-                raise ValueError("Missing changes array")
-
-            value = changes[0].get("value", {})
-            if not value:
-                raise ValueError("Missing value object")
-
-            # Check if this is a status update
-            if "statuses" in value:
-                return {}
-
-            # Check for messages
-            messages = value.get("messages", [])
-            if not messages:
-                return {}
-
-            message = messages[0]
-            if not message:
-                return {}
-
-            # Only process user-initiated messages
-            if not message.get("from"):
-                return {}
-
-            # Validate this is a WhatsApp message
-            if not value.get("messaging_product") == "whatsapp":
-                raise ValueError("Expected messaging_product 'whatsapp'")
-
-            # Get contact info
-            contacts = value.get("contacts", [])
-            if not contacts:
-                raise ValueError("Missing contacts array")
-
-            contact = contacts[0]
-            if not contact or not isinstance(contact, dict):
-                raise ValueError("Invalid contact object")
-
-            channel_id = contact.get("wa_id")
-            if not channel_id:
-                raise ValueError("Missing WhatsApp ID")
-
-            # Extract message content
-            message_type = message.get("type")
-            if message_type == "text":
-                # Handle text messages
-                text_content = message.get("text", {})
-                return {
-                    "channel": {
-                        "type": "whatsapp",
-                        "identifier": channel_id,
-                        "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                    },
-                    "message": {
-                        "type": MessageType.TEXT.value,
-                        "text": {
-                            "body": text_content.get("body", "")
-                        }
-                    }
-                }
-            elif message_type == "interactive":
-                # Handle interactive messages
-                interactive = message.get("interactive", {})
-                if interactive.get("type") == "button_reply":
-                    button = interactive.get("button_reply", {})
-                    return {
-                        "channel": {
-                            "type": "whatsapp",
-                            "identifier": channel_id,
-                            "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                        },
-                        "message": {
-                            "type": MessageType.INTERACTIVE.value,
-                            "text": {
-                                "interactive_type": InteractiveType.BUTTON.value,
-                                "button": {
-                                    "id": button.get("id"),
-                                    "title": button.get("title"),
-                                    "type": "reply"
-                                }
-                            }
-                        }
-                    }
-                elif interactive.get("type") == "list_reply":
-                    list_reply = interactive.get("list_reply", {})
-                    return {
-                        "channel": {
-                            "type": "whatsapp",
-                            "identifier": channel_id,
-                            "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                        },
-                        "message": {
-                            "type": MessageType.INTERACTIVE.value,
-                            "text": {
-                                "interactive_type": InteractiveType.LIST.value,
-                                "list_reply": {
-                                    "id": list_reply.get("id"),
-                                    "title": list_reply.get("title"),
-                                    "description": list_reply.get("description")
-                                }
-                            }
-                        }
-                    }
-
-            # Unsupported message type
-            return {}
-
-        except (IndexError, KeyError, ValueError) as e:
-            # Get as much info as possible for error context
-            value = payload.get("entry", [{}])[0].get("changes", [{}])[0].get("value", {})
-            messages = value.get("messages", [])
-            message = messages[0] if messages else {}
-
+            inbound = parse_payload(payload)
+        except ValueError as e:
             raise MessageValidationError(
                 message=f"Invalid message payload format: {str(e)}",
                 service="whatsapp",
                 action="extract_message",
                 validation_details={
                     "error": str(e),
-                    "payload": payload,
-                    "value": value,
-                    "message": message
+                    "payload": payload
                 }
             )
+
+        # Empty dict for status updates and unsupported message types
+        if not inbound or not inbound.is_supported:
+            return {}
+        return {
+            "channel": inbound.channel_info(),
+            "message": inbound.to_dict()
+        }
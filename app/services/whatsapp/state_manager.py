@@ -1,8 +1,9 @@
 """WhatsApp state management delegating to core StateManager"""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from core.error.exceptions import SystemException
+from core.messaging.inbound import InboundMessage
 from core.messaging.interface import MessagingServiceInterface
 from core.state.interface import StateManagerInterface
 from core.state.manager import StateManager as CoreStateManager
@@ -301,8 +302,8 @@ class StateManager(StateManagerInterface):  # type: ignore
                 action="get_incoming_message"
             )
 
-    def set_incoming_message(self, message: Dict[str, Any]) -> None:
-        """Set the incoming message with validation"""
+    def set_incoming_message(self, message: Union[InboundMessage, Dict[str, Any]]) -> None:
+        """Set the incoming message for this turn"""
         try:
             self._core.set_incoming_message(message)
         except Exception as e:
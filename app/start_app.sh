@@ -92,11 +92,35 @@ fi
 echo "Applying database migrations..."
 python manage.py migrate --noinput
 
+# In dispatcher mode flow workers run turns forwarded by the web workers
+if [ "${FLOW_DISPATCH:-false}" = "true" ]; then
+    echo "Starting ${FLOW_WORKERS:-4} flow workers..."
+    python manage.py run_flow_workers &
+fi
+
 # Determine environment and set appropriate server command
 if [ "${DJANGO_ENV:-development}" = "production" ]; then
     echo "Starting Gunicorn server in production mode..."
     echo "Workers: ${GUNICORN_WORKERS:-2}"
 
+    if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+        echo "Server mode: asgi (lane threads: ${LANE_THREADS:-64})"
+        # Event loop and lane threads per worker - larger Redis pool than sync workers
+        export REDIS_MAX_CONNECTIONS=${REDIS_MAX_CONNECTIONS:-100}
+        exec gunicorn config.asgi:application \
+            --bind 0.0.0.0:${PORT:-8000} \
+            --workers ${GUNICORN_WORKERS:-2} \
+            --worker-class uvicorn_worker.UvicornWorker \
+            --timeout ${GUNICORN_TIMEOUT:-30} \
+            --graceful-timeout 10 \
+            --keep-alive 5 \
+            --log-level debug \
+            --access-logfile - \
+            --error-logfile - \
+            --capture-output \
+            --enable-stdio-inheritance
+    fi
+
     # Using sync worker with preload for better memory efficiency
     exec gunicorn config.wsgi:application \
         --bind 0.0.0.0:${PORT:-8000} \
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Benchmark webhook handling through Django/DRF and the WSGI fast path
+
+Calls both WSGI applications in-process, one request at a time, so the result
+is requests per second for a single sync worker with network and upstream
+time excluded. Payloads:
+- ignored: message for another phone number ID, acknowledged after parsing
+  and routing without touching Redis
+- status: delivery status callback, appended to the status stream (needs
+  Redis at REDIS_URL)
+
+Usage (from the repository root):
+    python scripts/benchmark_webhook.py [--payload ignored|status] [--requests N]
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+os.chdir(APP_DIR)
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("WHATSAPP_PHONE_NUMBER_ID", "benchmark")
+
+PAYLOADS = {
+    "ignored": {
+        "object": "whatsapp_business_account",
+        "entry": [{
+            "id": "0",
+            "changes": [{
+                "field": "messages",
+                "value": {
+                    "messaging_product": "whatsapp",
+                    "metadata": {"display_phone_number": "0", "phone_number_id": "other"},
+                    "contacts": [{"profile": {"name": "Benchmark"}, "wa_id": "263000000000"}],
+                    "messages": [{
+                        "from": "263000000000",
+                        "id": "wamid.benchmark",
+                        "timestamp": "0",
+                        "type": "text",
+                        "text": {"body": "hi"}
+                    }]
+                }
+            }]
+        }]
+    },
+    "status": {
+        "object": "whatsapp_business_account",
+        "entry": [{
+            "id": "0",
+            "changes": [{
+                "field": "messages",
+                "value": {
+                    "messaging_product": "whatsapp",
+                    "metadata": {"display_phone_number": "0", "phone_number_id": "benchmark"},
+                    "statuses": [{
+                        "id": "wamid.benchmark",
+                        "status": "delivered",
+                        "timestamp": "0",
+                        "recipient_id": "263000000000"
+                    }]
+                }
+            }]
+        }]
+    }
+}
+
+
+def make_environ(body: bytes) -> dict:
+    """Build WSGI environ for webhook POST"""
+    return {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": "/bot/webhook",
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "8000",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "wsgi.version": (1, 0)
+    }
+
+
+def run(application, body: bytes, requests: int) -> float:
+    """Run requests sequentially, returning requests per second"""
+    def start_response(status, headers):
+        if not status.startswith("200"):
+            raise RuntimeError(f"Unexpected response: {status}")
+
+    # Warm up imports and caches
+    for _ in range(min(100, requests)):
+        b"".join(application(make_environ(body), start_response))
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        b"".join(application(make_environ(body), start_response))
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", choices=sorted(PAYLOADS), default="ignored")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    import logging
+
+    from config.wsgi import application, django_application
+
+    # Request logging would dominate the measurement
+    logging.disable(logging.CRITICAL)
+
+    body = json.dumps(PAYLOADS[args.payload]).encode("utf-8")
+    django_rps = run(django_application, body, args.requests)
+    fast_rps = run(application, body, args.requests)
+
+    print(f"Payload: {args.payload} ({len(body)} bytes), {args.requests} requests")
+    print(f"Django/DRF view: {django_rps:10.0f} req/s per worker")
+    print(f"WSGI fast path:  {fast_rps:10.0f} req/s per worker")
+    print(f"Speedup:         {fast_rps / django_rps:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()